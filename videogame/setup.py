@@ -1,11 +1,19 @@
-from setuptools import setup
+from setuptools import setup, find_packages
 
 setup(
     name="shmup",
     version="0.0.1",
-    packages=["shmup"],
-    install_requires=["pygame"],
+    packages=find_packages(include=["shmup", "shmup.*"]),
+    package_data={
+        "shmup.assets": ["config/*.json", "fonts/*.ttf", "images/*.png", "images/*.gif", "sounds/*.mp3"],
+        "shmup.bench": ["scenarios/*.json"]
+    },
+    install_requires=["pygame", "numpy"],
     entry_points={
-        "console_scripts" : "shmup = shmup.__main__:main"
+        "console_scripts" : [
+            "shmup = shmup.__main__:main",
+            "shmup-bench = shmup.bench.__main__:main",
+            "shmup-batch = shmup.batch.__main__:main"
+        ]
     }
-)
\ No newline at end of file
+)
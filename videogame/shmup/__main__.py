@@ -1,12 +1,46 @@
+import argparse
+import os
 import sys
-from shmup.app import App
+
+from shmup.startup_timeline import StartupTimeline
 
 def main(args=None):
+    # Started before the game is imported, so the timeline also shows the import time
+    timeline = StartupTimeline()
     if args is None:
         args = sys.argv[1:]
 
-    app = App()
+    parser = argparse.ArgumentParser(prog="shmup", description="Plays the game, optionally recording or replaying a session.")
+    replay = parser.add_mutually_exclusive_group()
+    replay.add_argument("--record", metavar="FILE", help="record the input and seed of the session to FILE")
+    replay.add_argument("--replay", metavar="FILE", help="play back the session recorded in FILE")
+    parser.add_argument("--seed", type=int, help="seed of the session, drawn from the system by default")
+    parser.add_argument("--headless", action="store_true", help="run without a window, sound or frame cap")
+    parser.add_argument("--startup-profile", action="store_true", help="print where the launch time goes once the first frame is shown")
+    options = parser.parse_args(args)
+
+    if options.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    with timeline.span("imports"):
+        from shmup.app import App
+        from shmup.random_streams import RandomStreams
+        from shmup.replay import ReplayPlayer, ReplayRecorder
+
+    streams = RandomStreams.get_instance()
+    player = None
+    recorder = None
+    if options.replay:
+        player = ReplayPlayer(options.replay)
+        streams.reseed(player.seed)
+    else:
+        streams.reseed(options.seed)
+        if options.record:
+            recorder = ReplayRecorder(options.record, streams.seed)
+
+    app = App(recorder, player, options.headless, timeline if options.startup_profile else None)
     app.run()
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
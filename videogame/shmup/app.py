@@ -1,85 +1,262 @@
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
 import pygame
-from moviepy.editor import VideoFileClip
 from shmup.states.statemanager import StateManager
-from shmup.config import cfg_item
+from shmup.states.intro import Intro
+from shmup.video_background import VideoBackgroundFactory
+from shmup.static_background import StaticBackground
+from shmup.profiler import Profiler
+from shmup.timing_overlay import TimingOverlay
+from shmup.assets.asset_manager import AssetManager
+from shmup.assets.flipbook import FlipBook
+from shmup.assets.text_cache import TextCache
+from shmup.startup_timeline import NullStartupTimeline
+from shmup.config import cfg, cfg_item
+
+logger = logging.getLogger(__name__)
 
 class App:
-    def __init__(self):
+    def __init__(self, recorder=None, player=None, headless=False, startup_timeline=None):
         """
         Initializes the application, sets up the display, loads the background video and music, and initializes the state manager.
+
+        The background, the audio and the fonts of the menu do not depend on each other, so they
+        are set up concurrently once the display exists.
+
+        Args:
+            recorder (ReplayRecorder): Recorder the frames of the session are written to, None to not record.
+            player (ReplayPlayer): Replay whose frames are played instead of the clock and input, None to play live.
+            headless (bool): Whether the display is the dummy video driver: there is no music and no frame cap.
+            startup_timeline (StartupTimeline): Timeline the steps of the launch are recorded in and printed
+                from once the first frame is shown, None to not profile the launch.
         """
-        pygame.init()
-        self.__screen = pygame.display.set_mode(cfg_item("game", "screen_size"), pygame.RESIZABLE, 32)
-        pygame.display.set_caption("My Super Videogame!!!")
-        pygame.mouse.set_visible(False)
+        self.__startup_timeline = startup_timeline if startup_timeline else NullStartupTimeline()
+        timeline = self.__startup_timeline
+
+        with timeline.span("display"):
+            pygame.display.init()
+            pygame.font.init()
+            self.__screen = pygame.display.set_mode(cfg_item("game", "screen_size"), pygame.RESIZABLE, 32)
+            pygame.display.set_caption("My Super Videogame!!!")
+            pygame.mouse.set_visible(False)
+
+        self.__recorder = recorder
+        self.__player = player
+        self.__headless = headless
         
-        video_path = cfg_item("game", "background_video")
-        self.__video = VideoFileClip(video_path)
-        self.__video_iterator = iter(self.__video.iter_frames(fps=30, with_times=False))
+        # With a static background only the areas that change are repainted and pushed to the display
+        self.__dirty_rendering = cfg_item("game", "background_mode") == "static"
+        self.__dirty_rects = None  # Areas drawn in the previous frame, None to repaint everything
+        self.__overlay_rect = None  # Area drawn by the timing overlay in the previous frame
 
-        pygame.mixer.init()
-        self.__load_music(cfg_item("game", "background_music"))
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="startup") as pool:
+            background = pool.submit(self.__create_background)
+            audio = pool.submit(self.__init_audio)
+            fonts = pool.submit(self.__load_fonts)
+            self.__background = background.result()
+            audio.result()
+            fonts.result()
 
         self.__clock = pygame.time.Clock()
-        self.__state_manager = StateManager()
+        self.__accumulator = 0  # Time not simulated yet, less than one step after every update
+        with timeline.span("state manager"):
+            self.__state_manager = StateManager()
+
+        # Every phase of the frame is timed so the overlay (F3) and the CSV export (F4) can show where the time goes
+        self.__profiler = Profiler(cfg_item("game", "timing_overlay", "window"))
+        self.__state_manager.set_profiler(self.__profiler)
+        self.__timing_overlay = TimingOverlay(self.__profiler)
 
     def run(self):
         """
         Starts the main application loop.
         """
         self.__running = True
+        frames = self.__player.frames() if self.__player else None
+        first_frame = True
 
         while self.__running:
-            delta_time = self.__clock.tick(60)
-            self.__process_events()
-            self.__update(delta_time)
-            self.__render()
+            delta_time = self.__clock.tick(0 if self.__headless else cfg().game.fps)
+            with self.__profiler.phase("frame"):
+                with self.__profiler.phase("events"):
+                    events = pygame.event.get()
+                    if frames is not None:
+                        # The replayed frame takes the place of the clock and the input, only quitting is live
+                        if any(event.type == pygame.QUIT for event in events):
+                            break
+                        frame = next(frames, None)
+                        if frame is None:
+                            break
+                        delta_time, events = frame
+                    if self.__recorder:
+                        self.__recorder.record(delta_time, events)
+                    self.__process_events(events)
+
+                alpha = self.__update(delta_time)
+                self.__render(alpha)
+
+            if first_frame:
+                # The launch ends with the first frame shown, only then the assets of the game
+                # are loaded in the background while the menu waits for the player
+                self.__startup_timeline.finish("first frame")
+                self.__startup_timeline = NullStartupTimeline()
+                self.__state_manager.prefetch()
+                first_frame = False
 
         self.__release()
 
-    def __process_events(self):
+    def __process_events(self, events):
         """
-        Processes all events from the event queue.
+        Processes the events of the frame.
+
+        Args:
+            events (list of pygame.event.Event): The events from the event queue or the replay.
         """
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT or self.__state_manager.get_state().next_state == "Exit":
                 self.__running = False
+            elif event.type in (pygame.VIDEORESIZE, pygame.VIDEOEXPOSE):
+                self.__dirty_rects = None
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.__running = False
+                elif event.key == pygame.K_F3:
+                    self.__timing_overlay.toggle()
+                elif event.key == pygame.K_F4:
+                    self.__export_timings()
             self.__state_manager.process_events(event)
 
     def __update(self, delta_time):
         """
-        Updates the current state.
+        Updates the current state in fixed simulation steps of 1 / game.simulation_rate seconds,
+        as many as fit in the time accumulated. After a long frame at most game.max_catch_up_steps
+        steps are taken and the rest of the time is dropped, so the game slows down instead of
+        falling further behind.
 
         Args:
             delta_time (float): The time elapsed since the last update.
+
+        Returns:
+            float: The fraction of a step left in the accumulator, to interpolate the rendering.
+        """
+        game = cfg().game
+        step_time = 1000 / game.simulation_rate
+        self.__accumulator += delta_time
+
+        with self.__profiler.phase("update"):
+            steps = 0
+            while self.__accumulator >= step_time and steps < game.max_catch_up_steps:
+                self.__state_manager.update(step_time)
+                self.__accumulator -= step_time
+                steps += 1
+        if self.__accumulator >= step_time:
+            self.__accumulator %= step_time
+
+        # The entities are only counted while the overlay shows them
+        if self.__timing_overlay.visible:
+            self.__timing_overlay.update(delta_time, self.__state_manager.get_state().entity_counts())
+        return self.__accumulator / step_time
+
+    def __render(self, alpha):
         """
-        self.__state_manager.update(delta_time)
+        Renders the current state and the background.
 
-    def __render(self):
+        Args:
+            alpha (float): The fraction of the simulation step elapsed since the last update.
         """
-        Renders the current state and the video background.
+        if self.__dirty_rendering:
+            self.__render_dirty(alpha)
+            return
+
+        with self.__profiler.phase("background"):
+            self.__play_video_background()
+        with self.__profiler.phase("render"):
+            self.__state_manager.render(self.__screen, alpha)
+        self.__timing_overlay.render(self.__screen)
+        with self.__profiler.phase("display_update"):
+            pygame.display.update()
+
+    def __render_dirty(self, alpha):
         """
-        self.__play_video_background()
-        self.__state_manager.render(self.__screen)
-        pygame.display.update()
+        Renders the current state over the static background, updating only the areas of the
+        display that changed. The areas drawn in the previous frame are restored from the
+        background and everything is drawn again, but of the sprites that kept their image and
+        rect nothing is pushed: only the previous and current areas of what changed.
+
+        Args:
+            alpha (float): The fraction of the simulation step elapsed since the last update.
+        """
+        previous_rects = self.__dirty_rects
+        with self.__profiler.phase("background"):
+            if previous_rects is None:
+                self.__background.render(self.__screen)
+            else:
+                self.__background.restore(self.__screen, previous_rects)
+
+        with self.__profiler.phase("render"):
+            rects = self.__state_manager.render(self.__screen, alpha)
+
+        overlay_rect = self.__timing_overlay.render(self.__screen)
+        if rects is not None and overlay_rect is not None:
+            rects.append(overlay_rect)
+
+        with self.__profiler.phase("display_update"):
+            if rects is None or previous_rects is None:
+                pygame.display.update()
+            else:
+                changed_rects = self.__state_manager.changed_rects()
+                if changed_rects is None:
+                    pygame.display.update(previous_rects + rects)
+                else:
+                    # The overlay is redrawn on every refresh, its areas are pushed while it shows
+                    changed_rects += (rect for rect in (self.__overlay_rect, overlay_rect) if rect is not None)
+                    pygame.display.update(changed_rects)
+        self.__dirty_rects = rects
+        self.__overlay_rect = overlay_rect
         
     def __play_video_background(self):
         """
         Plays the video background frame by frame.
         """
-        try:
-            frame = next(self.__video_iterator)
-            frame_surface = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
-            self.__screen.blit(frame_surface, (0, 0))
-        except StopIteration:
-            self.__video_iterator = iter(self.__video.iter_frames(fps=30, with_times=False))
-            frame = next(self.__video_iterator)
-            frame_surface = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
-            self.__screen.blit(frame_surface, (0, 0))
+        self.__background.render(self.__screen)
             
+    def __export_timings(self):
+        """
+        Writes the samples of the timed phases to the CSV file of the configuration.
+        """
+        csv_file = cfg_item("game", "timing_overlay", "csv_file")
+        self.__profiler.export_csv(csv_file)
+        logger.info("Frame timings written to %s", csv_file)
+
+    def __create_background(self):
+        """
+        Creates the background selected in the configuration: a static image or colour, or a video.
+
+        Returns:
+            StaticBackground or VideoBackground or CachedVideoBackground: The background.
+        """
+        with self.__startup_timeline.span("background"):
+            if self.__dirty_rendering:
+                return StaticBackground(cfg_item("game", "screen_size"), cfg_item("game", "background_image"), cfg_item("game", "background_color"))
+            return VideoBackgroundFactory.create_video_background(cfg_item("game", "background_video"))
+
+    def __init_audio(self):
+        """
+        Initializes the mixer and starts the background music, which is skipped when headless.
+        """
+        with self.__startup_timeline.span("audio"):
+            pygame.mixer.init()
+            if not self.__headless:
+                self.__load_music(cfg_item("game", "background_music"))
+
+    def __load_fonts(self):
+        """
+        Loads the fonts of the menu and the timing overlay.
+        """
+        with self.__startup_timeline.span("fonts"):
+            AssetManager.get_instance().preload(fonts=Intro.assets()["fonts"] + [TimingOverlay.FONT])
+
     def __load_music(self, music_file):
         """
         Loads and plays background music.
@@ -96,5 +273,11 @@ class App:
         Releases resources and quits the application.
         """
         self.__state_manager.release()
-        self.__video.close()  # Close the video
+        self.__background.release()  # Close the video
+        if self.__recorder:
+            self.__recorder.close()
+        # Fonts and surfaces cached across the game do not survive pygame.quit()
+        AssetManager.get_instance().clear()
+        TextCache.get_instance().clear()
+        FlipBook.clear()
         pygame.quit()
\ No newline at end of file
@@ -0,0 +1,268 @@
+from importlib import resources
+import os
+import threading
+
+import pygame
+
+class AssetManager:
+    """
+    Singleton class that loads, converts and caches the images, masks, sounds and fonts of the game.
+
+    Assets are identified by their resource, a (package, file name) pair such as the image_file
+    entries of the configuration, plus a transform for images. A transform is a tuple of steps
+    applied in order after the image is converted to the display format:
+    ("scale", (width, height)), ("rotate", angle) or ("flip", (flip_x, flip_y)). Every
+    (resource, transform) pair is loaded exactly once and shared by everything that asks for it,
+    even when several threads ask for it at once, as the startup and prefetch workers do.
+
+    Methods
+    -------
+    get_instance():
+        Returns the singleton instance of the AssetManager class.
+    image(resource, transform=()):
+        Returns the image converted to the display format and transformed.
+    mask(resource, transform=()):
+        Returns the collision mask of the image.
+    sound(resource):
+        Returns the sound, None if the mixer is not initialized.
+    font(resource, size):
+        Returns the font at the given size.
+    preload(images=(), masks=(), sounds=(), fonts=()):
+        Loads many assets at once.
+    memory_report():
+        Returns the memory held by every cached asset.
+    clear():
+        Drops every cached asset.
+    """
+
+    __instance = None
+    __instance_lock = threading.Lock()
+
+    @staticmethod
+    def get_instance():
+        """
+        Returns the singleton instance of the AssetManager class. If the instance does not exist, it is created.
+
+        Returns:
+            AssetManager: The singleton instance of the AssetManager class.
+        """
+        if AssetManager.__instance is None:
+            with AssetManager.__instance_lock:
+                # Checked again, another thread may have created it while this one waited
+                if AssetManager.__instance is None:
+                    AssetManager()
+        return AssetManager.__instance
+
+    def __init__(self):
+        """
+        Initializes the AssetManager with empty caches. Ensures only one instance of the class exists.
+        """
+        if AssetManager.__instance is None:
+            self.__images = {}
+            self.__masks = {}
+            self.__sounds = {}
+            self.__fonts = {}
+            self.__font_file_sizes = {}
+            # Held from the cache miss to the store, so an asset is never loaded twice. Reentrant
+            # because a mask loads its image.
+            self.__lock = threading.RLock()
+            AssetManager.__instance = self
+        else:
+            raise Exception("There Can Be Only One AssetManager!!!")
+
+    def image(self, resource, transform=()):
+        """
+        Returns the image converted to the display format, with per-pixel alpha, and transformed.
+        Requires the display mode to be set.
+
+        Args:
+            resource (tuple): The package and file name of the image.
+            transform (tuple): The transform steps applied to the image.
+
+        Returns:
+            pygame.Surface: The shared image. Callers must not draw on it.
+
+        Raises:
+            ValueError: If a transform step is unknown.
+        """
+        key = (tuple(resource), transform)
+        image = self.__images.get(key)
+        if image is None:
+            with self.__lock:
+                # Another thread may have loaded it while this one waited for the lock
+                image = self.__images.get(key)
+                if image is None:
+                    with AssetManager.__path(resource) as path:
+                        image = pygame.image.load(path).convert_alpha()
+                    for step, argument in transform:
+                        image = AssetManager.__transform(image, step, argument)
+                    self.__images[key] = image
+        return image
+
+    def mask(self, resource, transform=()):
+        """
+        Returns the collision mask of the image.
+
+        Args:
+            resource (tuple): The package and file name of the image.
+            transform (tuple): The transform steps applied to the image.
+
+        Returns:
+            pygame.mask.Mask: The shared mask of the transformed image.
+        """
+        key = (tuple(resource), transform)
+        mask = self.__masks.get(key)
+        if mask is None:
+            with self.__lock:
+                mask = self.__masks.get(key)
+                if mask is None:
+                    mask = pygame.mask.from_surface(self.image(resource, transform))
+                    self.__masks[key] = mask
+        return mask
+
+    def sound(self, resource):
+        """
+        Returns the sound. Sounds are optional so the game can run headless without a mixer.
+
+        Args:
+            resource (tuple): The package and file name of the sound.
+
+        Returns:
+            pygame.mixer.Sound: The shared sound, None if the mixer is not initialized.
+        """
+        if not pygame.mixer.get_init():
+            return None
+
+        key = tuple(resource)
+        sound = self.__sounds.get(key)
+        if sound is None:
+            with self.__lock:
+                sound = self.__sounds.get(key)
+                if sound is None:
+                    with AssetManager.__path(resource) as path:
+                        sound = pygame.mixer.Sound(path)
+                    self.__sounds[key] = sound
+        return sound
+
+    def font(self, resource, size):
+        """
+        Returns the font at the given size.
+
+        Args:
+            resource (tuple): The package and file name of the font.
+            size (int): The size of the font.
+
+        Returns:
+            pygame.font.Font: The shared font.
+        """
+        key = (tuple(resource), size)
+        font = self.__fonts.get(key)
+        if font is None:
+            with self.__lock:
+                font = self.__fonts.get(key)
+                if font is None:
+                    with AssetManager.__path(resource) as path:
+                        font = pygame.font.Font(path, size)
+                        self.__font_file_sizes[key] = os.path.getsize(path)
+                    self.__fonts[key] = font
+        return font
+
+    def preload(self, images=(), masks=(), sounds=(), fonts=()):
+        """
+        Loads many assets at once, so that creating the entities that use them loads nothing.
+
+        Args:
+            images (iterable): (resource, transform) pairs of images.
+            masks (iterable): (resource, transform) pairs of collision masks.
+            sounds (iterable): Resources of sounds.
+            fonts (iterable): (resource, size) pairs of fonts.
+        """
+        for resource, transform in images:
+            self.image(resource, transform)
+        for resource, transform in masks:
+            self.mask(resource, transform)
+        for resource in sounds:
+            self.sound(resource)
+        for resource, size in fonts:
+            self.font(resource, size)
+
+    def memory_report(self):
+        """
+        Returns the memory held by every cached asset, largest first. Images count their pixels,
+        masks their bits, sounds their decoded samples and fonts the size of their file.
+
+        Returns:
+            list of tuple: (kind, key, bytes) for every cached asset.
+        """
+        with self.__lock:
+            images = list(self.__images.items())
+            masks = list(self.__masks.items())
+            sounds = list(self.__sounds.items())
+            fonts = [(key, self.__font_file_sizes[key]) for key in self.__fonts]
+
+        report = []
+        for key, image in images:
+            report.append(("image", key, image.get_pitch() * image.get_height()))
+        for key, mask in masks:
+            width, height = mask.get_size()
+            report.append(("mask", key, (width * height + 7) // 8))
+        mixer = pygame.mixer.get_init()
+        if mixer:
+            frequency, sample_format, channels = mixer
+            for key, sound in sounds:
+                samples = int(sound.get_length() * frequency)
+                report.append(("sound", key, samples * channels * (abs(sample_format) // 8)))
+        for key, size in fonts:
+            report.append(("font", key, size))
+        report.sort(key=lambda entry: entry[2], reverse=True)
+        return report
+
+    def clear(self):
+        """
+        Drops every cached asset.
+        """
+        with self.__lock:
+            self.__images.clear()
+            self.__masks.clear()
+            self.__sounds.clear()
+            self.__fonts.clear()
+            self.__font_file_sizes.clear()
+
+    @staticmethod
+    def __path(resource):
+        """
+        Returns a context manager that provides a file system path to the resource.
+
+        Args:
+            resource (tuple): The package and file name of the resource.
+
+        Returns:
+            contextlib.AbstractContextManager: Context manager yielding the path.
+        """
+        package, name = resource
+        return resources.as_file(resources.files(package).joinpath(name))
+
+    @staticmethod
+    def __transform(image, step, argument):
+        """
+        Applies one transform step to an image.
+
+        Args:
+            image (pygame.Surface): The image to transform.
+            step (str): The name of the step: "scale", "rotate" or "flip".
+            argument: The size, angle or flip axes of the step.
+
+        Returns:
+            pygame.Surface: The transformed image.
+
+        Raises:
+            ValueError: If the step is unknown.
+        """
+        if step == "scale":
+            return pygame.transform.scale(image, argument)
+        elif step == "rotate":
+            return pygame.transform.rotate(image, argument)
+        elif step == "flip":
+            return pygame.transform.flip(image, *argument)
+        else:
+            raise ValueError(f"Invalid image transform: {step}")
@@ -1,20 +1,99 @@
 import pygame
 
+from shmup.assets.asset_manager import AssetManager
+
 class FlipBook:
+    """
+    Animation frames sliced from a sprite sheet.
+
+    The sheet is sliced once into subsurfaces that share its pixels, and FlipBook.get keeps one
+    FlipBook per sheet, so every animation of a sheet shares the same frames and drawing a frame
+    is a plain blit with no source rect.
+
+    Methods
+    -------
+    get(resource, rows, cols):
+        Returns the shared FlipBook of a sprite sheet.
+    clear():
+        Drops every shared FlipBook.
+    render(surface_dst, pos, sequence=0):
+        Blits a frame on the given surface.
+    """
+
+    __registry = {}
 
-    def __init__(self, image_file, rows, cols):
-        self.__image = pygame.image.load(image_file).convert_alpha()
+    def __init__(self, image, rows, cols):
+        """
+        Slices the sprite sheet into frames, row by row.
+
+        Args:
+            image (pygame.Surface): The sprite sheet.
+            rows (int): Number of rows of frames in the sheet.
+            cols (int): Number of columns of frames in the sheet.
+        """
+        self.__image = image
         self.__sequence = []
 
-        rect_width = self.__image.get_width() / cols
-        rect_height = self.__image.get_height() / rows
+        rect_width = self.__image.get_width() // cols
+        rect_height = self.__image.get_height() // rows
 
         for row in range(rows):
             y = row * rect_height
             for col in range(cols):
                 x = col * rect_width
-                self.__sequence.append(pygame.Rect(x, y, rect_width, rect_height))
+                self.__sequence.append(self.__image.subsurface(pygame.Rect(x, y, rect_width, rect_height)))
+
+    def __len__(self):
+        return len(self.__sequence)
+
+    @staticmethod
+    def get(resource, rows, cols):
+        """
+        Returns the shared FlipBook of a sprite sheet, slicing it the first time.
+
+        Args:
+            resource (tuple): The package and file name of the sprite sheet.
+            rows (int): Number of rows of frames in the sheet.
+            cols (int): Number of columns of frames in the sheet.
+
+        Returns:
+            FlipBook: The FlipBook of the sheet.
+        """
+        key = (tuple(resource), rows, cols)
+        flipbook = FlipBook.__registry.get(key)
+        if flipbook is None:
+            flipbook = FlipBook(AssetManager.get_instance().image(resource), rows, cols)
+            FlipBook.__registry[key] = flipbook
+        return flipbook
+
+    @staticmethod
+    def clear():
+        """
+        Drops every shared FlipBook, whose frames must not outlive the pygame session of their sheet.
+        """
+        FlipBook.__registry.clear()
+
+    @property
+    def frames(self):
+        """
+        Returns the frames of the animation.
+
+        Returns:
+            list of pygame.Surface: The frames, in animation order.
+        """
+        return self.__sequence
 
     def render(self, surface_dst, pos, sequence = 0):
-        if sequence <= len(self.__sequence):
-            surface_dst.blit(self.__image, pos, self.__sequence[sequence])
\ No newline at end of file
+        """
+        Blits a frame on the given surface.
+
+        Args:
+            surface_dst (pygame.Surface): The surface to render the frame on.
+            pos (tuple): The position of the frame.
+            sequence (int): The index of the frame.
+
+        Returns:
+            pygame.Rect: The area of the surface drawn, None if the frame does not exist.
+        """
+        if sequence < len(self.__sequence):
+            return surface_dst.blit(self.__sequence[sequence], pos)
@@ -0,0 +1,97 @@
+from collections import OrderedDict
+import threading
+
+from shmup.config import cfg
+
+class TextCache:
+    """
+    Singleton class that keeps the surfaces of rendered text, so the same text is rasterized once.
+
+    Surfaces are keyed by (font, text, color, antialias) and evicted least recently used first
+    when there are more than game.text_cache_size of them. Menus and HUD text change rarely, so
+    almost every frame is served from the cache.
+
+    Methods
+    -------
+    get_instance():
+        Returns the singleton instance of the TextCache class.
+    render(font, text, color, antialias=True):
+        Returns the surface of the rendered text.
+    stats():
+        Returns the hits, misses and size of the cache.
+    clear():
+        Drops every cached surface.
+    """
+
+    __instance = None
+    __instance_lock = threading.Lock()
+
+    @staticmethod
+    def get_instance():
+        """
+        Returns the singleton instance of the TextCache class. If the instance does not exist, it is created.
+
+        Returns:
+            TextCache: The singleton instance of the TextCache class.
+        """
+        if TextCache.__instance is None:
+            with TextCache.__instance_lock:
+                if TextCache.__instance is None:
+                    TextCache()
+        return TextCache.__instance
+
+    def __init__(self):
+        """
+        Initializes the TextCache empty. Ensures only one instance of the class exists.
+        """
+        if TextCache.__instance is None:
+            self.__surfaces = OrderedDict()
+            self.__hits = 0
+            self.__misses = 0
+            TextCache.__instance = self
+        else:
+            raise Exception("There Can Be Only One TextCache!!!")
+
+    def render(self, font, text, color, antialias=True):
+        """
+        Returns the surface of the rendered text, rendering it only if it is not cached.
+
+        Args:
+            font (pygame.font.Font): The font to render the text with.
+            text (str): The text to render.
+            color (tuple): The color of the text.
+            antialias (bool): Whether the text is antialiased.
+
+        Returns:
+            pygame.Surface: The shared surface of the text. Callers must not draw on it.
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self.__surfaces.get(key)
+        if surface is not None:
+            self.__hits += 1
+            self.__surfaces.move_to_end(key)
+            return surface
+
+        self.__misses += 1
+        surface = font.render(text, antialias, color)
+        self.__surfaces[key] = surface
+        if len(self.__surfaces) > cfg().game.text_cache_size:
+            self.__surfaces.popitem(last=False)
+        return surface
+
+    def stats(self):
+        """
+        Returns the hits, misses and size of the cache.
+
+        Returns:
+            dict: The number of hits, misses and cached surfaces.
+        """
+        return {"hits": self.__hits, "misses": self.__misses, "size": len(self.__surfaces)}
+
+    def clear(self):
+        """
+        Drops every cached surface.
+        """
+        self.__surfaces.clear()
+        self.__hits = 0
+        self.__misses = 0
@@ -0,0 +1,61 @@
+import argparse
+import json
+import sys
+
+from shmup.batch.runner import run_batch, aggregate
+
+def parse_override(text):
+    """
+    Parses a KEY=VALUE override, the value being JSON or, failing that, a plain string.
+
+    Args:
+        text (str): The override, e.g. "entities.boss.health=50".
+
+    Returns:
+        tuple: The dotted key path and the value.
+    """
+    key, _, value = text.partition("=")
+    try:
+        return key, json.loads(value)
+    except json.JSONDecodeError:
+        return key, value
+
+def main(args=None):
+    if args is None:
+        args = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(prog="shmup-batch", description="Plays many headless games with a scripted hero in parallel and reports balance and cost metrics.")
+    parser.add_argument("--runs", type=int, default=100, help="games per configuration")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game, the next games use the following seeds")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE", help="config override applied to every game, e.g. entities.boss.health=50")
+    parser.add_argument("--sweep", metavar="KEY=V1,V2,...", help="config key to sweep, one configuration per value")
+    parser.add_argument("--max-ticks", type=int, default=36000, help="ticks after which a surviving game stops")
+    parser.add_argument("--delta", type=float, default=1000 / 60, help="milliseconds simulated per tick")
+    parser.add_argument("--workers", type=int, help="worker processes, one per CPU core by default")
+    parser.add_argument("--output", default="batch_results.json", help="where to write the report")
+    options = parser.parse_args(args)
+
+    overrides = dict(parse_override(text) for text in options.set)
+    configurations = [overrides]
+    if options.sweep:
+        key, _, values = options.sweep.partition("=")
+        configurations = [dict(overrides, **dict([parse_override(f"{key}={value}")])) for value in values.split(",")]
+
+    jobs = [{"seed": options.seed + run, "overrides": configuration,
+             "max_ticks": options.max_ticks, "delta_time": options.delta}
+            for configuration in configurations for run in range(options.runs)]
+    print(f"Playing {len(jobs)} games")
+    report = aggregate(run_batch(jobs, options.workers))
+
+    for line in report:
+        print(f"{json.dumps(line['overrides'])}: {line['runs']} runs")
+        print(f"    survival   rate {line['survival_rate']:6.1%}   p50 {line['survival_time_p50'] / 1000:8.1f} s   mean {line['survival_time_mean'] / 1000:8.1f} s")
+        print(f"    kills      mean {line['kills_mean']:8.1f}   boss kills {line['boss_kills']}   time to kill p50 {line['boss_kill_time_p50'] / 1000:6.1f} s")
+        if line["tick_ms_mean"] is not None:
+            print(f"    tick cost  mean {line['tick_ms_mean']:8.3f} ms   p95 {line['tick_ms_p95']:8.3f} ms")
+
+    with open(options.output, "w") as file:
+        json.dump({"games": len(jobs), "configurations": report}, file, indent=4)
+
+if __name__ == "__main__":
+    sys.exit(main())
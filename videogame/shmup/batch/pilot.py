@@ -0,0 +1,74 @@
+import pygame
+
+class ScriptedPilot:
+    """
+    Plays the hero with a fixed policy instead of a keyboard.
+
+    The hero moves under the closest enemy, or under the centre of the boss, and fires every
+    tick, its cool down limiting the rate of fire. The policy reads only the state of the game,
+    so a run is as deterministic as the simulation it plays.
+
+    Methods
+    -------
+    act(gameplay):
+        Returns the input events for the current tick.
+    """
+
+    def __init__(self, dead_zone=8):
+        """
+        Initializes the pilot with no key pressed.
+
+        Args:
+            dead_zone (float): Horizontal distance in pixels to the target within which the hero stops.
+        """
+        self.__dead_zone = dead_zone
+        self.__pressed = set()
+
+    def act(self, gameplay):
+        """
+        Returns the KEYDOWN and KEYUP events that steer the hero towards its target and fire.
+
+        Args:
+            gameplay (GamePlay): The gameplay state the hero plays in.
+
+        Returns:
+            list of pygame.event.Event: The input events for the current tick.
+        """
+        hero = gameplay.hero
+        if hero is None:
+            return []
+
+        target = ScriptedPilot.__target(gameplay)
+        offset = 0 if target is None else target - (hero.pos.x + hero.image.get_width() / 2)
+        wanted = set()
+        if offset < -self.__dead_zone:
+            wanted.add(pygame.K_LEFT)
+        elif offset > self.__dead_zone:
+            wanted.add(pygame.K_RIGHT)
+
+        events = [pygame.event.Event(pygame.KEYUP, key=key) for key in self.__pressed - wanted]
+        events += [pygame.event.Event(pygame.KEYDOWN, key=key) for key in wanted - self.__pressed]
+        events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        self.__pressed = wanted
+        return events
+
+    @staticmethod
+    def __target(gameplay):
+        """
+        Returns the horizontal position the hero should be under.
+
+        Args:
+            gameplay (GamePlay): The gameplay state.
+
+        Returns:
+            float: The x coordinate of the target, None if there is nothing to shoot at.
+        """
+        boss = gameplay.boss
+        if boss is not None:
+            return boss.pos.x + boss.image.get_width() / 2
+
+        enemies = gameplay.enemies
+        if not enemies:
+            return None
+        closest = max(enemies, key=lambda enemy: enemy.pos.y)
+        return closest.pos.x + closest.image.get_width() / 2
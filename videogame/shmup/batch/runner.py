@@ -0,0 +1,119 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from shmup.batch.pilot import ScriptedPilot
+from shmup.config import Config
+from shmup.profiler import Profiler, percentile
+from shmup.simulation import Simulation
+
+def run_game(job):
+    """
+    Plays one headless game with a scripted hero until the hero is killed or time runs out.
+
+    The configuration is reloaded and the overrides of the job applied first, so jobs run in the
+    same worker process do not see each other's overrides.
+
+    Args:
+        job (dict): The seed, overrides (dotted key path to value), max_ticks and delta_time of the game.
+
+    Returns:
+        dict: The job, the survival time, whether the hero survived, the kills, the boss kills
+            and times to kill in milliseconds, the ticks, and the mean and p95 milliseconds
+            spent per tick, None if the game never ticked.
+    """
+    Config.reload()
+    Config.override(job["overrides"])
+
+    profiler = Profiler()
+    pilot = ScriptedPilot()
+    delta_time = job["delta_time"]
+    boss_spawned_at = None
+    boss_kill_times = []
+
+    simulation = Simulation(job["seed"], delta_time, False, profiler)
+    gameplay = simulation.gameplay
+    while simulation.ticks < job["max_ticks"] and not simulation.done:
+        for event in pilot.act(gameplay):
+            simulation.handle_input(event)
+        simulation.step()
+
+        now = simulation.ticks * delta_time
+        if gameplay.boss is not None and boss_spawned_at is None:
+            boss_spawned_at = now
+        elif gameplay.boss is None and boss_spawned_at is not None:
+            if not simulation.done:
+                boss_kill_times.append(now - boss_spawned_at)
+            boss_spawned_at = None
+
+    update = profiler.summary().get("update")
+    result = {
+        "job": job,
+        "survival_time": simulation.ticks * delta_time,
+        "survived": not simulation.done,
+        "kills": gameplay.kills,
+        "boss_kills": len(boss_kill_times),
+        "boss_kill_times": boss_kill_times,
+        "ticks": simulation.ticks,
+        "tick_ms_mean": update["mean"] if update else None,
+        "tick_ms_p95": update["p95"] if update else None
+    }
+    simulation.release()
+    return result
+
+def run_batch(jobs, workers=None):
+    """
+    Plays the games of the jobs in parallel, one headless game per worker process at a time.
+
+    Args:
+        jobs (list of dict): The jobs, see run_game.
+        workers (int): Number of worker processes, None for one per CPU core.
+
+    Returns:
+        list of dict: The result of every job, in the order of the jobs.
+    """
+    # Workers inherit the environment, and with it the dummy audio driver
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    workers = workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_game, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+def aggregate(results):
+    """
+    Aggregates the results of the games by their overrides, so every configuration of a sweep
+    gets one line of the report.
+
+    Args:
+        results (list of dict): The results of run_batch.
+
+    Returns:
+        list of dict: Per configuration, the overrides, runs, survival rate, survival time p50
+            and mean, kills mean, boss kills, boss time to kill p50 and mean, ms per tick
+            mean and the median of the p95 ms per tick of the games, all times in milliseconds.
+            The ms per tick leave out the games that never ticked, and are None if none did.
+    """
+    groups = {}
+    for result in results:
+        key = json.dumps(result["job"]["overrides"], sort_keys=True)
+        groups.setdefault(key, []).append(result)
+
+    report = []
+    for group in groups.values():
+        survival_times = [result["survival_time"] for result in group]
+        kill_times = [time for result in group for time in result["boss_kill_times"]]
+        timed = [result for result in group if result["tick_ms_mean"] is not None]
+        ticks = sum(result["ticks"] for result in timed)
+        report.append({
+            "overrides": group[0]["job"]["overrides"],
+            "runs": len(group),
+            "survival_rate": sum(result["survived"] for result in group) / len(group),
+            "survival_time_p50": percentile(survival_times, 50),
+            "survival_time_mean": sum(survival_times) / len(group),
+            "kills_mean": sum(result["kills"] for result in group) / len(group),
+            "boss_kills": len(kill_times),
+            "boss_kill_time_p50": percentile(kill_times, 50),
+            "boss_kill_time_mean": sum(kill_times) / len(kill_times) if kill_times else 0.0,
+            "tick_ms_mean": sum(result["tick_ms_mean"] * result["ticks"] for result in timed) / ticks if ticks else None,
+            "tick_ms_p95": percentile([result["tick_ms_p95"] for result in timed], 50) if timed else None
+        })
+    return report
@@ -0,0 +1,50 @@
+import argparse
+import os
+import sys
+
+from shmup.bench.benchmark import run_scenario, compare, load_results, save_results
+from shmup.bench.scenario import Scenario
+
+def main(args=None):
+    if args is None:
+        args = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(prog="shmup-bench", description="Times every frame phase of the gameplay on scripted scenarios.")
+    parser.add_argument("scenarios", nargs="*", help="scenario JSON files, the bundled scenarios if omitted")
+    parser.add_argument("--output", default="bench_results.json", help="where to write the p50/p95/p99 results")
+    parser.add_argument("--baseline", default="bench_baseline.json", help="baseline results to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed relative slowdown per percentile")
+    parser.add_argument("--min-delta", type=float, default=0.05, help="ignore slowdowns below this many milliseconds")
+    options = parser.parse_args(args)
+
+    if options.scenarios:
+        scenarios = [Scenario.load(path) for path in options.scenarios]
+    else:
+        scenarios = Scenario.bundled()
+
+    results = {"scenarios": {}}
+    for scenario in scenarios:
+        print(f"Running {scenario.name}: {scenario.description}")
+        results["scenarios"][scenario.name] = run_scenario(scenario)
+        for phase, summary in results["scenarios"][scenario.name]["phases"].items():
+            print(f"    {phase:<18} p50 {summary['p50']:8.3f} ms   p95 {summary['p95']:8.3f} ms   p99 {summary['p99']:8.3f} ms")
+
+    save_results(results, options.output)
+
+    if options.update_baseline:
+        save_results(results, options.baseline)
+        print(f"Baseline stored in {options.baseline}")
+        return 0
+
+    if not os.path.exists(options.baseline):
+        print(f"No baseline at {options.baseline}, run with --update-baseline to store one")
+        return 0
+
+    regressions = compare(results, load_results(options.baseline), options.tolerance, options.min_delta)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+import json
+import os
+
+from shmup.config import cfg_item
+from shmup.events import EventBus
+from shmup.profiler import Profiler
+from shmup.simulation import Simulation
+
+PERCENTILES = ("p50", "p95", "p99")
+
+def run_scenario(scenario):
+    """
+    Runs a scenario headless and times every frame phase.
+
+    The phases are "update" (GamePlay.update, collisions included), "collisions"
+    (GamePlay collision detection alone), "render" (GamePlay.render) and
+    "video_background" (the video background of the App), the last one only when the
+    scenario plays the video and the video file exists.
+
+    Args:
+        scenario (Scenario): The scenario to run.
+
+    Returns:
+        dict: The scenario description, number of timed frames, the summary per phase, the
+            metrics of the event bus queue and the stats of the projectile pools.
+    """
+    profiler = Profiler()
+    event_bus = EventBus.get_instance()
+    simulation = Simulation(scenario.seed, scenario.delta_time, scenario.render, profiler)
+    video_background = None
+
+    if scenario.video:
+        video_path = cfg_item("game", "background_video")
+        if os.path.exists(video_path):
+            # moviepy is only needed by the scenarios that play the video
+            from shmup.video_background import VideoBackgroundFactory
+            video_background = VideoBackgroundFactory.create_video_background(video_path)
+        else:
+            print(f"{scenario.name}: {video_path} not found, skipping video_background phase")
+
+    scenario.populate(simulation.gameplay)
+
+    for frame in range(scenario.warmup + scenario.frames):
+        if frame == scenario.warmup:
+            profiler.clear()
+            event_bus.clear_stats()
+        if scenario.sustain:
+            scenario.replenish(simulation.gameplay)
+        if video_background:
+            with profiler.phase("video_background"):
+                video_background.render(simulation.surface)
+        simulation.step()
+
+    result = {
+        "description": scenario.description,
+        "frames": scenario.frames,
+        "phases": profiler.summary(),
+        "events": event_bus.stats(),
+        "projectile_pools": simulation.gameplay.projectile_pool_stats()
+    }
+
+    if video_background:
+        video_background.release()
+    simulation.release()
+    return result
+
+def compare(results, baseline, tolerance, min_delta):
+    """
+    Compares benchmark results against a baseline.
+
+    A phase regresses when one of its percentiles is slower than the baseline by more than
+    the relative tolerance and by more than min_delta milliseconds, the latter filtering out
+    noise on phases that take microseconds.
+
+    Args:
+        results (dict): The results of the current run.
+        baseline (dict): The stored baseline results.
+        tolerance (float): Allowed relative slowdown, e.g. 0.1 for 10%.
+        min_delta (float): Minimum absolute slowdown in milliseconds to report.
+
+    Returns:
+        list of str: One line per regression, empty if there are none.
+    """
+    regressions = []
+    for name, scenario in results["scenarios"].items():
+        baseline_scenario = baseline.get("scenarios", {}).get(name)
+        if baseline_scenario is None:
+            continue
+        for phase, summary in scenario["phases"].items():
+            baseline_summary = baseline_scenario["phases"].get(phase)
+            if baseline_summary is None:
+                continue
+            for key in PERCENTILES:
+                current, previous = summary[key], baseline_summary[key]
+                if current > previous * (1 + tolerance) and current - previous > min_delta:
+                    regressions.append(f"{name}.{phase}.{key}: {previous:.3f} ms -> {current:.3f} ms")
+    return regressions
+
+def load_results(path):
+    """
+    Loads benchmark results from a JSON file.
+
+    Args:
+        path (str): The path to the results file.
+
+    Returns:
+        dict: The results.
+    """
+    with open(path) as file:
+        return json.load(file)
+
+def save_results(results, path):
+    """
+    Saves benchmark results to a JSON file.
+
+    Args:
+        results (dict): The results.
+        path (str): The path to the results file.
+    """
+    with open(path, "w") as file:
+        json.dump(results, file, indent=4)
@@ -0,0 +1,170 @@
+from importlib import resources
+import json
+import os
+import random
+
+from shmup.config import cfg
+from shmup.entities.enemies.enemy_factory import EnemyType
+from shmup.entities.projectiles.laser_beam import LaserBeam
+from shmup.entities.projectiles.projectile_type import ProjectileType
+
+class Scenario:
+    """
+    A benchmark workload: how many entities of each kind the playfield holds and how long to run.
+
+    Attributes
+    ----------
+    name : str
+        Name of the scenario, taken from its file name.
+    description : str
+        Human readable description of the workload.
+    seed : int
+        Seed for the random generator.
+    delta_time : float
+        Milliseconds simulated per frame.
+    warmup : int
+        Frames run before timing starts.
+    frames : int
+        Frames timed.
+    render : bool
+        Whether the state is rendered every frame.
+    video : bool
+        Whether the background video is played every frame.
+    sustain : bool
+        Whether entities that leave the game are replaced every frame to keep the counts steady.
+
+    Methods
+    -------
+    load(path):
+        Loads a scenario from a JSON file.
+    bundled():
+        Loads the scenarios shipped with the benchmark suite.
+    populate(gameplay):
+        Spawns the scenario entities and stops the automatic enemy spawner.
+    replenish(gameplay):
+        Spawns entities until the scenario counts are reached again.
+    """
+
+    def __init__(self, name, data):
+        """
+        Initializes a scenario from its parsed JSON data.
+
+        Args:
+            name (str): Name of the scenario.
+            data (dict): The scenario settings.
+        """
+        self.name = name
+        self.description = data.get("description", "")
+        self.seed = data.get("seed", 0)
+        self.delta_time = data.get("delta_time", 1000 / 60)
+        self.warmup = data.get("warmup", 60)
+        self.frames = data.get("frames", 600)
+        self.render = data.get("render", True)
+        self.video = data.get("video", False)
+        self.sustain = data.get("sustain", True)
+        self.__enemies = data.get("enemies", 0)
+        self.__projectiles = {
+            ProjectileType.Allied: data.get("projectiles_allied", 0),
+            ProjectileType.Enemy: data.get("projectiles_enemy", 0)
+        }
+        self.__boss = data.get("boss", False)
+        self.__laser_beams = data.get("laser_beams", 0)
+
+    @staticmethod
+    def load(path):
+        """
+        Loads a scenario from a JSON file.
+
+        Args:
+            path (str): The path to the scenario file.
+
+        Returns:
+            Scenario: The loaded scenario.
+        """
+        with open(path) as file:
+            data = json.load(file)
+        return Scenario(os.path.splitext(os.path.basename(path))[0], data)
+
+    @staticmethod
+    def bundled():
+        """
+        Loads the scenarios shipped in shmup.bench.scenarios, sorted by name.
+
+        Returns:
+            list of Scenario: The bundled scenarios.
+        """
+        scenarios = []
+        for entry in sorted(resources.files("shmup.bench.scenarios").iterdir(), key=lambda entry: entry.name):
+            if entry.name.endswith(".json"):
+                with resources.as_file(entry) as scenario_path:
+                    scenarios.append(Scenario.load(scenario_path))
+        return scenarios
+
+    def populate(self, gameplay):
+        """
+        Stops the automatic enemy spawner and spawns the scenario entities.
+
+        Args:
+            gameplay (GamePlay): The gameplay state to populate.
+        """
+        gameplay.enemy_spawn = False
+        self.replenish(gameplay)
+
+    def replenish(self, gameplay):
+        """
+        Spawns entities until the scenario counts are reached again.
+
+        Args:
+            gameplay (GamePlay): The gameplay state to replenish.
+        """
+        counts = gameplay.entity_counts()
+
+        for _ in range(self.__enemies - counts["enemies"]):
+            self.__spawn_enemy(gameplay)
+
+        for proj_type, target in self.__projectiles.items():
+            group = "projectiles_allied" if proj_type == ProjectileType.Allied else "projectiles_enemy"
+            for _ in range(target - counts[group]):
+                position = (random.uniform(0, cfg().game.screen_width),
+                            random.uniform(0, cfg().game.screen_height))
+                gameplay.spawn_projectile(proj_type, position)
+
+        if self.__boss:
+            boss = gameplay.boss if gameplay.boss else gameplay.spawn_boss()
+            for i in range(self.__laser_beams - len(boss.laser_beams)):
+                self.__spawn_laser_beam(boss, i)
+
+    def __spawn_enemy(self, gameplay):
+        """
+        Spawns an enemy of a random type following the automatic spawner placement rules.
+
+        Args:
+            gameplay (GamePlay): The gameplay state to spawn the enemy in.
+        """
+        screen_width, screen_height = cfg().game.screen_width, cfg().game.screen_height
+        padding = cfg().entities.enemies.enemy_padding
+        enemy_type = random.choice([EnemyType.Avenger, EnemyType.Raptor])
+
+        if enemy_type == EnemyType.Avenger:
+            x = screen_width / 2
+            position_init = (x, random.choice([padding, padding + 80, padding + 160]))
+        else:
+            x = random.randint(padding, screen_width - padding)
+            position_init = (x, -padding)
+
+        gameplay.spawn_enemy(enemy_type, position_init, (x, screen_height + padding))
+
+    def __spawn_laser_beam(self, boss, index):
+        """
+        Adds a laser beam to the boss, alternating between the sides of the screen as the boss does.
+
+        Args:
+            boss (Boss): The boss that owns the laser beams.
+            index (int): Index of the beam, even beams go left and odd beams go right.
+        """
+        if index % 2 == 0:
+            beam = LaserBeam((0, boss.pos.y))
+        else:
+            # The even beam spawned just before has loaded the shared image
+            beam = LaserBeam((cfg().game.screen_width - LaserBeam.get_image_width(), boss.pos.y))
+        boss.laser_beams.add(beam)
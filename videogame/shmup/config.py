@@ -1,5 +1,6 @@
 from importlib import resources
 import json
+import threading
 
 def cfg_item(*items):
     """
@@ -20,6 +21,84 @@ def cfg_item(*items):
     return data
 
 
+def cfg():
+    """
+    Returns the compiled configuration snapshot, meant for code that runs every frame.
+
+    Sections and keys are plain attributes, e.g. cfg().entities.hero.speed, and lists are
+    tuples. The game section also holds screen_width and screen_height, resolved once from
+    screen_size. Do not keep the snapshot across frames, Config.reload() replaces it.
+
+    Returns:
+        ConfigNode: The root of the configuration snapshot.
+    """
+    if Config.snapshot is None:
+        Config.get_instance()
+    return Config.snapshot
+
+
+class ConfigNode:
+    """
+    Immutable, attribute-accessed section of the configuration snapshot.
+
+    Every section gets its own subclass whose __slots__ are the keys of the section, so
+    attribute reads are slot lookups instead of dictionary walks.
+
+    Methods
+    -------
+    compile(data, name):
+        Builds a snapshot node from a configuration dictionary.
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def compile(data, name="config"):
+        """
+        Builds a snapshot node from a configuration dictionary, recursively.
+
+        Args:
+            data (dict): The configuration section.
+            name (str): Name of the section, used to name the node class.
+
+        Returns:
+            ConfigNode: The compiled section.
+        """
+        node_class = type(f"ConfigNode_{name}", (ConfigNode,), {"__slots__": tuple(data)})
+        node = node_class()
+        for key, value in data.items():
+            object.__setattr__(node, key, ConfigNode.__compile_value(value, key))
+        return node
+
+    @staticmethod
+    def __compile_value(value, name):
+        """
+        Converts a configuration value to its immutable snapshot form.
+
+        Args:
+            value: The configuration value.
+            name (str): Key of the value, used to name nested node classes.
+
+        Returns:
+            A ConfigNode for dictionaries, a tuple for lists, the value itself otherwise.
+        """
+        if isinstance(value, dict):
+            return ConfigNode.compile(value, name)
+        if isinstance(value, list):
+            return tuple(ConfigNode.__compile_value(item, name) for item in value)
+        return value
+
+    def __setattr__(self, name, value):
+        raise AttributeError("The configuration snapshot is read-only, use Config.reload()")
+
+    def __delattr__(self, name):
+        raise AttributeError("The configuration snapshot is read-only, use Config.reload()")
+
+    def __repr__(self):
+        items = ", ".join(f"{key}={getattr(self, key)!r}" for key in self.__slots__)
+        return f"ConfigNode({items})"
+
+
 class Config:
     """
     Singleton class to handle the loading and accessing of configuration data.
@@ -28,14 +107,22 @@ class Config:
     ----------
     data : dict
         The configuration data loaded from the JSON file.
+    snapshot : ConfigNode
+        Class attribute, the compiled snapshot of the configuration data.
 
     Methods
     -------
     get_instance():
         Returns the singleton instance of the Config class.
+    reload():
+        Reloads the configuration file and rebuilds the snapshot.
+    override(overrides):
+        Replaces configuration values and rebuilds the snapshot.
     """
 
     __instance = None
+    __instance_lock = threading.Lock()
+    snapshot = None
 
     @staticmethod
     def get_instance():
@@ -46,7 +133,9 @@ class Config:
             Config: The singleton instance of the Config class.
         """
         if Config.__instance is None:
-            Config()
+            with Config.__instance_lock:
+                if Config.__instance is None:
+                    Config()
         return Config.__instance
 
     def __init__(self):
@@ -55,11 +144,58 @@ class Config:
         of the class exists.
         """
         if Config.__instance is None:
+            self.__load()
             Config.__instance = self
-
-            file_path = resources.files("shmup.assets.config").joinpath('config.json')
-            with resources.as_file(file_path) as config_data__path:
-                with open(config_data__path) as file:
-                    self.data = json.load(file)
         else:
             raise Exception("There Can Be Only One Config!!!")
+
+    @staticmethod
+    def reload():
+        """
+        Reloads the configuration file and rebuilds the snapshot.
+        """
+        Config.get_instance().__load()
+
+    @staticmethod
+    def override(overrides):
+        """
+        Replaces configuration values and rebuilds the snapshot. The values stay replaced until
+        the next reload().
+
+        Args:
+            overrides (dict): Mapping of dotted key path, e.g. "entities.boss.health", to the new value.
+
+        Raises:
+            KeyError: If a key path does not exist in the configuration.
+        """
+        config = Config.get_instance()
+        for path, value in overrides.items():
+            *sections, key = path.split(".")
+            data = config.data
+            for section in sections:
+                data = data[section]
+            if key not in data:
+                raise KeyError(path)
+            data[key] = value
+        config.__compile()
+
+    def __load(self):
+        """
+        Loads the configuration data from the JSON file and rebuilds the snapshot.
+        """
+        file_path = resources.files("shmup.assets.config").joinpath('config.json')
+        with resources.as_file(file_path) as config_data__path:
+            with open(config_data__path) as file:
+                self.data = json.load(file)
+        self.__compile()
+
+    def __compile(self):
+        """
+        Compiles the configuration data into a new snapshot.
+        """
+        data = dict(self.data)
+        data["game"] = dict(self.data["game"],
+                            screen_width=self.data["game"]["screen_size"][0],
+                            screen_height=self.data["game"]["screen_size"][1])
+
+        Config.snapshot = ConfigNode.compile(data)
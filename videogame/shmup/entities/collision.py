@@ -0,0 +1,18 @@
+import pygame
+
+def collide_mask(left, right):
+    """
+    Pixel-accurate collision test between two sprites, for use as a collided callback.
+
+    The cheap rect test runs first and the mask test only runs on rect hits. Both sprites must
+    expose a mask attribute, built once and cached next to their image, so no mask is rebuilt
+    per frame.
+
+    Args:
+        left (pygame.sprite.Sprite): The first sprite.
+        right (pygame.sprite.Sprite): The second sprite.
+
+    Returns:
+        bool: True if the opaque pixels of the sprites overlap, False otherwise.
+    """
+    return left.rect.colliderect(right.rect) and pygame.sprite.collide_mask(left, right) is not None
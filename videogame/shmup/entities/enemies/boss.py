@@ -1,11 +1,15 @@
+import logging
+
 import pygame
+from shmup.assets.asset_manager import AssetManager
 from shmup.entities.gameobject import GameObject
-from shmup.config import cfg_item
-from importlib import resources
-from shmup.events import Events
+from shmup.config import cfg
+from shmup.events import Events, EventBus
 from shmup.entities.projectiles.laser_beam import LaserBeam
 from shmup.entities.projectiles.boss_shot import BossShot
-import random
+from shmup.random_streams import RandomStreams
+
+logger = logging.getLogger(__name__)
 
 class Boss(GameObject):
     """
@@ -14,7 +18,9 @@ class Boss(GameObject):
     Attributes
     ----------
     __image : pygame.Surface
-        The image of the boss.
+        The image of the boss, shared through the AssetManager.
+    __mask : pygame.mask.Mask
+        The collision mask of the boss image, shared the same way.
     _position : pygame.math.Vector2
         The position of the boss on the screen.
     __position_end : pygame.math.Vector2
@@ -23,6 +29,8 @@ class Boss(GameObject):
         The velocity of the boss.
     __health : int
         The health of the boss.
+    __random : random.Random
+        The "boss" random stream, used to choose attack patterns and shot positions.
     __attack_patterns : list
         List of attack pattern methods.
     __current_attack_pattern : method
@@ -46,14 +54,12 @@ class Boss(GameObject):
     -------
     update(delta_time):
         Updates the position and state of the boss.
-    render(surface_dst):
+    render(surface_dst, alpha=1.0):
         Renders the boss and its shots on the given surface.
     release():
         Releases resources held by the boss.
     handle_input(key, is_pressed):
         Handles player input (not used for boss).
-    process_events(event):
-        Processes events (not used for boss).
     take_damage(damage):
         Reduces the boss's health and triggers oscillation on damage.
     kill():
@@ -72,8 +78,6 @@ class Boss(GameObject):
         Fires laser beams from the sides of the screen.
     """
 
-    __image = None
-
     def __init__(self, position_init, position_end):
         """
         Initializes the boss with the given initial and target positions.
@@ -90,9 +94,10 @@ class Boss(GameObject):
         self.__position_end = pygame.math.Vector2(position_end)
         self.__velocity = pygame.math.Vector2(0, 0.05)
         
-        self.__health = cfg_item('entities','boss', 'health')
+        self.__health = cfg().entities.boss.health
+        self.__random = RandomStreams.get_instance().stream("boss")
         self.__attack_patterns = [self.__attack_pattern_1, self.__attack_pattern_2, self.__attack_pattern_3]
-        self.__current_attack_pattern = random.choice(self.__attack_patterns)
+        self.__current_attack_pattern = self.__random.choice(self.__attack_patterns)
         self.__attack_timer = 0
         
         self.laser_beams = pygame.sprite.Group()
@@ -104,12 +109,9 @@ class Boss(GameObject):
         self.__oscillation_magnitude = 5  # Magnitude of the oscillation
         self.__oscillation_direction = 1  # Direction of the oscillation
 
-        if Boss.__image is None:
-            file_path = resources.files(cfg_item("entities", "boss", "image_file")[0]).joinpath(cfg_item("entities", "boss", "image_file")[1])
-            with resources.as_file(file_path) as image_path:
-                image = pygame.image.load(image_path).convert_alpha()
-                Boss.__image = pygame.transform.scale(image, (400, 300))
-                print("Boss image loaded")
+        assets = AssetManager.get_instance()
+        self.__image = assets.image(*Boss.image_asset())
+        self.__mask = assets.mask(*Boss.image_asset())
 
         self.rect_sync()
 
@@ -122,6 +124,7 @@ class Boss(GameObject):
         delta_time : float
             The time elapsed since the last update.
         """
+        self._store_previous_position()
         if self._position.y < self.__position_end.y:
             distance = self.__velocity * delta_time
             self._position += distance
@@ -129,9 +132,9 @@ class Boss(GameObject):
                 self._position.y = self.__position_end.y
         else:
             self.__attack_timer += delta_time
-            if self.__attack_timer >= cfg_item('entities', 'boss', 'attack_interval'):
+            if self.__attack_timer >= cfg().entities.boss.attack_interval:
                 self.__current_attack_pattern()
-                self.__current_attack_pattern = random.choice(self.__attack_patterns)
+                self.__current_attack_pattern = self.__random.choice(self.__attack_patterns)
                 self.__attack_timer = 0
 
         self.laser_beams.update(delta_time)
@@ -150,7 +153,7 @@ class Boss(GameObject):
             else:
                 self.__oscillation_direction *= -1
 
-    def render(self, surface_dst):
+    def render(self, surface_dst, alpha=1.0):
         """
         Renders the boss and its shots on the given surface.
 
@@ -158,9 +161,18 @@ class Boss(GameObject):
         ----------
         surface_dst : pygame.Surface
             The surface to render the boss and its shots on.
+        alpha : float
+            Fraction of the simulation step elapsed since the last update.
+
+        Returns
+        -------
+        list of pygame.Rect
+            The areas of the surface drawn, the one of the boss followed by the ones of its shots
+            in the order of laser_beams.
         """
-        surface_dst.blit(Boss.__image, self._position)
-        self.laser_beams.draw(surface_dst)
+        rects = [surface_dst.blit(self.__image, self.render_position(alpha))]
+        rects += surface_dst.blits((shot.image, shot.rect) for shot in self.laser_beams)
+        return rects
 
     def release(self):
         """
@@ -181,16 +193,17 @@ class Boss(GameObject):
         """
         pass
 
-    def process_events(self, event):
+    @staticmethod
+    def image_asset():
         """
-        Processes events (not used for boss).
+        Returns the resource and transform of the boss image in the AssetManager.
 
-        Parameters
-        ----------
-        event : pygame.event.Event
-            The event to process.
+        Returns
+        -------
+        tuple
+            The (resource, transform) pair of the image.
         """
-        pass
+        return cfg().entities.boss.image_file, (("scale", (400, 300)),)
 
     @property
     def image(self):
@@ -202,7 +215,31 @@ class Boss(GameObject):
         pygame.Surface
             The image of the boss.
         """
-        return Boss.__image
+        return self.__image
+
+    @property
+    def mask(self):
+        """
+        Returns the collision mask of the boss.
+
+        Returns
+        -------
+        pygame.mask.Mask
+            The cached mask of the boss image.
+        """
+        return self.__mask
+
+    @property
+    def health(self):
+        """
+        Returns the health of the boss.
+
+        Returns
+        -------
+        int
+            The remaining health of the boss.
+        """
+        return self.__health
 
     def take_damage(self, damage):
         """
@@ -214,7 +251,6 @@ class Boss(GameObject):
             The amount of damage to inflict on the boss.
         """
         self.__health -= damage
-        print(f"Boss Health: {self.__health}")
         if self.__health <= 0:
             self.__health = 0
             self.kill()
@@ -225,8 +261,7 @@ class Boss(GameObject):
         """
         Kills the boss and triggers the BOSS_KILLED event.
         """
-        kill_event = pygame.event.Event(pygame.USEREVENT, event=Events.BOSS_KILLED, boss=self)
-        pygame.event.post(kill_event)
+        EventBus.get_instance().publish(Events.BOSS_KILLED, boss=self)
         super().kill()
 
     def __start_oscillation(self):
@@ -242,41 +277,40 @@ class Boss(GameObject):
         Executes the first attack pattern (fires a random shot).
         """
         self.__fire_boss_shot()
-        print("Boss performs attack pattern 1")
+        logger.debug("Boss performs attack pattern 1")
 
     def __attack_pattern_2(self):
         """
         Executes the second attack pattern (fires a random shot).
         """
         self.__fire_boss_shot()
-        print("Boss performs attack pattern 2")
+        logger.debug("Boss performs attack pattern 2")
 
     def __attack_pattern_3(self):
         """
         Executes the third attack pattern (fires laser beams).
         """
         self.__fire_laser_beam()
-        print("Boss performs attack pattern 3")
+        logger.debug("Boss performs attack pattern 3")
 
     def __fire_boss_shot(self):
         """
         Fires a shot from a random position on the boss.
         """
-        boss_width = Boss.__image.get_width()
-        boss_height = Boss.__image.get_height()
-        shot_x = random.randint(0, boss_width)
+        boss_width = self.__image.get_width()
+        boss_height = self.__image.get_height()
+        shot_x = self.__random.randint(0, boss_width)
         shot_position = (self._position.x + shot_x, self._position.y + boss_height)
         boss_shot = BossShot(shot_position)
         self.laser_beams.add(boss_shot)
-        print("Firing boss shot")
+        logger.debug("Firing boss shot")
 
     def __fire_laser_beam(self):
         """
         Fires laser beams from the sides of the screen.
         """
-        screen_height = cfg_item("game", "screen_size")[1]
         left_beam = LaserBeam((0, self._position.y))
-        right_beam = LaserBeam((cfg_item("game", "screen_size")[0] - LaserBeam.get_image_width(), self._position.y))
+        right_beam = LaserBeam((cfg().game.screen_width - LaserBeam.get_image_width(), self._position.y))
         self.laser_beams.add(left_beam)
         self.laser_beams.add(right_beam)
-        print("Firing laser beams")
\ No newline at end of file
+        logger.debug("Firing laser beams")
\ No newline at end of file
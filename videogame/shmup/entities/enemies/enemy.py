@@ -1,10 +1,9 @@
-import random
-
 import pygame
 
 from shmup.entities.gameobject import GameObject
-from shmup.events import Events
-from shmup.config import cfg_item
+from shmup.events import Events, EventBus
+from shmup.config import cfg
+from shmup.random_streams import RandomStreams
 
 
 class Enemy(GameObject):
@@ -40,23 +39,16 @@ class Enemy(GameObject):
         """
         pass
 
-    def process_events(self, event):
-        """Processes game events.
-
-        Args:
-            event (pygame.event.Event): The event to process.
-        """
-        pass
-
     def update(self, delta_time):
         """Updates the enemy's position and state.
 
         Args:
             delta_time (float): The time elapsed since the last update.
         """
+        self._store_previous_position()
         distance = self.__velocity * delta_time
         self._position += distance
-        screen_width = cfg_item('game', 'screen_size')[0]
+        screen_width = cfg().game.screen_width
         
         if self._position.x <= 0 or self._position.x >= screen_width - self.image.get_width():
             self.__velocity.x = -self.__velocity.x
@@ -65,13 +57,17 @@ class Enemy(GameObject):
         self.__fire()
         self.rect_sync()
 
-    def render(self, surface_dst):
+    def render(self, surface_dst, alpha=1.0):
         """Renders the enemy on the given surface.
 
         Args:
             surface_dst (pygame.Surface): The surface on which to render the enemy.
+            alpha (float): Fraction of the simulation step elapsed since the last update.
+
+        Returns:
+            pygame.Rect: The area of the surface drawn.
         """
-        surface_dst.blit(self.image, self._position)
+        return surface_dst.blit(self.image, self.render_position(alpha))
 
     def release(self):
         """Releases resources held by the enemy."""
@@ -79,14 +75,12 @@ class Enemy(GameObject):
 
     def __check_end_point(self):
         """Checks if the enemy has reached its end point and posts an event if true."""
-        if abs(self.__position_end.y - self._position.y) <= cfg_item("entities", "enemies", "delta_oos"):
-            kill_event = pygame.event.Event(pygame.USEREVENT, event=Events.ENEMY_END_POINT, enemy=self)
-            pygame.event.post(kill_event)
+        if abs(self.__position_end.y - self._position.y) <= cfg().entities.enemies.delta_oos:
+            EventBus.get_instance().publish(Events.ENEMY_END_POINT, enemy=self)
 
     def __fire(self):
         """Fires a projectile with a certain probability and posts an event."""
-        if random.random() <= self._fire_probability:
+        if RandomStreams.get_instance().stream("enemy").random() <= self._fire_probability:
             x = self._position.x + (self.image.get_width() // 2)
             y = self._position.y + self.image.get_height()
-            fire_event = pygame.event.Event(pygame.USEREVENT, event=Events.ENEMY_FIRES, pos=(x, y))
-            pygame.event.post(fire_event)
\ No newline at end of file
+            EventBus.get_instance().publish(Events.ENEMY_FIRES, pos=(x, y))
\ No newline at end of file
@@ -1,21 +1,20 @@
-from importlib import resources
-import random
-
-import pygame
-
+from shmup.assets.asset_manager import AssetManager
 from shmup.entities.enemies.enemy import Enemy
-from shmup.config import cfg_item
+from shmup.config import cfg
+from shmup.random_streams import RandomStreams
 
 
 class EnemyAvenger(Enemy):
     """Class representing an Avenger enemy in the game.
 
     Attributes:
-        __image : Static image used for all instances of EnemyAvenger.
+        SHARED_IMAGE : True, every EnemyAvenger draws the same image.
+        __image : Image shared by all instances of EnemyAvenger through the AssetManager.
+        __mask : Collision mask of the image, shared the same way.
         _fire_probability : Probability of the enemy firing a projectile.
     """
 
-    __image = None
+    SHARED_IMAGE = True
 
     def __init__(self, position_init, position_end):
         """Initializes an EnemyAvenger with initial and end positions.
@@ -24,20 +23,29 @@ class EnemyAvenger(Enemy):
             position_init : Spawn position of the EnemyAvenger.
             position_end : End position where the EnemyAvenger will stop moving.
         """
-        velocity_range = cfg_item("entities", "enemies", "avenger", "velocity_range")
-        velocity = (random.uniform(velocity_range[0], velocity_range[1]), 0)
+        config = cfg().entities.enemies.avenger
+        velocity_range = config.velocity_range
+        velocity = (RandomStreams.get_instance().stream("enemy").uniform(velocity_range[0], velocity_range[1]), 0)
 
-        self._fire_probability = cfg_item("entities", "enemies", "avenger", "fire_probability")
+        self._fire_probability = config.fire_probability
 
-        if EnemyAvenger.__image is None:
-            file_path = resources.files(cfg_item("entities", "enemies", "avenger", "image_file")[0]).joinpath(cfg_item("entities", "enemies", "avenger", "image_file")[1])
-            with resources.as_file(file_path) as image_path:
-                image = pygame.image.load(image_path).convert_alpha()
-                EnemyAvenger.__image = pygame.transform.scale(image, (100, 60))
+        assets = AssetManager.get_instance()
+        self.__image = assets.image(*EnemyAvenger.image_asset())
+        self.__mask = assets.mask(*EnemyAvenger.image_asset())
 
         super().__init__(position_init, position_end, velocity)
 
+    @staticmethod
+    def image_asset():
+        #The resource and transform of the EnemyAvenger image in the AssetManager.
+        return cfg().entities.enemies.avenger.image_file, (("scale", (100, 60)),)
+
     @property
     def image(self):
         #The image used for the EnemyAvenger.
-        return EnemyAvenger.__image
\ No newline at end of file
+        return self.__image
+
+    @property
+    def mask(self):
+        #The collision mask shared by all instances of EnemyAvenger.
+        return self.__mask
\ No newline at end of file
@@ -1,20 +1,20 @@
-from importlib import resources
-import random
-import pygame
+from shmup.assets.asset_manager import AssetManager
 from shmup.entities.enemies.enemy import Enemy
-from shmup.config import cfg_item
+from shmup.config import cfg
+from shmup.random_streams import RandomStreams
 
 
 class EnemyRaptor(Enemy):
     """Class representing a Raptor enemy in the game.
 
     Attributes:
-        __image : Static image used for all instances of EnemyRaptor.
+        SHARED_IMAGE : True, every EnemyRaptor draws the same image.
+        __mask : Collision mask of the image, shared by all instances through the AssetManager.
         _fire_probability : Probability of the enemy firing a projectile.
         _image : Image used for the instance of EnemyRaptor.
     """
 
-    __image = None
+    SHARED_IMAGE = True
 
     def __init__(self, position_init, position_end):
         """Initializes an EnemyRaptor with initial and end positions.
@@ -23,25 +23,31 @@ class EnemyRaptor(Enemy):
             position_init : Spawn position of the EnemyRaptor.
             position_end : End position where the EnemyRaptor will stop moving.
         """
-        velocity_range = cfg_item("entities", "enemies", "raptor", "velocity_range")
-        velocity = (0, random.uniform(velocity_range[0], velocity_range[1]))
+        config = cfg().entities.enemies.raptor
+        velocity_range = config.velocity_range
+        velocity = (0, RandomStreams.get_instance().stream("enemy").uniform(velocity_range[0], velocity_range[1]))
 
-        self._fire_probability = cfg_item("entities", "enemies", "raptor", "fire_probability")
+        self._fire_probability = config.fire_probability
 
-        if EnemyRaptor.__image is None:
-            file_path = resources.files(cfg_item("entities", "enemies", "raptor", "image_file")[0]).joinpath(cfg_item("entities", "enemies", "raptor", "image_file")[1])
-            with resources.as_file(file_path) as image_path:
-                image = pygame.image.load(image_path).convert_alpha()
-                image = pygame.transform.flip(image, False, True)
-                EnemyRaptor.__image = pygame.transform.scale(image, (50, 50))  
-
-        # Use the resized image in the instance
-        self._image = EnemyRaptor.__image  
+        # Use the flipped and resized image in the instance
+        assets = AssetManager.get_instance()
+        self._image = assets.image(*EnemyRaptor.image_asset())
+        self.__mask = assets.mask(*EnemyRaptor.image_asset())
         
         super().__init__(position_init, position_end, velocity)
         self.rect_sync()  
 
+    @staticmethod
+    def image_asset():
+        """tuple: The resource and transform of the EnemyRaptor image in the AssetManager."""
+        return cfg().entities.enemies.raptor.image_file, (("flip", (False, True)), ("scale", (50, 50)))
+
     @property
     def image(self):
         """pygame.Surface: The image used for the instance of EnemyRaptor."""
         return self._image
+
+    @property
+    def mask(self):
+        """pygame.mask.Mask: The collision mask shared by all instances of EnemyRaptor."""
+        return self.__mask
@@ -1,42 +1,42 @@
-from importlib import resources
-
-import pygame
-
 from shmup.assets.flipbook import FlipBook
 from shmup.entities.gameobject import GameObject
-from shmup.config import cfg_item
-from shmup.events import Events
+from shmup.config import cfg
 
 class Explosion(GameObject):
     """Represents an explosion animation in the game.
 
+    Explosions do not animate themselves: an ExplosionGroup advances all of them with one
+    clock and draws them together.
+
     Attributes:
-        __time_per_sequence (int): The time per sequence frame in the explosion animation.
-        __flipbook (FlipBook): The flipbook object that handles the explosion animation frames.
-        __total_sequences (int): The total number of sequences in the explosion animation.
-        __current_sequence (int): The current sequence frame being displayed.
-        __current_time (int): The current time elapsed since the last sequence frame change.
+        __flipbook (FlipBook): The flipbook shared by all explosions.
+        start_time (float): Time of the animation clock when the explosion started.
+        sequence (int): The current sequence frame being displayed.
         _position (tuple): The position of the explosion.
     """
 
-    def __init__(self, position):
+    def __init__(self, position, start_time=0):
         """Initializes a new Explosion instance.
 
         Args:
             position (tuple): The initial position of the explosion.
+            start_time (float): Time of the animation clock when the explosion starts.
         """
         super().__init__()
-        self.__time_per_sequence = cfg_item("entities", "explosion", "time_per_sequence")
-        size = cfg_item("entities", "explosion", "size")
+        size = cfg().entities.explosion.size
+        self.__flipbook = FlipBook.get(Explosion.image_asset()[0], size[0], size[1])
+        self.start_time = start_time
+        self.sequence = 0
+        self._position = position
 
-        file_path = resources.files(cfg_item("entities", "explosion", "image_file")[0]).joinpath(cfg_item("entities", "explosion", "image_file")[1])
-        with resources.as_file(file_path) as image_path:
-            self.__flipbook = FlipBook(image_path, size[0], size[1])
+    @property
+    def flipbook(self):
+        """Gets the flipbook of the explosion.
 
-        self.__total_sequences = size[0] * size[1]
-        self.__current_sequence = 0
-        self.__current_time = 0
-        self._position = position
+        Returns:
+            FlipBook: The flipbook shared by all explosions.
+        """
+        return self.__flipbook
 
     def handle_input(self, key, is_pressed):
         """Handles input events. Not used for explosions.
@@ -47,36 +47,35 @@ class Explosion(GameObject):
         """
         pass
 
-    def process_events(self, event):
-        """Processes other game events. Not used for explosions.
-
-        Args:
-            event (pygame.event.Event): The event to process.
-        """
-        pass
-
     def update(self, delta_time):
-        """Updates the explosion animation based on the elapsed time.
+        """Does nothing, the ExplosionGroup advances the animation.
 
         Args:
             delta_time (float): The time elapsed since the last update.
         """
-        self.__current_time += delta_time
-        if self.__current_time >= self.__time_per_sequence:
-            self.__current_time -= self.__time_per_sequence
-            self.__current_sequence += 1
-            if self.__current_sequence >= self.__total_sequences - 1:
-                end_event = pygame.event.Event(pygame.USEREVENT, event=Events.EXPLOSION_FINISHED, explosion=self)
-                pygame.event.post(end_event)
-
-    def render(self, surface_dst):
+        pass
+
+    def render(self, surface_dst, alpha=1.0):
         """Renders the explosion animation on the given surface.
 
         Args:
             surface_dst (pygame.Surface): The surface to render the explosion on.
+            alpha (float): Fraction of the simulation step elapsed, ignored as explosions do not move.
+
+        Returns:
+            pygame.Rect: The area of the surface drawn.
         """
-        self.__flipbook.render(surface_dst, self._position, self.__current_sequence)
+        return self.__flipbook.render(surface_dst, self._position, self.sequence)
 
     def release(self):
         """Releases any resources held by the explosion. Not used."""
         pass
+
+    @staticmethod
+    def image_asset():
+        """Gets the resource and transform of the explosion sheet in the AssetManager.
+
+        Returns:
+            tuple: The (resource, transform) pair of the image.
+        """
+        return cfg().entities.explosion.image_file, ()
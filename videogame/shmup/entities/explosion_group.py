@@ -0,0 +1,76 @@
+from operator import attrgetter
+
+from shmup.config import cfg
+from shmup.entities.explosion import Explosion
+from shmup.entities.rendergroup import RenderGroup
+
+class ExplosionGroup(RenderGroup):
+    """
+    A render group that animates all its explosions with one clock and draws them together.
+
+    Every explosion remembers the time of the clock when it started, so advancing the group
+    is one clock increment plus a division per explosion, and finished explosions are removed
+    right away. All the frames are drawn with a single Surface.blits call.
+
+    Methods
+    -------
+    spawn(position):
+        Starts an explosion at the given position.
+    update(delta_time):
+        Advances the animation clock and removes the finished explosions.
+    render(surface_dst, alpha=1.0):
+        Draws the current frame of every explosion.
+    """
+
+    def __init__(self):
+        """
+        Initializes the ExplosionGroup with its clock at zero.
+        """
+        super().__init__()
+        self.__time = 0
+
+    def spawn(self, position):
+        """
+        Starts an explosion at the given position.
+
+        Args:
+            position (tuple): The position of the explosion.
+
+        Returns:
+            Explosion: The new explosion.
+        """
+        explosion = Explosion(position, self.__time)
+        self.add(explosion)
+        return explosion
+
+    def update(self, delta_time):
+        """
+        Advances the animation clock, moves every explosion to the frame due and removes the
+        explosions that reached their last frame.
+
+        Args:
+            delta_time (float): The time elapsed since the last update.
+        """
+        self.__time += delta_time
+        time_per_sequence = cfg().entities.explosion.time_per_sequence
+        for explosion in self.sprites():
+            sequence = int((self.__time - explosion.start_time) // time_per_sequence)
+            if sequence >= len(explosion.flipbook) - 1:
+                explosion.kill()
+            else:
+                explosion.sequence = sequence
+
+    def render(self, surface_dst, alpha=1.0):
+        """
+        Draws the current frame of every explosion with a single call.
+
+        Args:
+            surface_dst (pygame.Surface): The surface to render the explosions on.
+            alpha (float): Fraction of the simulation step elapsed, ignored as explosions do not move.
+
+        Returns:
+            list of pygame.Rect: The areas of the surface drawn.
+        """
+        explosions = self.sprites()
+        frames = [explosion.flipbook.frames[explosion.sequence] for explosion in explosions]
+        return self._draw(surface_dst, explosions, frames, map(attrgetter("pos"), explosions))
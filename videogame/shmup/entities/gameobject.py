@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 
 import pygame
 
-from shmup.config import cfg_item
+from shmup.config import cfg
 
 class GameObject(pygame.sprite.Sprite, ABC):
     """
@@ -10,8 +10,12 @@ class GameObject(pygame.sprite.Sprite, ABC):
 
     Attributes
     ----------
+    SHARED_IMAGE : bool
+        class attribute, True when every instance of the class draws the same image
     _position : pygame.math.Vector2
         position of the game object in the screen
+    _previous_position : pygame.math.Vector2
+        position of the game object before the last simulation step, None until the first step
     _image : pygame.Surface
         loaded image of the game object
 
@@ -19,22 +23,27 @@ class GameObject(pygame.sprite.Sprite, ABC):
     -------
     handle_input(key, is_pressed):
         Abstract, handles the input of the player
-    process_events(event):
-        Abstract, process events for other parts of the app
     update(delta_time):
         Abstract, updates the game object for a period of time
+    render(surface_dst, alpha=1.0):
+        Abstract, renders the game object between its previous and current positions and returns the rect drawn
+    render_position(alpha):
+        Returns the position interpolated between the previous and current positions
     release():
         Abstract, releases any resource from the game object
     _in_bounds(distance):
         Checks if game object is inside the screen
     """
 
+    SHARED_IMAGE = False
+
     def __init__(self):
         """
         Abstract, Constructs the game object class
         """
         super().__init__()
         self._position = pygame.math.Vector2(0.0, 0.0)
+        self._previous_position = None
         self.rect = pygame.Rect(0,0,0,0)
 
     @abstractmethod
@@ -51,22 +60,39 @@ class GameObject(pygame.sprite.Sprite, ABC):
         """
         pass
 
-    @abstractmethod
-    def process_events(self, event):
-        pass
-
     @abstractmethod
     def update(self, delta_time):
         pass
 
     @abstractmethod
-    def render(self, surface_dst):
+    def render(self, surface_dst, alpha=1.0):
         pass
 
     @abstractmethod
     def release(self):
         pass
 
+    def render_position(self, alpha):
+        """
+        Returns the position the game object is drawn at, interpolated between its position
+        before the last simulation step and its current one.
+
+        Parameters:
+            alpha (float): Fraction of the simulation step elapsed, 1.0 for the current position.
+
+        Returns:
+            pygame.math.Vector2: The interpolated position.
+        """
+        if alpha == 1.0 or self._previous_position is None:
+            return self._position
+        return self._previous_position.lerp(self._position, alpha)
+
+    def _store_previous_position(self):
+        """
+        Stores the position before a simulation step, for render_position to interpolate from.
+        """
+        self._previous_position = pygame.math.Vector2(self._position)
+
     def _in_bounds(self, distance):
         """
         Checks if the game object is within the screen bounds.
@@ -78,7 +104,8 @@ class GameObject(pygame.sprite.Sprite, ABC):
             bool: True if the game object is within bounds, False otherwise.
         """
         new_pos = self._position + distance
-        screen_width, screen_height = cfg_item("game", "screen_size")
+        game = cfg().game
+        screen_width, screen_height = game.screen_width, game.screen_height
         return 0 <= new_pos.x <= screen_width and 0 <= new_pos.y <= screen_height
 
     @property
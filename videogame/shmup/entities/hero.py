@@ -1,10 +1,9 @@
-from importlib import resources
-
 import pygame
 
-from shmup.config import cfg_item
+from shmup.assets.asset_manager import AssetManager
+from shmup.config import cfg
 from shmup.entities.gameobject import GameObject
-from shmup.events import Events
+from shmup.events import Events, EventBus
 from .movement_type import MovementType
 
 class Hero(GameObject):
@@ -19,9 +18,9 @@ class Hero(GameObject):
         __hero_is_moving_left (bool): Whether the hero is moving left.
         __hero_is_moving_right (bool): Whether the hero is moving right.
         __movement_type (MovementType): The type of movement allowed for the hero.
-        __speed (float): The speed of the hero.
         __cool_down (float): The cooldown time for shooting.
         __shoot_sound (pygame.mixer.Sound): The sound played when the hero shoots.
+        __mask (pygame.mask.Mask): The collision mask of the hero's image.
     """
 
     def __init__(self, movement_type):
@@ -34,16 +33,16 @@ class Hero(GameObject):
         super().__init__()
         
         # Load the hero image
-        file_path = resources.files("shmup.assets.images").joinpath('hero.png')
-        with resources.as_file(file_path) as hero_image_path:
-            self._image = pygame.image.load(hero_image_path).convert_alpha()
+        assets = AssetManager.get_instance()
+        self._image = assets.image(*Hero.image_asset())
+        self.__mask = assets.mask(*Hero.image_asset())
         
         # Use the image height to calculate the initial position
         self.__hero_image_height = self._image.get_height()
-        self.__hero_spawn = cfg_item("game", "screen_size")[1] - self.__hero_image_height  # Adjust initial position
+        self.__hero_spawn = cfg().game.screen_height - self.__hero_image_height  # Adjust initial position
         
         # Set the initial position of the hero
-        self._position = pygame.math.Vector2(cfg_item("game", "screen_size")[0]/2, self.__hero_spawn)
+        self._position = pygame.math.Vector2(cfg().game.screen_width/2, self.__hero_spawn)
 
         self.__hero_is_moving_up = False
         self.__hero_is_moving_down = False
@@ -52,12 +51,10 @@ class Hero(GameObject):
 
         self.__movement_type = movement_type
 
-        self.__speed = 0.3
         self.__cool_down = 0
         
-        sound_path = resources.files("shmup.assets.sounds").joinpath('shot.mp3')
-        with resources.as_file(sound_path) as shoot_sound_path:
-            self.__shoot_sound = pygame.mixer.Sound(shoot_sound_path)
+        # Sounds are optional so the hero can run headless without a mixer
+        self.__shoot_sound = assets.sound(Hero.sound_asset())
 
         self.rect_sync()
 
@@ -89,15 +86,6 @@ class Hero(GameObject):
             if self.__cool_down <= 0.0:
                 self.__fire()
 
-    def process_events(self, event):
-        """
-        Processes events.
-
-        Args:
-            event (pygame.event.Event): The event to process.
-        """
-        pass
-
     def update(self, delta_time):
         """
         Updates the hero's state.
@@ -105,37 +93,45 @@ class Hero(GameObject):
         Args:
             delta_time (float): The time elapsed since the last update.
         """
+        self._store_previous_position()
+        config = cfg()
+        speed = config.entities.hero.speed
         velocity = pygame.math.Vector2(0, 0)
 
         if self.__hero_is_moving_up:
-            velocity.y -= self.__speed
+            velocity.y -= speed
         if self.__hero_is_moving_down:
-            velocity.y += self.__speed
+            velocity.y += speed
         if self.__hero_is_moving_left:
-            velocity.x -= self.__speed
+            velocity.x -= speed
         if self.__hero_is_moving_right:
-            velocity.x += self.__speed
+            velocity.x += speed
         self._position += velocity * delta_time
-        
-        if self._position.x >= cfg_item('game','screen_size')[0] - cfg_item('entities', 'hero', 'width'):
-            self._position.x = cfg_item('game','screen_size')[0] - cfg_item('entities', 'hero', 'width')
-            
-        if self._position.x <= cfg_item('game','screen_size_min'):
-            self._position.x = cfg_item('game','screen_size_min')
+
+        max_x = config.game.screen_width - config.entities.hero.width
+        if self._position.x >= max_x:
+            self._position.x = max_x
+
+        if self._position.x <= config.game.screen_size_min:
+            self._position.x = config.game.screen_size_min
 
         if self.__cool_down >= 0.0:
             self.__cool_down -= delta_time
 
         self.rect_sync()
 
-    def render(self, surface_dst):
+    def render(self, surface_dst, alpha=1.0):
         """
         Renders the hero on the given surface.
 
         Args:
             surface_dst (pygame.Surface): The surface to render the hero on.
+            alpha (float): Fraction of the simulation step elapsed since the last update.
+
+        Returns:
+            pygame.Rect: The area of the surface drawn.
         """
-        surface_dst.blit(self._image, self._position.xy)
+        return surface_dst.blit(self._image, self.render_position(alpha))
 
     def release(self):
         """
@@ -147,14 +143,34 @@ class Hero(GameObject):
         """
         Fires a projectile from the hero's current position.
         """
-        self.__cool_down = cfg_item("entities", "hero", "cool_down_time")
+        self.__cool_down = cfg().entities.hero.cool_down_time
         x = self._position.x + (self._image.get_width() // 2)
 
-        fire_event = pygame.event.Event(pygame.USEREVENT, event = Events.HERO_FIRES, pos = (x, self._position.y))
-        pygame.event.post(fire_event)
-        
-        self.__shoot_sound.play()
+        EventBus.get_instance().publish(Events.HERO_FIRES, pos=(x, self._position.y))
+
+        if self.__shoot_sound:
+            self.__shoot_sound.play()
         
+    @staticmethod
+    def image_asset():
+        """
+        Returns the resource and transform of the hero image in the AssetManager.
+
+        Returns:
+            tuple: The (resource, transform) pair of the image.
+        """
+        return ("shmup.assets.images", "hero.png"), ()
+
+    @staticmethod
+    def sound_asset():
+        """
+        Returns the resource of the shoot sound in the AssetManager.
+
+        Returns:
+            tuple: The package and file name of the sound.
+        """
+        return ("shmup.assets.sounds", "shot.mp3")
+
     @property
     def image(self):
         """
@@ -164,3 +180,13 @@ class Hero(GameObject):
             pygame.Surface: The image of the hero.
         """
         return self._image
+
+    @property
+    def mask(self):
+        """
+        Returns the hero's collision mask, built once from its image.
+
+        Returns:
+            pygame.mask.Mask: The collision mask of the hero.
+        """
+        return self.__mask
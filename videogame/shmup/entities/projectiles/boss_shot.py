@@ -1,5 +1,5 @@
 import pygame
-from importlib import resources
+from shmup.assets.asset_manager import AssetManager
 
 class BossShot(pygame.sprite.Sprite):
     """
@@ -7,8 +7,10 @@ class BossShot(pygame.sprite.Sprite):
 
     Attributes
     ----------
-    __image : pygame.Surface
-        The image of the boss shot.
+    image : pygame.Surface
+        The image of the boss shot, shared through the AssetManager.
+    mask : pygame.mask.Mask
+        The collision mask of the boss shot image, shared the same way.
 
     Methods
     -------
@@ -18,12 +20,10 @@ class BossShot(pygame.sprite.Sprite):
         Returns the height of the boss shot image.
     get_image_width():
         Returns the width of the boss shot image.
-    __load_image():
-        Loads and scales the image of the boss shot.
+    image_asset():
+        Returns the resource and transform of the boss shot image.
     """
 
-    __image = None
-
     def __init__(self, position):
         """
         Constructs all the necessary attributes for the boss shot object.
@@ -34,9 +34,9 @@ class BossShot(pygame.sprite.Sprite):
             The initial position of the boss shot.
         """
         super().__init__()
-        if BossShot.__image is None:
-            self.__load_image()  # Ensure the image is loaded if it hasn't been already
-        self.image = BossShot.__image  # Use the loaded and resized image
+        assets = AssetManager.get_instance()
+        self.image = assets.image(*BossShot.image_asset())  # Use the loaded and resized image
+        self.mask = assets.mask(*BossShot.image_asset())
         self.rect = self.image.get_rect(topleft=position)
         self.__velocity = pygame.math.Vector2(0, 0.2)  # Adjust velocity as necessary
 
@@ -63,9 +63,7 @@ class BossShot(pygame.sprite.Sprite):
         int
             The height of the boss shot image.
         """
-        if BossShot.__image is None:
-            BossShot.__load_image()
-        return BossShot.__image.get_height()
+        return AssetManager.get_instance().image(*BossShot.image_asset()).get_height()
 
     @staticmethod
     def get_image_width():
@@ -77,16 +75,16 @@ class BossShot(pygame.sprite.Sprite):
         int
             The width of the boss shot image.
         """
-        if BossShot.__image is None:
-            BossShot.__load_image()
-        return BossShot.__image.get_width()
+        return AssetManager.get_instance().image(*BossShot.image_asset()).get_width()
 
     @staticmethod
-    def __load_image():
+    def image_asset():
         """
-        Loads and scales the image of the boss shot.
+        Returns the resource and transform of the boss shot image in the AssetManager.
+
+        Returns
+        -------
+        tuple
+            The (resource, transform) pair of the image.
         """
-        file_path = resources.files("shmup.assets.images").joinpath('boss-shot.png')
-        with resources.as_file(file_path) as image_path:
-            image = pygame.image.load(image_path).convert_alpha()
-            BossShot.__image = pygame.transform.scale(image, (10, 40))  # Adjust size as necessary
+        return ("shmup.assets.images", "boss-shot.png"), (("scale", (10, 40)),)  # Adjust size as necessary
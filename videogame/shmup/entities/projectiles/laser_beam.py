@@ -1,6 +1,6 @@
 import pygame
 import math
-from importlib import resources
+from shmup.assets.asset_manager import AssetManager
 from shmup.entities.gameobject import GameObject
 from shmup.config import cfg_item
 
@@ -8,14 +8,12 @@ class LaserBeam(pygame.sprite.Sprite):
     """Class representing a laser beam sprite.
 
     Attributes:
-        __image (pygame.Surface): Class attribute holding the image for all instances.
-        image (pygame.Surface): The image of the laser beam.
+        image (pygame.Surface): The image of the laser beam, shared through the AssetManager.
+        mask (pygame.mask.Mask): The collision mask of the image, shared the same way.
         rect (pygame.Rect): The rectangle representing the laser beam's position and size.
         movement_direction (int): The direction of the laser beam's movement.
         movement_timer (float): Timer to control the movement direction change.
     """
-    
-    __image = None
 
     def __init__(self, position):
         """Initializes a laser beam with the given position.
@@ -25,13 +23,9 @@ class LaserBeam(pygame.sprite.Sprite):
         """
     def __init__(self, position):
         super().__init__()
-        if LaserBeam.__image is None:
-            file_path = resources.files("shmup.assets.images").joinpath('laser-beam.png')
-            with resources.as_file(file_path) as image_path:
-                image = pygame.image.load(image_path).convert_alpha()
-                image = pygame.transform.scale(image, (720, 100))  # Ajusta el tamaño según sea necesario
-                LaserBeam.__image = pygame.transform.rotate(image, 90)
-        self.image = LaserBeam.__image
+        assets = AssetManager.get_instance()
+        self.image = assets.image(*LaserBeam.image_asset())
+        self.mask = assets.mask(*LaserBeam.image_asset())
         self.rect = self.image.get_rect(topleft=position)
         self._initial_x = self.rect.x
         self._movement_amplitude = 1  # Amplitud del movimiento
@@ -63,4 +57,14 @@ class LaserBeam(pygame.sprite.Sprite):
         Returns:
             int: The width of the laser beam image.
         """
-        return LaserBeam.__image.get_width()
+        return AssetManager.get_instance().image(*LaserBeam.image_asset()).get_width()
+
+    @staticmethod
+    def image_asset():
+        """Gets the resource and transform of the laser beam image in the AssetManager.
+
+        Returns:
+            tuple: The (resource, transform) pair of the image.
+        """
+        # Ajusta el tamaño según sea necesario
+        return ("shmup.assets.images", "laser-beam.png"), (("scale", (720, 100)), ("rotate", 90))
@@ -1,50 +1,70 @@
-from importlib import resources
-
-import pygame
-
-from shmup.entities.projectiles.projectile import Projectile
+from shmup.assets.asset_manager import AssetManager
+from shmup.entities.projectiles.projectile_batch import ProjectileBatch
 from shmup.entities.projectiles.projectile_type import ProjectileType
-from shmup.config import cfg_item
+from shmup.config import cfg
 
-class ProjectileAllied(Projectile):
-    """Class representing an allied projectile.
+class ProjectileAllied(ProjectileBatch):
+    """Class holding all the allied projectiles.
 
     Attributes:
-        __image (pygame.Surface): Class attribute holding the image for all instances.
-        image (pygame.Surface): The image of the allied projectile.
+        __image (pygame.Surface): The image of the projectiles, shared through the AssetManager.
+        __mask (pygame.mask.Mask): The collision mask of the image, shared the same way.
+        image (pygame.Surface): The image of the allied projectiles.
     """
-    
-    __image = None
 
-    def __init__(self, position):
-        """Initializes an allied projectile with the given position.
+    def __init__(self, capacity):
+        """Initializes an empty batch of allied projectiles.
 
         Args:
-            position (tuple): The initial position of the allied projectile.
+            capacity (int): Number of projectiles the batch can hold before growing.
         """
-        velocity = cfg_item("entities", "projectiles", "allied", "velocity")
+        assets = AssetManager.get_instance()
+        self.__image = assets.image(*ProjectileAllied.image_asset())
+        self.__mask = assets.mask(*ProjectileAllied.image_asset())
 
-        if ProjectileAllied.__image is None:
-            file_path = resources.files(cfg_item("entities", "projectiles", "allied", "image_file")[0]).joinpath(cfg_item("entities", "projectiles", "allied", "image_file")[1])
-            with resources.as_file(file_path) as image_path:
-                ProjectileAllied.__image = pygame.image.load(image_path).convert_alpha()
+        super().__init__(capacity)
 
-        super().__init__(position, velocity)
+    @staticmethod
+    def image_asset():
+        """Gets the resource and transform of the allied projectile image in the AssetManager.
+
+        Returns:
+            tuple: The (resource, transform) pair of the image.
+        """
+        return cfg().entities.projectiles.allied.image_file, ()
 
     @property
     def image(self):
-        """Gets the image of the allied projectile.
+        """Gets the image of the allied projectiles.
+
+        Returns:
+            pygame.Surface: The image of the allied projectiles.
+        """
+        return self.__image
+
+    @property
+    def mask(self):
+        """Gets the collision mask of the allied projectiles.
+
+        Returns:
+            pygame.mask.Mask: The cached mask of the image.
+        """
+        return self.__mask
+
+    @property
+    def velocity(self):
+        """Gets the velocity allied projectiles are fired with.
 
         Returns:
-            pygame.Surface: The image of the allied projectile.
+            tuple: The configured velocity.
         """
-        return ProjectileAllied.__image
+        return cfg().entities.projectiles.allied.velocity
 
     @property
     def proj_type(self):
-        """Gets the type of the projectile.
+        """Gets the type of the projectiles.
 
         Returns:
-            ProjectileType: The type of the projectile, which is Allied.
+            ProjectileType: The type of the projectiles, which is Allied.
         """
-        return ProjectileType.Allied
\ No newline at end of file
+        return ProjectileType.Allied
@@ -0,0 +1,399 @@
+from abc import ABC, abstractmethod
+from itertools import repeat
+
+import numpy as np
+
+from shmup.config import cfg
+
+class ProjectileBatch(ABC):
+    """
+    Holds every projectile of one type in contiguous position and velocity arrays.
+
+    Projectiles are rows of the arrays instead of objects: moving them, dropping the ones that
+    leave the screen and testing them against a sprite are single vectorized steps over all the
+    rows, and rendering them is one Surface.blits call. Rows are kept packed at the front of the
+    arrays, removed rows are compacted away and the arrays grow by doubling, so firing and
+    removing projectiles allocates nothing in the steady state: the free rows are the pool the
+    projectiles are recycled from.
+
+    Once a batch holds game.collision_grid_threshold projectiles, collision queries go through
+    a uniform grid of game.collision_cell_size cells, rebuilt at most once per tick by sorting
+    the rows by cell. A query only tests the projectiles in the cells its rect overlaps, so its
+    cost follows the number of nearby projectiles. Projectiles killed by a hit are only flagged,
+    and compacted away together before the batch is next read or moved, so the index stays
+    valid for the whole collision pass. Below the threshold one rect test over every row takes
+    fewer NumPy calls than a grid query and sorting the rows every tick costs as much as the
+    tests it saves, so the grid is only worth it with thousands of projectiles against dozens
+    of sprites.
+
+    Subclasses provide the image, the collision mask and the velocity of their type.
+
+    Methods
+    -------
+    spawn(position):
+        Adds a projectile at the given position.
+    update(delta_time):
+        Moves every projectile and removes the ones that leave the screen.
+    render(surface_dst, alpha=1.0):
+        Blits every projectile on the given surface.
+    changed_rects():
+        Returns the areas drawn by the last two renders.
+    collide(sprite, dokill):
+        Returns the number of projectiles that hit the given sprite.
+    pool_stats():
+        Returns the size and hit rate of the pool of rows.
+    clear():
+        Removes every projectile.
+    release():
+        Releases the resources of the batch.
+    """
+
+    def __init__(self, capacity):
+        """
+        Initializes an empty batch.
+
+        Args:
+            capacity (int): Number of projectiles the arrays can hold before growing.
+        """
+        capacity = max(1, capacity)
+        self.__positions = np.empty((capacity, 2), dtype=np.float64)
+        self.__velocities = np.empty((capacity, 2), dtype=np.float64)
+        self.__alive = np.ones(capacity, dtype=bool)
+        self.__count = 0
+        self.__killed = 0  # Rows flagged dead by collide, still in the arrays
+        self.__step_time = 0
+        self.__spawned = 0
+        self.__recycled = 0  # Spawns served by a free row, without growing the arrays
+        self.__drawn_rects = ([], [])  # Rects of the previous and last renders
+
+        # Grid index: the live rows sorted by cell, None when the rows changed since it was built
+        self.__cell_order = None
+        self.__cell_keys = None
+
+    def __len__(self):
+        return self.__count - self.__killed
+
+    @property
+    @abstractmethod
+    def image(self):
+        """
+        Gets the image shared by the projectiles of the batch.
+
+        Returns:
+            pygame.Surface: The image of the projectiles.
+        """
+
+    @property
+    @abstractmethod
+    def mask(self):
+        """
+        Gets the collision mask shared by the projectiles of the batch.
+
+        Returns:
+            pygame.mask.Mask: The mask of the image.
+        """
+
+    @property
+    @abstractmethod
+    def velocity(self):
+        """
+        Gets the velocity new projectiles of the batch are fired with.
+
+        Returns:
+            tuple: The velocity in pixels per millisecond.
+        """
+
+    @property
+    def positions(self):
+        """
+        Gets the positions of the live projectiles.
+
+        Returns:
+            numpy.ndarray: Read-only view of shape (count, 2) with the top-left corners.
+        """
+        self.__remove_killed()
+        positions = self.__positions[:self.__count]
+        positions.flags.writeable = False
+        return positions
+
+    @property
+    def capacity(self):
+        """
+        Gets the number of projectiles the arrays can hold before growing.
+
+        Returns:
+            int: The capacity of the batch.
+        """
+        return len(self.__positions)
+
+    def spawn(self, position):
+        """
+        Adds a projectile at the given position, moving with the velocity of the batch.
+
+        Args:
+            position (tuple): The top-left corner of the projectile.
+        """
+        self.__remove_killed()
+        self.__spawned += 1
+        if self.__count == len(self.__positions):
+            self.__grow()
+        else:
+            self.__recycled += 1
+        self.__positions[self.__count] = position
+        self.__velocities[self.__count] = self.velocity
+        self.__count += 1
+        self.__cell_order = None
+
+    def update(self, delta_time):
+        """
+        Moves every projectile and removes the ones that leave the screen, in one vectorized step.
+
+        Args:
+            delta_time (float): The time elapsed since the last update.
+        """
+        count = self.__count
+        if count == 0:
+            return
+
+        self.__step_time = delta_time
+        positions = self.__positions[:count]
+        positions += self.__velocities[:count] * delta_time
+        self.__cell_order = None
+
+        game = cfg().game
+        x = positions[:, 0]
+        y = positions[:, 1]
+        keep = (x >= 0) & (x <= game.screen_width) & (y >= 0) & (y <= game.screen_height)
+        if self.__killed:
+            keep &= self.__alive[:count]
+        if not keep.all():
+            self.__compact(keep)
+
+    def render(self, surface_dst, alpha=1.0):
+        """
+        Blits every projectile on the given surface with a single call.
+
+        Args:
+            surface_dst (pygame.Surface): The surface to render the projectiles on.
+            alpha (float): Fraction of the simulation step elapsed since the last update, the
+                projectiles are drawn between their previous and current positions.
+
+        Returns:
+            list of pygame.Rect: The areas of the surface drawn, one per projectile.
+        """
+        self.__remove_killed()
+        count = self.__count
+        if count == 0:
+            rects = []
+        else:
+            positions = self.__positions[:count]
+            if alpha != 1.0:
+                # Projectiles move in a straight line, so the previous position is one step back along the velocity
+                positions = positions + self.__velocities[:count] * ((alpha - 1.0) * self.__step_time)
+            rects = surface_dst.blits(zip(repeat(self.image), positions.tolist()))
+        self.__drawn_rects = (self.__drawn_rects[1], rects)
+        return rects
+
+    def changed_rects(self):
+        """
+        Returns the areas drawn by the last two renders. Projectiles move on every step and
+        their rows are reordered when compacted, so all of them are taken as changed.
+
+        Returns:
+            list of pygame.Rect: The rects of the previous render followed by the ones of the last.
+        """
+        previous, last = self.__drawn_rects
+        return previous + last
+
+    def collide(self, sprite, dokill):
+        """
+        Returns the number of projectiles that hit the given sprite.
+
+        The grid index gives the projectiles in the cells around the sprite, their rects are
+        tested against the rect of the sprite at once, and the few rect hits are confirmed pixel
+        by pixel with the masks when the sprite has one.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite the projectiles may hit.
+            dokill (bool): Whether the projectiles that hit the sprite are removed.
+
+        Returns:
+            int: The number of projectiles that hit the sprite.
+        """
+        count = self.__count
+        if count == 0:
+            return 0
+
+        rect = sprite.rect
+        width, height = self.image.get_size()
+        candidates = self.__candidates(rect.left - width + 1, rect.top - height + 1, rect.right - 1, rect.bottom - 1)
+        if candidates is None:
+            positions = self.__positions[:count]
+        elif len(candidates) == 0:
+            return 0
+        else:
+            positions = self.__positions[candidates]
+
+        # Truncated like the coordinates of a pygame.Rect
+        corners = positions.astype(np.int64)
+        left = corners[:, 0]
+        top = corners[:, 1]
+        inside = (left < rect.right) & (left + width > rect.left) & (top < rect.bottom) & (top + height > rect.top)
+        if self.__killed:
+            inside &= self.__alive[:count] if candidates is None else self.__alive[candidates]
+        inside = np.flatnonzero(inside)
+        if len(inside) == 0:
+            return 0
+        hits = inside if candidates is None else candidates[inside]
+        left = left[inside]
+        top = top[inside]
+
+        sprite_mask = getattr(sprite, "mask", None)
+        if sprite_mask is not None:
+            mask = self.mask
+            hits = [hit for hit, x, y in zip(hits.tolist(), left.tolist(), top.tolist())
+                    if sprite_mask.overlap(mask, (x - rect.x, y - rect.y))]
+            if not hits:
+                return 0
+
+        if dokill:
+            self.__alive[hits] = False
+            self.__killed += len(hits)
+        return len(hits)
+
+    def pool_stats(self):
+        """
+        Returns the size and hit rate of the pool of rows the projectiles are recycled from.
+
+        Returns:
+            dict: The capacity, the live projectiles, the projectiles spawned and the fraction
+                of them that reused a free row instead of growing the arrays.
+        """
+        return {
+            "capacity": len(self.__positions),
+            "live": len(self),
+            "spawned": self.__spawned,
+            "hit_rate": self.__recycled / self.__spawned if self.__spawned else 1.0
+        }
+
+    def clear(self):
+        """
+        Removes every projectile.
+        """
+        self.__alive[:self.__count] = True
+        self.__count = 0
+        self.__killed = 0
+        self.__cell_order = None
+
+    def release(self):
+        """
+        Releases the resources of the batch. The arrays are kept for reuse.
+        """
+        pass
+
+    def __compact(self, keep):
+        """
+        Packs the projectiles to keep at the front of the arrays, preserving their order.
+
+        Args:
+            keep (numpy.ndarray): Boolean array with one entry per live projectile.
+        """
+        count = self.__count
+        kept = int(np.count_nonzero(keep))
+        self.__positions[:kept] = self.__positions[:count][keep]
+        self.__velocities[:kept] = self.__velocities[:count][keep]
+        self.__alive[:count] = True
+        self.__count = kept
+        self.__killed = 0
+        self.__cell_order = None
+
+    def __remove_killed(self):
+        """
+        Compacts away the projectiles killed by collide since the last compaction.
+        """
+        if self.__killed:
+            self.__compact(self.__alive[:self.__count].copy())
+
+    def __candidates(self, left, top, right, bottom):
+        """
+        Returns the projectiles whose top-left corner may lie in the given area, from the grid
+        index. The index is built first if the projectiles changed since it was last built.
+
+        Args:
+            left (int): The smallest x of the area.
+            top (int): The smallest y of the area.
+            right (int): The largest x of the area.
+            bottom (int): The largest y of the area.
+
+        Returns:
+            numpy.ndarray: Indexes of the candidate rows, a superset of the rows in the area.
+                None when there are fewer projectiles than game.collision_grid_threshold and
+                every row is a candidate.
+        """
+        game = cfg().game
+        if self.__count < game.collision_grid_threshold:
+            # With few projectiles testing them all is cheaper than indexing them
+            return None
+
+        cell_size = game.collision_cell_size
+        columns, rows = self.__grid_size(cell_size)
+        if self.__cell_order is None:
+            self.__build_index(cell_size, columns, rows)
+
+        # Clamped like the corners in __build_index, so corners off the screen are still found
+        first_column = min(max(left // cell_size, 0), columns - 1)
+        last_column = min(max(right // cell_size, 0), columns - 1)
+        first_row = min(max(top // cell_size, 0), rows - 1)
+        last_row = min(max(bottom // cell_size, 0), rows - 1)
+
+        # The cells of a row of the grid are contiguous in the sorted keys
+        row_keys = np.arange(first_row, last_row + 1) * columns
+        starts = np.searchsorted(self.__cell_keys, row_keys + first_column)
+        ends = np.searchsorted(self.__cell_keys, row_keys + last_column + 1)
+        if len(starts) == 1:
+            return self.__cell_order[starts[0]:ends[0]]
+        return np.concatenate([self.__cell_order[start:end] for start, end in zip(starts, ends)])
+
+    def __build_index(self, cell_size, columns, rows):
+        """
+        Sorts the live rows by the cell of the grid their top-left corner is in.
+
+        Args:
+            cell_size (int): The side of the cells in pixels.
+            columns (int): The number of columns of the grid.
+            rows (int): The number of rows of the grid.
+        """
+        cells = self.__positions[:self.__count].astype(np.int64) // cell_size
+        np.clip(cells[:, 0], 0, columns - 1, out=cells[:, 0])
+        np.clip(cells[:, 1], 0, rows - 1, out=cells[:, 1])
+        keys = cells[:, 1] * columns + cells[:, 0]
+        self.__cell_order = np.argsort(keys, kind="stable")
+        self.__cell_keys = keys[self.__cell_order]
+
+    @staticmethod
+    def __grid_size(cell_size):
+        """
+        Returns the size of the grid over the screen, which covers the screen edges too.
+
+        Args:
+            cell_size (int): The side of the cells in pixels.
+
+        Returns:
+            tuple: The number of columns and rows of the grid.
+        """
+        game = cfg().game
+        return game.screen_width // cell_size + 1, game.screen_height // cell_size + 1
+
+    def __grow(self):
+        """
+        Doubles the capacity of the arrays.
+        """
+        capacity = 2 * len(self.__positions)
+        positions = np.empty((capacity, 2), dtype=np.float64)
+        velocities = np.empty((capacity, 2), dtype=np.float64)
+        positions[:self.__count] = self.__positions[:self.__count]
+        velocities[:self.__count] = self.__velocities[:self.__count]
+        self.__positions = positions
+        self.__velocities = velocities
+        self.__alive = np.ones(capacity, dtype=bool)
+        self.__cell_order = None
@@ -1,51 +1,70 @@
-from importlib import resources
-
-import pygame
-
-from shmup.entities.projectiles.projectile import Projectile
+from shmup.assets.asset_manager import AssetManager
+from shmup.entities.projectiles.projectile_batch import ProjectileBatch
 from shmup.entities.projectiles.projectile_type import ProjectileType
-from shmup.config import cfg_item
+from shmup.config import cfg
 
-class ProjectileEnemy(Projectile):
-    """Class representing an enemy projectile.
+class ProjectileEnemy(ProjectileBatch):
+    """Class holding all the enemy projectiles.
 
     Attributes:
-        __image (pygame.Surface): Class attribute holding the image for all instances.
-        image (pygame.Surface): The image of the enemy projectile.
+        __image (pygame.Surface): The image of the projectiles, shared through the AssetManager.
+        __mask (pygame.mask.Mask): The collision mask of the image, shared the same way.
+        image (pygame.Surface): The image of the enemy projectiles.
     """
-    
-    __image = None
 
-    def __init__(self, position):
-        """Initializes an enemy projectile with the given position.
+    def __init__(self, capacity):
+        """Initializes an empty batch of enemy projectiles.
 
         Args:
-            position (tuple): The initial position of the enemy projectile.
+            capacity (int): Number of projectiles the batch can hold before growing.
         """
-        velocity = cfg_item("entities", "projectiles", "enemy", "velocity")
+        assets = AssetManager.get_instance()
+        self.__image = assets.image(*ProjectileEnemy.image_asset())
+        self.__mask = assets.mask(*ProjectileEnemy.image_asset())
 
-        if ProjectileEnemy.__image is None:
-            file_path = resources.files(cfg_item("entities", "projectiles", "enemy", "image_file")[0]).joinpath(cfg_item("entities", "projectiles", "enemy", "image_file")[1])
-            with resources.as_file(file_path) as image_path:
-                image = pygame.image.load(image_path).convert_alpha()
-                ProjectileEnemy.__image = pygame.transform.scale(image, (40, 40))
+        super().__init__(capacity)
 
-        super().__init__(position, velocity)
+    @staticmethod
+    def image_asset():
+        """Gets the resource and transform of the enemy projectile image in the AssetManager.
+
+        Returns:
+            tuple: The (resource, transform) pair of the image.
+        """
+        return cfg().entities.projectiles.enemy.image_file, (("scale", (40, 40)),)
 
     @property
     def image(self):
-        """Gets the image of the enemy projectile.
+        """Gets the image of the enemy projectiles.
+
+        Returns:
+            pygame.Surface: The image of the enemy projectiles.
+        """
+        return self.__image
+
+    @property
+    def mask(self):
+        """Gets the collision mask of the enemy projectiles.
+
+        Returns:
+            pygame.mask.Mask: The cached mask of the image.
+        """
+        return self.__mask
+
+    @property
+    def velocity(self):
+        """Gets the velocity enemy projectiles are fired with.
 
         Returns:
-            pygame.Surface: The image of the enemy projectile.
+            tuple: The configured velocity.
         """
-        return ProjectileEnemy.__image
+        return cfg().entities.projectiles.enemy.velocity
 
     @property
     def proj_type(self):
-        """Gets the type of the projectile.
+        """Gets the type of the projectiles.
 
         Returns:
-            ProjectileType: The type of the projectile, which is Enemy.
+            ProjectileType: The type of the projectiles, which is Enemy.
         """
         return ProjectileType.Enemy
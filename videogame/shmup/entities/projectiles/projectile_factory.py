@@ -1,28 +1,29 @@
-
+from shmup.config import cfg
 from shmup.entities.projectiles.projectile_allied import ProjectileAllied
 from shmup.entities.projectiles.projectile_enemy import ProjectileEnemy
 from shmup.entities.projectiles.projectile_type import ProjectileType
 
 class ProjectileFactory:
-    """Factory class for creating projectiles."""
+    """Factory class for creating the batches that hold the projectiles of each type."""
 
     @staticmethod
-    def create_projectile(projectile_type, position):
-        """Creates a projectile based on the given type and position.
+    def create_batch(projectile_type):
+        """Creates an empty projectile batch of the given type, sized with the configured capacity.
 
         Args:
-            projectile_type (ProjectileType): The type of the projectile to create (Allied or Enemy).
-            position (tuple): The initial position of the projectile.
+            projectile_type (ProjectileType): The type of the projectiles (Allied or Enemy).
 
         Returns:
-            Projectile: An instance of the projectile class corresponding to the given type.
+            ProjectileBatch: The batch corresponding to the given type.
 
         Raises:
             ValueError: If an invalid projectile type is provided.
         """
+        capacity = cfg().entities.projectiles.batch_capacity
+
         if projectile_type == ProjectileType.Allied:
-            return ProjectileAllied(position)
+            return ProjectileAllied(capacity)
         elif projectile_type == ProjectileType.Enemy:
-            return ProjectileEnemy(position)
+            return ProjectileEnemy(capacity)
         else:
             raise ValueError(f"Invalid projectile type: {projectile_type}")
@@ -1,17 +1,54 @@
+from operator import attrgetter
+
 import pygame
 
+def changed_areas(previous, current):
+    """
+    Returns the areas that differ between two frames, given what was drawn in each of them.
+
+    An item is unchanged when it is drawn with the same image at the same rect in both frames;
+    otherwise its previous and current rects are both changed. Items drawn in only one of the
+    frames change their only rect.
+
+    Args:
+        previous (iterable of tuple): The (key, image, rect) of every item drawn in the previous frame.
+        current (iterable of tuple): The (key, image, rect) of every item drawn in the current frame.
+
+    Returns:
+        list of pygame.Rect: The previous and current areas of the items that changed.
+    """
+    drawn = {key: (image, rect) for key, image, rect in previous}
+    rects = []
+    for key, image, rect in current:
+        previous_drawing = drawn.pop(key, None)
+        if previous_drawing is None:
+            rects.append(rect)
+        elif previous_drawing[0] is not image or previous_drawing[1] != rect:
+            rects += (previous_drawing[1], rect)
+    rects.extend(rect for _, rect in drawn.values())
+    return rects
+
+
 class RenderGroup(pygame.sprite.Group):
     """
     A group to manage multiple game objects, handling their input, events, rendering, and releasing resources.
 
+    The group draws the image of every sprite at its position with a single Surface.blits call
+    instead of calling the render method of each sprite, so sprites in a RenderGroup must draw
+    nothing else. When all the sprites are of one class whose instances share their image
+    (SHARED_IMAGE), the image is looked up once for the whole group.
+
+    The sprites, images and rects of the last two renders are kept, so the areas that changed
+    between them can be pushed to the display alone.
+
     Methods
     -------
     handle_input(key, is_pressed):
         Handles player input for all sprites in the group.
-    process_events(event):
-        Processes events for all sprites in the group.
-    render(surface_dst):
+    render(surface_dst, alpha=1.0):
         Renders all sprites in the group on the given surface.
+    changed_rects():
+        Returns the areas that changed between the last two renders.
     release():
         Releases resources for all sprites in the group.
     """
@@ -21,6 +58,7 @@ class RenderGroup(pygame.sprite.Group):
         Initializes the RenderGroup.
         """
         super().__init__()
+        self.__drawings = ((), ())  # (sprites, images, rects) of the previous and last renders
 
     def handle_input(self, key, is_pressed):
         """
@@ -33,25 +71,61 @@ class RenderGroup(pygame.sprite.Group):
         for sprite in self.sprites():
             sprite.handle_input(key, is_pressed)
 
-    def process_events(self, event):
+    def render(self, surface_dst, alpha=1.0):
         """
-        Processes events for all sprites in the group.
+        Renders all sprites in the group on the given surface with a single call.
 
         Args:
-            event (pygame.event.Event): The event to process.
+            surface_dst (pygame.Surface): The surface to render the sprites on.
+            alpha (float): Fraction of the simulation step elapsed since the last update, the
+                sprites are drawn between their previous and current positions.
+
+        Returns:
+            list of pygame.Rect: The areas of the surface drawn by the sprites.
         """
-        for sprite in self.sprites():
-            sprite.process_events(event)
+        sprites = self.sprites()
+        if not sprites:
+            return self._draw(surface_dst, sprites, [], [])
+
+        if alpha == 1.0:
+            positions = map(attrgetter("pos"), sprites)
+        else:
+            positions = [sprite.render_position(alpha) for sprite in sprites]
 
-    def render(self, surface_dst):
+        sprite_class = type(sprites[0])
+        if sprite_class.SHARED_IMAGE and all(type(sprite) is sprite_class for sprite in sprites):
+            return self._draw(surface_dst, sprites, [sprites[0].image] * len(sprites), positions)
+        return self._draw(surface_dst, sprites, list(map(attrgetter("image"), sprites)), positions)
+
+    def changed_rects(self):
         """
-        Renders all sprites in the group on the given surface.
+        Returns the areas that changed between the last two renders: the previous and current
+        rects of the sprites that moved or changed their image, and the rects of the sprites
+        added or removed in between.
+
+        Returns:
+            list of pygame.Rect: The areas that changed.
+        """
+        previous, last = self.__drawings
+        return changed_areas(zip(*previous), zip(*last))
+
+    def _draw(self, surface_dst, sprites, images, positions):
+        """
+        Blits the images of the sprites at their positions with a single call and keeps what
+        was drawn for changed_rects.
 
         Args:
             surface_dst (pygame.Surface): The surface to render the sprites on.
+            sprites (list of pygame.sprite.Sprite): The sprites drawn.
+            images (list of pygame.Surface): The image of each sprite.
+            positions (iterable): The position of each sprite.
+
+        Returns:
+            list of pygame.Rect: The areas of the surface drawn by the sprites.
         """
-        for sprite in self.sprites():
-            sprite.render(surface_dst)
+        rects = surface_dst.blits(zip(images, positions)) if sprites else []
+        self.__drawings = (self.__drawings[1], (sprites, images, rects))
+        return rects
 
     def release(self):
         """
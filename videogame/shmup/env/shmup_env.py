@@ -0,0 +1,252 @@
+import numpy as np
+import pygame
+
+from shmup.config import cfg
+from shmup.entities.projectiles.boss_shot import BossShot
+from shmup.entities.projectiles.laser_beam import LaserBeam
+from shmup.entities.projectiles.projectile_type import ProjectileType
+from shmup.random_streams import RandomStreams
+from shmup.simulation import Simulation
+
+class ShmupEnv:
+    """
+    Step/reset environment over a headless GamePlay, for training agents against the game.
+
+    Actions are indexes into ACTIONS and drive the hero directly, without building input events.
+    Observations are NumPy arrays of one of two kinds:
+
+    - "state": float32 vector with the hero position, then max_enemies rows of (present, x, y)
+      for the enemies closest to the bottom, max_projectiles rows of (present, x, y) for the
+      enemy projectiles closest to the hero, (present, x, y, health) for the boss, and then
+      max_boss_shots and max_laser_beams rows of (present, x, y) for the shots and laser beams
+      of the boss closest to the hero. Positions are divided by the screen size and health by
+      the full health of the boss.
+    - "pixels": uint8 (width, height, 3) copy of the offscreen surface the state is rendered on.
+      With copy_pixels False it is instead the view of surfarray.pixels3d, so no pixel is copied,
+      but the view locks the surface and is only valid until the next step: release or copy it
+      before stepping again.
+
+    The rewards are set in the env section of the configuration. The game uses singletons such as
+    the EventBus, so run one environment per process, VectorEnv runs many.
+
+    Methods
+    -------
+    observation_shape(observation):
+        Returns the shape of the observations of a kind.
+    observation_dtype(observation):
+        Returns the dtype of the observations of a kind.
+    reset(seed=None):
+        Starts a new episode and returns its first observation.
+    step(action):
+        Plays one action and returns the observation, reward, done flag and info.
+    close():
+        Releases the game.
+    """
+
+    # (left, right, fire) of every action
+    ACTIONS = ((False, False, False), (True, False, False), (False, True, False),
+               (False, False, True), (True, False, True), (False, True, True))
+    OBSERVATIONS = ("state", "pixels")
+
+    def __init__(self, observation="state", seed=None, delta_time=1000 / 60, copy_pixels=True):
+        """
+        Initializes the environment and its headless game.
+
+        Args:
+            observation (str): The kind of observations, "state" or "pixels".
+            seed (int): Seed of the first episode, None to seed from the system.
+            delta_time (float): Milliseconds simulated per tick.
+            copy_pixels (bool): Whether pixel observations are copies, or views of the surface
+                that are only valid until the next step.
+
+        Raises:
+            ValueError: If the kind of observations is unknown.
+        """
+        if observation not in ShmupEnv.OBSERVATIONS:
+            raise ValueError(f"Invalid observation: {observation}")
+        self.__observation = observation
+        self.__copy_pixels = copy_pixels
+        self.__simulation = Simulation(seed, delta_time, observation == "pixels")
+        self.__pressed = (False, False)
+        self.__kills = 0
+        self.__boss_health = None
+
+    @staticmethod
+    def observation_shape(observation):
+        """
+        Returns the shape of the observations of a kind.
+
+        Args:
+            observation (str): The kind of observations, "state" or "pixels".
+
+        Returns:
+            tuple: The shape of the observation arrays.
+        """
+        if observation == "pixels":
+            return (cfg().game.screen_width, cfg().game.screen_height, 3)
+        env = cfg().env
+        return (2 + 3 * env.max_enemies + 3 * env.max_projectiles + 4 + 3 * env.max_boss_shots + 3 * env.max_laser_beams,)
+
+    @staticmethod
+    def observation_dtype(observation):
+        """
+        Returns the dtype of the observations of a kind.
+
+        Args:
+            observation (str): The kind of observations, "state" or "pixels".
+
+        Returns:
+            numpy.dtype: The dtype of the observation arrays.
+        """
+        return np.dtype(np.uint8) if observation == "pixels" else np.dtype(np.float32)
+
+    def reset(self, seed=None):
+        """
+        Starts a new episode.
+
+        Args:
+            seed (int): Seed of the episode, None to continue the random streams of the previous one.
+
+        Returns:
+            numpy.ndarray: The first observation of the episode.
+        """
+        if seed is not None:
+            RandomStreams.get_instance().reseed(seed)
+        self.__simulation.reset()
+        self.__simulation.ticks = 0
+        self.__pressed = (False, False)
+        self.__kills = 0
+        self.__boss_health = None
+
+        if self.__observation == "pixels":
+            surface = self.__simulation.surface
+            surface.fill((0, 0, 0))
+            self.__simulation.gameplay.render(surface)
+        return self.__observe()
+
+    def step(self, action):
+        """
+        Plays an action for env.action_repeat ticks, or until the episode ends.
+
+        Args:
+            action (int): Index of the action in ACTIONS.
+
+        Returns:
+            tuple: The observation, the reward, whether the episode ended and an info dict with
+                the kills and ticks of the episode.
+        """
+        left, right, fire = ShmupEnv.ACTIONS[action]
+        env = cfg().env
+        gameplay = self.__simulation.gameplay
+        reward = 0.0
+
+        for _ in range(env.action_repeat):
+            hero = gameplay.hero
+            if hero is not None:
+                if left != self.__pressed[0]:
+                    hero.handle_input(pygame.K_LEFT, left)
+                if right != self.__pressed[1]:
+                    hero.handle_input(pygame.K_RIGHT, right)
+                self.__pressed = (left, right)
+                if fire:
+                    hero.handle_input(pygame.K_SPACE, True)
+
+            self.__simulation.step()
+            reward += self.__reward(env, gameplay)
+            if gameplay.done:
+                break
+
+        done = gameplay.done or self.__simulation.ticks >= env.max_episode_ticks
+        info = {"kills": gameplay.kills, "ticks": self.__simulation.ticks}
+        return self.__observe(), reward, done, info
+
+    def close(self):
+        """
+        Releases the game and shuts pygame down.
+        """
+        self.__simulation.release()
+
+    def __reward(self, env, gameplay):
+        """
+        Returns the reward of the last tick: kills, damage to the boss and death.
+
+        Args:
+            env (ConfigNode): The env section of the configuration.
+            gameplay (GamePlay): The gameplay state.
+
+        Returns:
+            float: The reward.
+        """
+        reward = (gameplay.kills - self.__kills) * env.kill_reward
+        self.__kills = gameplay.kills
+
+        boss = gameplay.boss
+        health = boss.health if boss is not None else 0
+        if self.__boss_health is not None and not gameplay.done:
+            reward += (self.__boss_health - health) * env.boss_hit_reward
+        self.__boss_health = health if boss is not None else None
+
+        if gameplay.done:
+            reward += env.death_reward
+        return reward
+
+    def __observe(self):
+        """
+        Returns the observation of the current tick.
+
+        Returns:
+            numpy.ndarray: The observation.
+        """
+        if self.__observation == "pixels":
+            if self.__copy_pixels:
+                return pygame.surfarray.array3d(self.__simulation.surface)
+            return pygame.surfarray.pixels3d(self.__simulation.surface)
+
+        game = cfg().game
+        env = cfg().env
+        gameplay = self.__simulation.gameplay
+        scale = np.array((game.screen_width, game.screen_height), dtype=np.float32)
+        observation = np.zeros(ShmupEnv.observation_shape("state"), dtype=np.float32)
+
+        hero = gameplay.hero
+        hero_position = np.array(hero.pos if hero is not None else (0, 0), dtype=np.float32)
+        observation[0:2] = hero_position / scale
+
+        offset = 2
+        enemies = sorted(gameplay.enemies, key=lambda enemy: enemy.pos.y, reverse=True)[:env.max_enemies]
+        rows = observation[offset:offset + 3 * env.max_enemies].reshape(env.max_enemies, 3)
+        for row, enemy in zip(rows, enemies):
+            row[0] = 1
+            row[1:] = np.asarray(enemy.pos) / scale
+
+        offset += 3 * env.max_enemies
+        positions = gameplay.projectile_positions(ProjectileType.Enemy)
+        if len(positions):
+            count = min(env.max_projectiles, len(positions))
+            distances = ((positions - hero_position) ** 2).sum(axis=1)
+            closest = np.argpartition(distances, count - 1)[:count] if count < len(positions) else slice(None)
+            rows = observation[offset:offset + 3 * env.max_projectiles].reshape(env.max_projectiles, 3)
+            rows[:count, 0] = 1
+            rows[:count, 1:] = positions[closest] / scale
+
+        offset += 3 * env.max_projectiles
+        boss = gameplay.boss
+        if boss is None:
+            return observation
+        observation[offset] = 1
+        observation[offset + 1:offset + 3] = np.asarray(boss.pos) / scale
+        observation[offset + 3] = boss.health / cfg().entities.boss.health
+
+        # Shots and beams share the group of the boss, each kind has its own slots
+        offset += 4
+        for kind, slots in ((BossShot, env.max_boss_shots), (LaserBeam, env.max_laser_beams)):
+            positions = np.array([shot.rect.topleft for shot in boss.laser_beams if type(shot) is kind],
+                                 dtype=np.float32).reshape(-1, 2)
+            count = min(slots, len(positions))
+            if count:
+                closest = np.argsort(((positions - hero_position) ** 2).sum(axis=1), kind="stable")[:count]
+                rows = observation[offset:offset + 3 * slots].reshape(slots, 3)
+                rows[:count, 0] = 1
+                rows[:count, 1:] = positions[closest] / scale
+            offset += 3 * slots
+        return observation
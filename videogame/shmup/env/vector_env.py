@@ -0,0 +1,209 @@
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from shmup.env.shmup_env import ShmupEnv
+
+def _worker(index, connection, num_envs, observation, seed, names):
+    """
+    Runs one ShmupEnv in a worker process, writing its results into the shared arrays.
+
+    Args:
+        index (int): Index of the environment in the batch.
+        connection (multiprocessing.connection.Connection): Pipe the commands arrive on.
+        num_envs (int): Number of environments in the batch.
+        observation (str): The kind of observations, "state" or "pixels".
+        seed (int): Seed of the first episode, None to seed from the system.
+        names (tuple of str): Names of the shared memory blocks of the observations, rewards and dones.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    memories = [shared_memory.SharedMemory(name=name) for name in names]
+    observations, rewards, dones = VectorEnv.arrays(num_envs, observation, memories)
+    # The observations are copied into the shared arrays, the pixels need no copy of their own
+    env = ShmupEnv(observation, seed, copy_pixels=False)
+
+    try:
+        while True:
+            command, value = connection.recv()
+            if command == "reset":
+                observations[index] = env.reset(value)
+                connection.send(None)
+            elif command == "step":
+                obs, reward, done, info = env.step(value)
+                if done:
+                    info["final_observation"] = np.array(obs)
+                    del obs
+                    obs = env.reset()
+                observations[index] = obs
+                rewards[index] = reward
+                dones[index] = done
+                # Drops the pixels view so the surface is unlocked for the next step
+                del obs
+                connection.send(info)
+            elif command == "close":
+                break
+    finally:
+        del observations, rewards, dones
+        for memory in memories:
+            memory.close()
+        env.close()
+        connection.close()
+
+
+class VectorEnv:
+    """
+    Steps a batch of ShmupEnv at once, one worker process per environment.
+
+    The observations, rewards and dones are written by the workers straight into arrays in shared
+    memory, so only the actions and info dicts go through the pipes. The arrays returned by reset
+    and step are those shared arrays: they are overwritten by the next step, copy them to keep them.
+    An environment whose episode ends is reset at once, its last observation is put in the info
+    dict under "final_observation".
+
+    The workers are spawned and load the configuration from its file, so overrides applied to
+    the Config of the calling process do not reach them.
+
+    Methods
+    -------
+    arrays(num_envs, observation, memories):
+        Returns the observations, rewards and dones arrays over shared memory blocks.
+    reset(seed=None):
+        Starts a new episode in every environment.
+    step(actions):
+        Plays one action in every environment.
+    close():
+        Stops the workers and frees the shared memory.
+    """
+
+    def __init__(self, num_envs, observation="state", seed=None):
+        """
+        Initializes the shared arrays and starts the workers.
+
+        Args:
+            num_envs (int): Number of environments.
+            observation (str): The kind of observations, "state" or "pixels".
+            seed (int): Seed of the first environment, the next ones get the following seeds.
+                None to seed them all from the system.
+
+        Raises:
+            ValueError: If the kind of observations is unknown.
+        """
+        if observation not in ShmupEnv.OBSERVATIONS:
+            raise ValueError(f"Invalid observation: {observation}")
+        self.__num_envs = num_envs
+        self.__seed = seed
+
+        shape = ShmupEnv.observation_shape(observation)
+        sizes = (num_envs * int(np.prod(shape)) * ShmupEnv.observation_dtype(observation).itemsize,
+                 num_envs * np.dtype(np.float64).itemsize,
+                 num_envs * np.dtype(np.bool_).itemsize)
+        self.__memories = [shared_memory.SharedMemory(create=True, size=size) for size in sizes]
+        self.__observations, self.__rewards, self.__dones = VectorEnv.arrays(num_envs, observation, self.__memories)
+
+        context = multiprocessing.get_context("spawn")
+        names = tuple(memory.name for memory in self.__memories)
+        self.__connections = []
+        self.__processes = []
+        for index in range(num_envs):
+            parent, child = context.Pipe()
+            process = context.Process(target=_worker, daemon=True,
+                                      args=(index, child, num_envs, observation, self.__env_seed(index, seed), names))
+            process.start()
+            child.close()
+            self.__connections.append(parent)
+            self.__processes.append(process)
+
+    @staticmethod
+    def arrays(num_envs, observation, memories):
+        """
+        Returns the observations, rewards and dones arrays over shared memory blocks.
+
+        Args:
+            num_envs (int): Number of environments.
+            observation (str): The kind of observations, "state" or "pixels".
+            memories (list of SharedMemory): The blocks of the observations, rewards and dones.
+
+        Returns:
+            tuple of numpy.ndarray: The observations, rewards and dones arrays.
+        """
+        shape = (num_envs,) + ShmupEnv.observation_shape(observation)
+        return (np.ndarray(shape, ShmupEnv.observation_dtype(observation), buffer=memories[0].buf),
+                np.ndarray((num_envs,), np.float64, buffer=memories[1].buf),
+                np.ndarray((num_envs,), np.bool_, buffer=memories[2].buf))
+
+    @property
+    def num_envs(self):
+        """
+        Returns the number of environments.
+
+        Returns:
+            int: The number of environments.
+        """
+        return self.__num_envs
+
+    def reset(self, seed=None):
+        """
+        Starts a new episode in every environment.
+
+        Args:
+            seed (int): Seed of the first environment, the next ones get the following seeds.
+                None to continue the random streams of the previous episodes.
+
+        Returns:
+            numpy.ndarray: The first observations, one row per environment.
+        """
+        for index, connection in enumerate(self.__connections):
+            connection.send(("reset", self.__env_seed(index, seed)))
+        for connection in self.__connections:
+            connection.recv()
+        return self.__observations
+
+    def step(self, actions):
+        """
+        Plays one action in every environment, in parallel.
+
+        Args:
+            actions (sequence of int): The action of every environment, see ShmupEnv.ACTIONS.
+
+        Returns:
+            tuple: The observations, rewards and dones arrays, one row per environment, and the
+                list of info dicts.
+        """
+        for connection, action in zip(self.__connections, actions):
+            connection.send(("step", int(action)))
+        infos = [connection.recv() for connection in self.__connections]
+        return self.__observations, self.__rewards, self.__dones, infos
+
+    def close(self):
+        """
+        Stops the workers and frees the shared memory.
+        """
+        for connection in self.__connections:
+            connection.send(("close", None))
+        for process in self.__processes:
+            process.join()
+        for connection in self.__connections:
+            connection.close()
+
+        del self.__observations, self.__rewards, self.__dones
+        for memory in self.__memories:
+            memory.close()
+            memory.unlink()
+
+    @staticmethod
+    def __env_seed(index, seed):
+        """
+        Returns the seed of an environment.
+
+        Args:
+            index (int): Index of the environment.
+            seed (int): Seed of the first environment, None for no seed.
+
+        Returns:
+            int: The seed of the environment, None if no seed was given.
+        """
+        return None if seed is None else seed + index
@@ -1,9 +1,164 @@
+from collections import deque
 from enum import Enum
+import threading
 
 class Events(Enum):
     HERO_FIRES = 0,  #pos = position of projectile to spawn
-    PROJECTILE_OUT_OF_SCREEN = 1   #proj = instance of projectile
     ENEMY_END_POINT = 2   #enemy = instance of enemy
     ENEMY_FIRES = 3,  #pos = position of projectile to spawn
-    EXPLOSION_FINISHED = 4   #explosion = instance of explosion
-    BOSS_KILLED = 5
\ No newline at end of file
+    BOSS_KILLED = 5   #boss = instance of boss
+
+
+class EventBus:
+    """
+    Singleton in-process event bus for the gameplay signals.
+
+    Handlers subscribe to a topic of Events and are called with the payload of the event as
+    keyword arguments, e.g. a HERO_FIRES handler receives pos. Published events are queued
+    and delivered by dispatch(), which the game calls once per tick, so events are handled in
+    the tick they are published in, only by their subscribers and without going through the
+    SDL event queue.
+
+    Attributes
+    ----------
+    depth : int
+        Number of events waiting to be dispatched.
+    max_depth : int
+        Largest number of events that waited to be dispatched at once.
+    published : int
+        Number of events published.
+
+    Methods
+    -------
+    get_instance():
+        Returns the singleton instance of the EventBus class.
+    subscribe(topic, handler):
+        Registers a handler for a topic.
+    unsubscribe(topic, handler):
+        Removes a handler of a topic.
+    publish(topic, **payload):
+        Queues an event.
+    dispatch():
+        Delivers the queued events to the handlers of their topics.
+    clear():
+        Drops the queued events.
+    stats():
+        Returns the queue metrics.
+    clear_stats():
+        Resets the queue metrics.
+    """
+
+    __instance = None
+    __instance_lock = threading.Lock()
+
+    @staticmethod
+    def get_instance():
+        """
+        Returns the singleton instance of the EventBus class. If the instance does not exist, it is created.
+
+        Returns:
+            EventBus: The singleton instance of the EventBus class.
+        """
+        if EventBus.__instance is None:
+            with EventBus.__instance_lock:
+                if EventBus.__instance is None:
+                    EventBus()
+        return EventBus.__instance
+
+    def __init__(self):
+        """
+        Initializes the EventBus with an empty dispatch table. Ensures only one instance of the
+        class exists.
+        """
+        if EventBus.__instance is None:
+            self.__handlers = {topic: () for topic in Events}
+            self.__queue = deque()
+            self.max_depth = 0
+            self.published = 0
+            EventBus.__instance = self
+        else:
+            raise Exception("There Can Be Only One EventBus!!!")
+
+    @property
+    def depth(self):
+        """
+        Returns the number of events waiting to be dispatched.
+
+        Returns:
+            int: The length of the queue.
+        """
+        return len(self.__queue)
+
+    def subscribe(self, topic, handler):
+        """
+        Registers a handler for a topic.
+
+        Args:
+            topic (Events): The topic to subscribe to.
+            handler (callable): Called with the payload of every event of the topic.
+        """
+        # Tuples are replaced, not mutated, so handlers can (un)subscribe while dispatching
+        self.__handlers[topic] = self.__handlers[topic] + (handler,)
+
+    def unsubscribe(self, topic, handler):
+        """
+        Removes a handler of a topic. Does nothing if the handler is not subscribed.
+
+        Args:
+            topic (Events): The topic to unsubscribe from.
+            handler (callable): The handler to remove.
+        """
+        self.__handlers[topic] = tuple(h for h in self.__handlers[topic] if h != handler)
+
+    def publish(self, topic, **payload):
+        """
+        Queues an event until the next dispatch.
+
+        Args:
+            topic (Events): The topic of the event.
+            **payload: The data of the event, passed to the handlers as keyword arguments.
+
+        Raises:
+            TypeError: If the topic is not one of Events.
+        """
+        if type(topic) is not Events:
+            raise TypeError(f"Invalid event topic: {topic!r}")
+        self.__queue.append((topic, payload))
+        self.published += 1
+        if len(self.__queue) > self.max_depth:
+            self.max_depth = len(self.__queue)
+
+    def dispatch(self):
+        """
+        Delivers the queued events to the handlers of their topics, in publishing order.
+        Events published by the handlers are delivered in the same dispatch.
+        """
+        queue = self.__queue
+        handlers = self.__handlers
+        while queue:
+            topic, payload = queue.popleft()
+            for handler in handlers[topic]:
+                handler(**payload)
+
+    def clear(self):
+        """
+        Drops the queued events without delivering them, so events published by a state that
+        is left do not reach the next one.
+        """
+        self.__queue.clear()
+
+    def stats(self):
+        """
+        Returns the queue metrics.
+
+        Returns:
+            dict: The current depth, the maximum depth and the number of published events.
+        """
+        return {"depth": self.depth, "max_depth": self.max_depth, "published": self.published}
+
+    def clear_stats(self):
+        """
+        Resets the maximum depth and the number of published events.
+        """
+        self.max_depth = len(self.__queue)
+        self.published = 0
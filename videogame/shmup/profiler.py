@@ -0,0 +1,144 @@
+import csv
+import math
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager, nullcontext
+
+def percentile(samples, q):
+    """
+    Returns the q-th percentile of the samples using the nearest-rank method.
+
+    Args:
+        samples (list of float): The samples, in any order.
+        q (float): The percentile to compute, between 0 and 100.
+
+    Returns:
+        float: The percentile, or 0.0 if there are no samples.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class Profiler:
+    """
+    Collects the time spent in named phases of a frame.
+
+    With a window, only the latest samples of every phase are kept, so the summary is a rolling
+    one that can be shown while the game runs.
+
+    Methods
+    -------
+    phase(name):
+        Context manager that times the enclosed block as one sample of the named phase.
+    samples(name):
+        Returns the samples in milliseconds recorded for a phase.
+    summary():
+        Returns p50/p95/p99, max and mean per phase.
+    export_csv(path):
+        Writes every sample to a CSV file.
+    clear():
+        Discards all samples.
+    """
+
+    def __init__(self, window=None):
+        """
+        Initializes an empty profiler.
+
+        Args:
+            window (int): Number of latest samples kept per phase, None to keep them all.
+        """
+        self.__samples = defaultdict(list) if window is None else defaultdict(lambda: deque(maxlen=window))
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Times the enclosed block and records it as one sample of the named phase.
+
+        Args:
+            name (str): The name of the phase.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.__samples[name].append((time.perf_counter() - start) * 1000)
+
+    def phases(self):
+        """
+        Returns the names of the phases recorded so far, in recording order.
+
+        Returns:
+            list of str: The phase names.
+        """
+        return list(self.__samples)
+
+    def samples(self, name):
+        """
+        Returns the samples recorded for a phase.
+
+        Args:
+            name (str): The name of the phase.
+
+        Returns:
+            list of float: The samples in milliseconds.
+        """
+        return list(self.__samples.get(name, []))
+
+    def summary(self):
+        """
+        Returns the p50/p95/p99, max and mean in milliseconds of every phase.
+
+        Returns:
+            dict: Mapping of phase name to a dict with p50, p95, p99, max, mean and count.
+        """
+        summary = {}
+        for name, samples in self.__samples.items():
+            summary[name] = {
+                "p50": percentile(samples, 50),
+                "p95": percentile(samples, 95),
+                "p99": percentile(samples, 99),
+                "max": max(samples) if samples else 0.0,
+                "mean": sum(samples) / len(samples) if samples else 0.0,
+                "count": len(samples)
+            }
+        return summary
+
+    def export_csv(self, path):
+        """
+        Writes every sample to a CSV file, one row per sample with its phase, index and duration.
+
+        Args:
+            path (str): The path of the CSV file.
+        """
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["phase", "sample", "ms"])
+            for name, samples in self.__samples.items():
+                for index, sample in enumerate(samples):
+                    writer.writerow([name, index, f"{sample:.4f}"])
+
+    def clear(self):
+        """
+        Discards all samples.
+        """
+        self.__samples.clear()
+
+
+class NullProfiler:
+    """
+    Profiler that records nothing, used when no profiling is requested.
+    """
+
+    __context = nullcontext()
+
+    def phase(self, name):
+        """
+        Returns a context manager that does nothing.
+
+        Args:
+            name (str): The name of the phase, ignored.
+        """
+        return NullProfiler.__context
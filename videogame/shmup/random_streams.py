@@ -0,0 +1,92 @@
+import random
+import threading
+
+class RandomStreams:
+    """
+    Singleton class that provides the named random number generators of the game.
+
+    Every stream is a random.Random seeded from the session seed and its own name, so one seed
+    reproduces every stream, and drawing more numbers from one stream, e.g. because the boss
+    fires more often, does not change the numbers of the others.
+
+    Attributes
+    ----------
+    seed : int
+        The seed of the session.
+
+    Methods
+    -------
+    get_instance():
+        Returns the singleton instance of the RandomStreams class.
+    reseed(seed=None):
+        Seeds every stream from a new session seed.
+    stream(name):
+        Returns the named stream.
+    """
+
+    __instance = None
+    __instance_lock = threading.Lock()
+
+    @staticmethod
+    def get_instance():
+        """
+        Returns the singleton instance of the RandomStreams class. If the instance does not exist, it is created.
+
+        Returns:
+            RandomStreams: The singleton instance of the RandomStreams class.
+        """
+        if RandomStreams.__instance is None:
+            with RandomStreams.__instance_lock:
+                if RandomStreams.__instance is None:
+                    RandomStreams()
+        return RandomStreams.__instance
+
+    def __init__(self):
+        """
+        Initializes the RandomStreams with a seed drawn from the system. Ensures only one instance of the class exists.
+        """
+        if RandomStreams.__instance is None:
+            self.__streams = {}
+            self.reseed()
+            RandomStreams.__instance = self
+        else:
+            raise Exception("There Can Be Only One RandomStreams!!!")
+
+    @property
+    def seed(self):
+        """
+        Returns the seed of the session.
+
+        Returns:
+            int: The seed every stream is derived from.
+        """
+        return self.__seed
+
+    def reseed(self, seed=None):
+        """
+        Seeds every stream, including the ones already handed out, from a new session seed.
+
+        Args:
+            seed (int): The seed of the session, None to draw one from the system.
+        """
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        self.__seed = seed
+        for name, stream in self.__streams.items():
+            stream.seed(f"{seed}:{name}")
+
+    def stream(self, name):
+        """
+        Returns the named stream, creating it the first time it is asked for.
+
+        Args:
+            name (str): The name of the stream, e.g. "spawn", "enemy" or "boss".
+
+        Returns:
+            random.Random: The random number generator of the stream.
+        """
+        stream = self.__streams.get(name)
+        if stream is None:
+            stream = random.Random(f"{self.__seed}:{name}")
+            self.__streams[name] = stream
+        return stream
@@ -0,0 +1,132 @@
+import struct
+
+import pygame
+
+# File layout, little endian: a header with the seed of the session, then one frame record per
+# frame with its delta time, each followed by the records of the input events of the frame.
+MAGIC = b"SHRP"
+VERSION = 1
+HEADER = struct.Struct("<4sHq")     # magic, version, seed
+FRAME = struct.Struct("<Bd")        # tag, delta time in milliseconds
+EVENT = struct.Struct("<BIiHI")     # tag, event type, key, modifiers, unicode code point
+FRAME_TAG = 0
+EVENT_TAG = 1
+
+# Only the events that change the session are recorded
+RECORDED_EVENTS = (pygame.KEYDOWN, pygame.KEYUP, pygame.QUIT)
+
+
+class ReplayRecorder:
+    """
+    Writes the frames of a session and their input events to a compact binary file.
+
+    Together with the seed of the RandomStreams, the delta time and input events of every
+    frame are all a session depends on, so a ReplayPlayer can reproduce it exactly.
+
+    Methods
+    -------
+    record(delta_time, events):
+        Writes one frame.
+    close():
+        Closes the file.
+    """
+
+    def __init__(self, path, seed):
+        """
+        Creates the file and writes its header.
+
+        Args:
+            path (str): The path of the file.
+            seed (int): The seed of the RandomStreams of the session.
+        """
+        self.__file = open(path, "wb")
+        self.__file.write(HEADER.pack(MAGIC, VERSION, seed))
+
+    def record(self, delta_time, events):
+        """
+        Writes one frame with its input events.
+
+        Args:
+            delta_time (float): The time elapsed since the previous frame.
+            events (list of pygame.event.Event): The events of the frame, the ones that are not
+                input are skipped.
+        """
+        self.__file.write(FRAME.pack(FRAME_TAG, delta_time))
+        for event in events:
+            if event.type in RECORDED_EVENTS:
+                text = getattr(event, "unicode", "")
+                self.__file.write(EVENT.pack(EVENT_TAG, event.type, getattr(event, "key", 0),
+                                             getattr(event, "mod", 0), ord(text[0]) if text else 0))
+
+    def close(self):
+        """
+        Closes the file.
+        """
+        self.__file.close()
+
+
+class ReplayPlayer:
+    """
+    Reads a file written by a ReplayRecorder and plays its frames back.
+
+    Attributes
+    ----------
+    seed : int
+        The seed of the RandomStreams of the recorded session.
+
+    Methods
+    -------
+    frames():
+        Yields the delta time and input events of every frame.
+    """
+
+    def __init__(self, path):
+        """
+        Reads the file and checks its header.
+
+        Args:
+            path (str): The path of the file.
+
+        Raises:
+            ValueError: If the file is not a replay or was written by another version.
+        """
+        with open(path, "rb") as file:
+            self.__data = file.read()
+
+        magic, version, self.seed = HEADER.unpack_from(self.__data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a replay file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version: {version}")
+
+    def frames(self):
+        """
+        Yields the delta time and input events of every frame, in order.
+
+        Yields:
+            tuple: The delta time and the list of pygame.event.Event of a frame.
+
+        Raises:
+            ValueError: If the file is corrupt.
+        """
+        data = self.__data
+        offset = HEADER.size
+        delta_time = None
+        events = []
+        while offset < len(data):
+            tag = data[offset]
+            if tag == FRAME_TAG:
+                if delta_time is not None:
+                    yield delta_time, events
+                _, delta_time = FRAME.unpack_from(data, offset)
+                events = []
+                offset += FRAME.size
+            elif tag == EVENT_TAG:
+                _, event_type, key, mod, code_point = EVENT.unpack_from(data, offset)
+                events.append(pygame.event.Event(event_type, key=key, mod=mod,
+                                                 unicode=chr(code_point) if code_point else ""))
+                offset += EVENT.size
+            else:
+                raise ValueError(f"Corrupt replay record at byte {offset}")
+        if delta_time is not None:
+            yield delta_time, events
@@ -0,0 +1,191 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+import pygame
+
+from shmup.assets.asset_manager import AssetManager
+from shmup.assets.flipbook import FlipBook
+from shmup.assets.text_cache import TextCache
+from shmup.config import cfg_item
+from shmup.profiler import NullProfiler
+from shmup.random_streams import RandomStreams
+from shmup.states.gameplay import GamePlay
+
+class Simulation:
+    """
+    Steps a GamePlay state without a window, video background, mixer or frame cap.
+
+    The world advances by a caller-supplied delta time on every tick, so it runs as fast as
+    the CPU allows and the same seed and delta always produce the same session.
+
+    Attributes
+    ----------
+    ticks : int
+        Number of ticks stepped since the simulation was created.
+
+    Methods
+    -------
+    step(delta_time=None):
+        Advances the simulation by one tick.
+    run(ticks):
+        Advances the simulation by the given number of ticks.
+    handle_input(event):
+        Forwards an input event to the gameplay state.
+    reset():
+        Restarts the gameplay state after a game over.
+    release():
+        Releases the gameplay state and shuts pygame down.
+    """
+
+    def __init__(self, seed=None, delta_time=1000 / 60, render=False, profiler=None):
+        """
+        Initializes a headless display, seeds the random generators and enters the gameplay state.
+
+        Args:
+            seed (int): Seed for the random generator and the RandomStreams, None to seed from the system.
+            delta_time (float): Default time in milliseconds simulated by each tick.
+            render (bool): Whether each tick also renders the state to an offscreen surface.
+            profiler (Profiler): Profiler that times the update and render phases, None to skip timing.
+        """
+        # The dummy driver gives convert_alpha() a display format without opening a window
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.font.init()
+        self.__surface = pygame.display.set_mode(cfg_item("game", "screen_size"))
+
+        random.seed(seed)
+        RandomStreams.get_instance().reseed(seed)
+
+        self.__delta_time = delta_time
+        self.__render = render
+        self.__profiler = profiler if profiler else NullProfiler()
+        self.ticks = 0
+
+        self.__gameplay = GamePlay()
+        self.__gameplay.profiler = self.__profiler
+        self.__gameplay.enter()
+
+    @property
+    def gameplay(self):
+        """
+        Returns the simulated gameplay state.
+
+        Returns:
+            GamePlay: The simulated gameplay state.
+        """
+        return self.__gameplay
+
+    @property
+    def surface(self):
+        """
+        Returns the offscreen surface the state is rendered on.
+
+        Returns:
+            pygame.Surface: The offscreen surface.
+        """
+        return self.__surface
+
+    @property
+    def done(self):
+        """
+        Returns whether the gameplay state has finished, i.e. the hero was killed.
+
+        Returns:
+            bool: True if the gameplay state has finished, False otherwise.
+        """
+        return self.__gameplay.done
+
+    def step(self, delta_time=None):
+        """
+        Advances the simulation by one tick: processes pending events, updates and optionally renders.
+
+        Args:
+            delta_time (float): Time in milliseconds to simulate, None to use the default delta time.
+        """
+        if delta_time is None:
+            delta_time = self.__delta_time
+
+        for event in pygame.event.get():
+            if event.type == pygame.USEREVENT:
+                self.__gameplay.process_events(event)
+            else:
+                self.__gameplay.handle_input(event)
+
+        with self.__profiler.phase("update"):
+            self.__gameplay.update(delta_time)
+
+        if self.__render:
+            self.__surface.fill((0, 0, 0))
+            with self.__profiler.phase("render"):
+                self.__gameplay.render(self.__surface)
+
+        self.ticks += 1
+
+    def run(self, ticks):
+        """
+        Advances the simulation by the given number of ticks, restarting after every game over.
+
+        Args:
+            ticks (int): Number of ticks to simulate.
+
+        Returns:
+            float: The wall time in seconds spent simulating.
+        """
+        start = time.perf_counter()
+        for _ in range(ticks):
+            if self.done:
+                self.reset()
+            self.step()
+        return time.perf_counter() - start
+
+    def handle_input(self, event):
+        """
+        Forwards an input event to the gameplay state, as the state manager would.
+
+        Args:
+            event (pygame.event.Event): The KEYDOWN or KEYUP event to forward.
+        """
+        self.__gameplay.handle_input(event)
+
+    def reset(self):
+        """
+        Restarts the gameplay state after a game over.
+        """
+        self.__gameplay.exit()
+        self.__gameplay.enter()
+
+    def release(self):
+        """
+        Releases the gameplay state, drops the cached assets and shuts pygame down.
+        """
+        self.__gameplay.release()
+        self.__gameplay.exit()
+        # Fonts and surfaces cached across the game do not survive pygame.quit()
+        AssetManager.get_instance().clear()
+        TextCache.get_instance().clear()
+        FlipBook.clear()
+        pygame.quit()
+
+
+def main(args=None):
+    if args is None:
+        args = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(prog="shmup.simulation", description="Runs the gameplay headless and reports ticks per second.")
+    parser.add_argument("--ticks", type=int, default=10000, help="number of ticks to simulate")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random generator")
+    parser.add_argument("--delta", type=float, default=1000 / 60, help="milliseconds simulated per tick")
+    parser.add_argument("--render", action="store_true", help="also render every tick to an offscreen surface")
+    options = parser.parse_args(args)
+
+    simulation = Simulation(options.seed, options.delta, options.render)
+    elapsed = simulation.run(options.ticks)
+    simulation.release()
+
+    print(f"{options.ticks} ticks in {elapsed:.3f} s ({options.ticks / elapsed:.0f} ticks/s)")
+
+if __name__ == "__main__":
+    sys.exit(main())
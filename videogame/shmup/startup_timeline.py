@@ -0,0 +1,96 @@
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+class StartupTimeline:
+    """
+    Records when every step of the launch starts and ends, and on which thread, to show where the
+    time to the first frame goes.
+
+    Methods
+    -------
+    span(name):
+        Returns a context manager that records a step of the launch.
+    finish(name):
+        Records the end of the launch and prints the timeline.
+    report():
+        Returns the timeline as text.
+    """
+
+    def __init__(self):
+        """
+        Starts the timeline now.
+        """
+        self.__start = time.perf_counter()
+        self.__spans = []  # (name, thread name, start, end) in milliseconds since the start
+        self.__lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name):
+        """
+        Returns a context manager that records a step of the launch. Steps may run on any thread.
+
+        Args:
+            name (str): The name of the step.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self.__lock:
+                self.__spans.append((name, threading.current_thread().name,
+                                     (start - self.__start) * 1000, (end - self.__start) * 1000))
+
+    def finish(self, name):
+        """
+        Records the end of the launch as an instant step and prints the timeline.
+
+        Args:
+            name (str): The name of the last step, such as the first frame shown.
+        """
+        now = (time.perf_counter() - self.__start) * 1000
+        with self.__lock:
+            self.__spans.append((name, threading.current_thread().name, now, now))
+        print(self.report())
+
+    def report(self):
+        """
+        Returns the timeline as text, one step per line in order of start, with its start, its
+        duration and its thread.
+
+        Returns:
+            str: The timeline.
+        """
+        with self.__lock:
+            spans = sorted(self.__spans, key=lambda span: (span[2], -span[3]))
+        lines = [f"{'start (ms)':>10} {'took (ms)':>10}  {'thread':<16} step"]
+        for name, thread, start, end in spans:
+            lines.append(f"{start:10.1f} {end - start:10.1f}  {thread:<16} {name}")
+        return "\n".join(lines)
+
+
+class NullStartupTimeline:
+    """
+    Startup timeline that records nothing, used when no startup profile is requested.
+    """
+
+    __context = nullcontext()
+
+    def span(self, name):
+        """
+        Returns a context manager that does nothing.
+
+        Args:
+            name (str): The name of the step, ignored.
+        """
+        return NullStartupTimeline.__context
+
+    def finish(self, name):
+        """
+        Does nothing.
+
+        Args:
+            name (str): The name of the last step, ignored.
+        """
+        pass
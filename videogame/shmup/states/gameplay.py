@@ -1,62 +1,115 @@
-import random
+import logging
+
 import pygame
-from moviepy.editor import VideoFileClip
 from shmup.states.state import State
-from shmup.entities.rendergroup import RenderGroup
+from shmup.entities.rendergroup import RenderGroup, changed_areas
+from shmup.entities.collision import collide_mask
 from shmup.entities.hero import Hero
-from shmup.events import Events
+from shmup.events import Events, EventBus
 from shmup.entities.projectiles.projectile_factory import ProjectileFactory
 from shmup.entities.projectiles.projectile_type import ProjectileType
-from shmup.config import cfg_item
+from shmup.config import cfg
 from shmup.entities.enemies.enemy_factory import EnemyFactory, EnemyType
+from shmup.entities.enemies.enemy_avenger import EnemyAvenger
+from shmup.entities.enemies.enemy_raptor import EnemyRaptor
 from shmup.entities.explosion import Explosion
+from shmup.entities.explosion_group import ExplosionGroup
 from shmup.entities.movement_type import MovementType
 from shmup.entities.enemies.boss import Boss
+from shmup.entities.projectiles.boss_shot import BossShot
 from shmup.entities.projectiles.laser_beam import LaserBeam
-from importlib import resources
-
+from shmup.entities.projectiles.projectile_allied import ProjectileAllied
+from shmup.entities.projectiles.projectile_enemy import ProjectileEnemy
+from shmup.assets.asset_manager import AssetManager
+from shmup.assets.text_cache import TextCache
+from shmup.random_streams import RandomStreams
 
+logger = logging.getLogger(__name__)
 
 class GamePlay(State):
 
     ''' 
     Manages the gameplay state, including player, enemies, projectiles, explosions, and the boss.
     '''
+
+    EXPLOSION_SOUND = ("shmup.assets.sounds", "explosion.mp3")
+    HUD_FONT = (("shmup.assets.fonts", "Sansation.ttf"), 20)
+    HUD_POSITION = (10, 10)
+
     def __init__(self):
         super().__init__()
 
+        assets = AssetManager.get_instance()
+        assets.preload(**GamePlay.assets())
+
         self.__players = RenderGroup()
-        self.__projectiles_allied = RenderGroup()
-        self.__projectiles_enemy = RenderGroup()
+        self.__projectiles_allied = ProjectileFactory.create_batch(ProjectileType.Allied)
+        self.__projectiles_enemy = ProjectileFactory.create_batch(ProjectileType.Enemy)
         self.__enemies = RenderGroup()
-        self.__explosions = RenderGroup()
+        self.__explosions = ExplosionGroup()
         self.__boss = None
+        self.__drawings = ([], [])  # (key, image, rect) of the boss, its shots and the HUD in the previous and last renders
+        self.__hud_font = assets.font(*GamePlay.HUD_FONT)
+        self.__text_cache = TextCache.get_instance()
         self.__enemies_destroyed = 0
+        self.__kills = 0
         self.__max_enemies_destroyed = 20
         self.__enemy_spawn = True
+        self.__random = RandomStreams.get_instance().stream("spawn")
 
         self.next_state = "Intro"
+        self.__event_bus = EventBus.get_instance()
+        self.__event_handlers = {
+            Events.HERO_FIRES: self.__on_hero_fires,
+            Events.ENEMY_FIRES: self.__on_enemy_fires,
+            Events.ENEMY_END_POINT: self.__on_enemy_end_point,
+            Events.BOSS_KILLED: self.__kill_boss
+        }
         
-        explosion_sound_path = resources.files("shmup.assets.sounds").joinpath('explosion.mp3')
-        with resources.as_file(explosion_sound_path) as sound_path:
-            self.__explosion_sound = pygame.mixer.Sound(sound_path)
+        self.__explosion_sound = assets.sound(GamePlay.EXPLOSION_SOUND)
 
+    @staticmethod
+    def assets():
+        """
+        Returns the assets used during gameplay, as keyword arguments of AssetManager.preload.
 
+        Returns:
+            dict: The images, masks, sounds and fonts of the gameplay.
+        """
+        masks = [Hero.image_asset(), EnemyAvenger.image_asset(), EnemyRaptor.image_asset(),
+                 Boss.image_asset(), BossShot.image_asset(), LaserBeam.image_asset(),
+                 ProjectileAllied.image_asset(), ProjectileEnemy.image_asset()]
+        return {
+            "images": masks + [Explosion.image_asset()],
+            "masks": masks,
+            "sounds": [Hero.sound_asset(), GamePlay.EXPLOSION_SOUND],
+            "fonts": [GamePlay.HUD_FONT]
+        }
 
     def enter(self):
         """
         Initializes the state when entered.
         """
         self.done = False
+        self.__kills = 0
+        # A state left during the boss fight has the spawner stopped, every session starts spawning
+        self.__enemies_destroyed = 0
+        self.__enemy_spawn = True
+        self.__event_bus.clear()
+        for topic, handler in self.__event_handlers.items():
+            self.__event_bus.subscribe(topic, handler)
         self.__players.add(Hero(MovementType.HORIZONTAL))
 
     def exit(self):
         """
         Cleans up the state when exited.
         """
+        for topic, handler in self.__event_handlers.items():
+            self.__event_bus.unsubscribe(topic, handler)
+        self.__event_bus.clear()
         self.__players.empty()
-        self.__projectiles_allied.empty()
-        self.__projectiles_enemy.empty()
+        self.__projectiles_allied.clear()
+        self.__projectiles_enemy.clear()
         self.__enemies.empty()
         self.__explosions.empty()
         if self.__boss:
@@ -76,17 +129,13 @@ class GamePlay(State):
 
     def process_events(self, event):
         """
-        Processes various game events.
+        Processes various game events. Gameplay signals do not arrive here, they are delivered
+        by the EventBus to the handlers subscribed in enter().
 
         Args:
             event (pygame.event.Event): The game event to process.
         """
-        self.__handle_events(event)
-        self.__players.process_events(event)
-        self.__projectiles_allied.process_events(event)
-        self.__projectiles_enemy.process_events(event)
-        self.__enemies.process_events(event)
-        self.__explosions.process_events(event)
+        pass
 
     def update(self, delta_time):
         """
@@ -108,23 +157,56 @@ class GamePlay(State):
             self.__boss.update(delta_time)
             self.__boss.laser_beams.update(delta_time)
 
-        self.__detect_collisions()
+        with self.profiler.phase("collisions"):
+            self.__detect_collisions()
+
+        self.__event_bus.dispatch()
 
-    def render(self, surface_dst):
+    def render(self, surface_dst, alpha=1.0):
         """
         Renders the state on the given surface.
 
         Args:
             surface_dst (pygame.Surface): The surface to render the state on.
-        """
-        self.__players.render(surface_dst)
-        self.__projectiles_allied.render(surface_dst)
-        self.__projectiles_enemy.render(surface_dst)
-        self.__enemies.render(surface_dst)
-        self.__explosions.render(surface_dst)
+            alpha (float): Fraction of the simulation step elapsed since the last update, moving
+                entities are drawn between their previous and current positions.
+
+        Returns:
+            list of pygame.Rect: The areas of the surface drawn.
+        """
+        rects = self.__players.render(surface_dst, alpha)
+        rects += self.__projectiles_allied.render(surface_dst, alpha)
+        rects += self.__projectiles_enemy.render(surface_dst, alpha)
+        rects += self.__enemies.render(surface_dst, alpha)
+        rects += self.__explosions.render(surface_dst, alpha)
+        drawings = []
         if self.__boss:
-            self.__boss.render(surface_dst)
-            self.__boss.laser_beams.draw(surface_dst)
+            # The boss draws its shots too, its rects come first and then theirs
+            boss_rects = self.__boss.render(surface_dst, alpha)
+            shots = self.__boss.laser_beams.sprites()
+            drawings += zip([self.__boss, *shots], [self.__boss.image, *(shot.image for shot in shots)], boss_rects)
+            text = self.__text_cache.render(self.__hud_font, f"Boss: {self.__boss.health}", (255, 255, 255))
+            drawings.append((GamePlay.HUD_POSITION, text, surface_dst.blit(text, GamePlay.HUD_POSITION)))
+            rects += (rect for _, _, rect in drawings)
+        self.__drawings = (self.__drawings[1], drawings)
+        return rects
+
+    def changed_rects(self):
+        """
+        Returns the areas that changed between the last two renders: the ones of the sprites
+        that moved, changed their image, appeared or disappeared, and the ones of every projectile.
+
+        Returns:
+            list of pygame.Rect: The areas that changed.
+        """
+        rects = self.__players.changed_rects()
+        rects += self.__projectiles_allied.changed_rects()
+        rects += self.__projectiles_enemy.changed_rects()
+        rects += self.__enemies.changed_rects()
+        rects += self.__explosions.changed_rects()
+        previous, last = self.__drawings
+        rects += changed_areas(previous, last)
+        return rects
 
     def release(self):
         """
@@ -138,52 +220,143 @@ class GamePlay(State):
         if self.__boss:
             self.__boss.release()
 
-    def __handle_events(self, event):
+    @property
+    def hero(self):
+        """
+        Returns the hero, or None once it has been killed.
+
+        Returns:
+            Hero: The hero instance or None.
+        """
+        players = self.__players.sprites()
+        return players[0] if players else None
+
+    @property
+    def enemies(self):
+        """
+        Returns the enemies in the game, boss not included.
+
+        Returns:
+            list of Enemy: The enemies.
+        """
+        return self.__enemies.sprites()
+
+    @property
+    def kills(self):
+        """
+        Returns the number of enemies killed since the state was entered, boss not included.
+
+        Returns:
+            int: The number of enemies killed.
+        """
+        return self.__kills
+
+    @property
+    def boss(self):
+        """
+        Returns the boss, or None if it has not been spawned.
+
+        Returns:
+            Boss: The boss instance or None.
+        """
+        return self.__boss
+
+    @property
+    def enemy_spawn(self):
+        """
+        Returns whether enemies are spawned automatically.
+
+        Returns:
+            bool: True if enemies are spawned automatically, False otherwise.
+        """
+        return self.__enemy_spawn
+
+    @enemy_spawn.setter
+    def enemy_spawn(self, value):
+        self.__enemy_spawn = value
+
+    def entity_counts(self):
+        """
+        Returns the number of entities in each group of the state.
+
+        Returns:
+            dict: Mapping of group name to the number of entities it holds.
+        """
+        return {
+            "players": len(self.__players),
+            "projectiles_allied": len(self.__projectiles_allied),
+            "projectiles_enemy": len(self.__projectiles_enemy),
+            "enemies": len(self.__enemies),
+            "explosions": len(self.__explosions),
+            "laser_beams": len(self.__boss.laser_beams) if self.__boss else 0
+        }
+
+    def projectile_pool_stats(self):
+        """
+        Returns the size and hit rate of the pool of every projectile batch.
+
+        Returns:
+            dict: The pool stats of the allied and enemy projectiles, see ProjectileBatch.pool_stats.
+        """
+        return {
+            "allied": self.__projectiles_allied.pool_stats(),
+            "enemy": self.__projectiles_enemy.pool_stats()
+        }
+
+    def projectile_positions(self, proj_type):
         """
-        Internal method to handle custom events.
+        Returns the positions of the projectiles of a type.
 
         Args:
-            event (pygame.event.Event): The custom event to handle.
-        """
-        if event.event == Events.HERO_FIRES:
-            self.__spawn_projectile(ProjectileType.Allied, event.pos)
-        elif event.event == Events.ENEMY_FIRES:
-            self.__spawn_projectile(ProjectileType.Enemy, event.pos)
-        elif event.event == Events.PROJECTILE_OUT_OF_SCREEN:
-            self.__kill_projectile(event.proj)
-        elif event.event == Events.ENEMY_END_POINT:
-            self.__kill_enemy(event.enemy)
-        elif event.event == Events.EXPLOSION_FINISHED:
-            self.__kill_explosion(event.explosion)
-        elif event.event == Events.BOSS_KILLED:
-            self.__kill_boss(event.boss)
-
-    def __spawn_projectile(self, proj_type, position):
+            proj_type (ProjectileType): The type of the projectiles.
+
+        Returns:
+            numpy.ndarray: Read-only view of shape (count, 2) with the top-left corners.
         """
-        Spawns a projectile of the given type at the specified position.
+        if proj_type == ProjectileType.Allied:
+            return self.__projectiles_allied.positions
+        return self.__projectiles_enemy.positions
+
+    def __on_hero_fires(self, pos):
+        """
+        Handles the HERO_FIRES event.
 
         Args:
-            proj_type (ProjectileType): The type of projectile to spawn.
-            position (tuple): The position to spawn the projectile at.
+            pos (tuple): The position of the projectile to spawn.
         """
-        projectile = ProjectileFactory.create_projectile(proj_type, position)
+        self.spawn_projectile(ProjectileType.Allied, pos)
 
-        if proj_type == ProjectileType.Allied:
-            self.__projectiles_allied.add(projectile)
-        elif proj_type == ProjectileType.Enemy:
-            self.__projectiles_enemy.add(projectile)
+    def __on_enemy_fires(self, pos):
+        """
+        Handles the ENEMY_FIRES event.
 
-    def __kill_projectile(self, projectile):
+        Args:
+            pos (tuple): The position of the projectile to spawn.
         """
-        Removes a projectile from the game.
+        self.spawn_projectile(ProjectileType.Enemy, pos)
+
+    def __on_enemy_end_point(self, enemy):
+        """
+        Handles the ENEMY_END_POINT event, unless the enemy was killed in the same tick.
 
         Args:
-            projectile (Projectile): The projectile to remove.
+            enemy (Enemy): The enemy that reached its end point.
+        """
+        if enemy.alive():
+            self.__kill_enemy(enemy)
+
+    def spawn_projectile(self, proj_type, position):
         """
-        if projectile.proj_type == ProjectileType.Allied:
-            self.__projectiles_allied.remove(projectile)
-        elif projectile.proj_type == ProjectileType.Enemy:
-            self.__projectiles_enemy.remove(projectile)
+        Spawns a projectile of the given type at the specified position.
+
+        Args:
+            proj_type (ProjectileType): The type of projectile to spawn.
+            position (tuple): The position to spawn the projectile at.
+        """
+        if proj_type == ProjectileType.Allied:
+            self.__projectiles_allied.spawn(position)
+        elif proj_type == ProjectileType.Enemy:
+            self.__projectiles_enemy.spawn(position)
 
     def __spawn_enemy(self):
         """
@@ -194,24 +367,40 @@ class GamePlay(State):
                 return
    
             enemy_list = [EnemyType.Avenger, EnemyType.Raptor]
-            enemy_type = random.choice(enemy_list)
+            enemy_type = self.__random.choice(enemy_list)
 
-            padding = cfg_item("entities", "enemies", "enemy_padding")
+            game = cfg().game
+            padding = cfg().entities.enemies.enemy_padding
 
             if enemy_type == EnemyType.Avenger:
-                x = cfg_item("game", "screen_size")[0] / 2
+                x = game.screen_width / 2
                 y_rows = [padding, padding + 80, padding + 160]
-                y = random.choice(y_rows)
+                y = self.__random.choice(y_rows)
                 position_init = (x, y)
-                position_end = (x, cfg_item("game", "screen_size")[1] + padding)
+                position_end = (x, game.screen_height + padding)
             
             elif enemy_type == EnemyType.Raptor:
-                x = random.randint(padding, cfg_item("game", "screen_size")[0] - padding)
+                x = self.__random.randint(padding, game.screen_width - padding)
                 position_init = (x, -padding)
-                position_end = (x, cfg_item("game", "screen_size")[1] + padding)
+                position_end = (x, game.screen_height + padding)
 
-            enemy = EnemyFactory.create_enemy(enemy_type, position_init, position_end)
-            self.__enemies.add(enemy)
+            self.spawn_enemy(enemy_type, position_init, position_end)
+
+    def spawn_enemy(self, enemy_type, position_init, position_end):
+        """
+        Spawns an enemy of the given type that moves between the given positions.
+
+        Args:
+            enemy_type (EnemyType): The type of enemy to spawn.
+            position_init (tuple): The position to spawn the enemy at.
+            position_end (tuple): The position where the enemy leaves the game.
+
+        Returns:
+            Enemy: The spawned enemy.
+        """
+        enemy = EnemyFactory.create_enemy(enemy_type, position_init, position_end)
+        self.__enemies.add(enemy)
+        return enemy
 
     def __kill_enemy(self, enemy):
         """
@@ -222,20 +411,25 @@ class GamePlay(State):
         """
         self.__enemies.remove(enemy)
         self.__enemies_destroyed += 1
-        print(f"Enemies destroyed: {self.__enemies_destroyed}")
+        self.__kills += 1
+        logger.debug("Enemies destroyed: %d", self.__enemies_destroyed)
         if self.__enemies_destroyed >= self.__max_enemies_destroyed:
             self.__enemy_spawn = False
             if len(self.__enemies) == 0:
-                print("Spawning Boss")
-                self.__spawn_boss()
+                logger.debug("Spawning Boss")
+                self.spawn_boss()
 
-    def __spawn_boss(self):
+    def spawn_boss(self):
         """
         Spawns the boss enemy.
+
+        Returns:
+            Boss: The spawned boss.
         """
         boss_position_init = (40, -300)  # Initial position above the screen
         boss_position_end = (40, 0)  # Position in the game screen
         self.__boss = Boss(boss_position_init, boss_position_end)
+        return self.__boss
         
     def __kill_boss(self, boss):
         """
@@ -245,7 +439,7 @@ class GamePlay(State):
             boss (Boss): The boss to remove.
         """
         self.__boss = None
-        print("Boss Killed")
+        logger.debug("Boss Killed")
         self.__enemies_destroyed = 0
         self.__enemy_spawn = True
 
@@ -256,23 +450,15 @@ class GamePlay(State):
         Args:
             position (tuple): The position to spawn the explosion at.
         """
-        self.__explosions.add(Explosion(position))
-        self.__explosion_sound.play()  # Reproduce el sonido de explosión
-
-    def __kill_explosion(self, explosion):
-        """
-        Removes an explosion from the game.
-
-        Args:
-            explosion (Explosion): The explosion to remove.
-        """
-        self.__explosions.remove(explosion)
+        self.__explosions.spawn(position)
+        if self.__explosion_sound:
+            self.__explosion_sound.play()  # Reproduce el sonido de explosión
 
     def __game_over(self):
         """
         Handles game over conditions.
         """
-        print("Game Over")
+        logger.debug("Game Over")
         self.done = True
         self.__enemies_destroyed = 0
         self.__enemy_spawn = True
@@ -280,21 +466,30 @@ class GamePlay(State):
     def __detect_collisions(self):
         """
         Detects and handles collisions between various game objects.
+
+        Each projectile batch is tested against a player, enemy or boss in one vectorized rect
+        test over all its projectiles, through its grid index when the batch is large enough. The
+        shots of the boss are a few dozen sprites at most and are tested with spritecollide. Hits
+        are pixel-accurate: the rect hits are confirmed with the cached collision masks of the images.
         """
-        for player in pygame.sprite.groupcollide(self.__players, self.__projectiles_enemy, True, True).keys():
-            self.__spawn_explosion(player.pos)
-            self.__game_over()
+        for player in self.__players.sprites():
+            if self.__projectiles_enemy.collide(player, True):
+                player.kill()
+                self.__spawn_explosion(player.pos)
+                self.__game_over()
 
-        for enemy in pygame.sprite.groupcollide(self.__enemies, self.__projectiles_allied, True, True).keys():
-            self.__spawn_explosion(enemy.pos)
-            self.__kill_enemy(enemy)
-            print("Enemy Killed")
+        for enemy in self.__enemies.sprites():
+            if self.__projectiles_allied.collide(enemy, True):
+                enemy.kill()
+                self.__spawn_explosion(enemy.pos)
+                self.__kill_enemy(enemy)
+                logger.debug("Enemy Killed")
 
         if self.__boss:
             for player in self.__players:
-                if pygame.sprite.spritecollide(player, self.__boss.laser_beams, True):
+                if pygame.sprite.spritecollide(player, self.__boss.laser_beams, True, collide_mask):
                     self.__spawn_explosion(player.pos)
                     self.__game_over()
-                if pygame.sprite.spritecollide(self.__boss, self.__projectiles_allied, True):
+                if self.__projectiles_allied.collide(self.__boss, True):
                     self.__boss.take_damage(1)  # Reduce vida del jefe
-                    print("Boss Hit")
\ No newline at end of file
+                    logger.debug("Boss Hit")
@@ -1,7 +1,8 @@
-from importlib import resources
 import pygame
+from shmup.assets.asset_manager import AssetManager
+from shmup.assets.text_cache import TextCache
 from shmup.states.state import State
-from shmup.config import cfg_item
+from shmup.config import cfg
 
 class Intro(State):
     """
@@ -11,6 +12,10 @@ class Intro(State):
     ----------
     font : pygame.font.Font
         Font used for rendering text.
+    __text_cache : TextCache
+        Cache of the rendered menu options.
+    __positions : list of tuple
+        Centered position of every menu option.
     options : list of str
         List of menu options.
     selected_option : int
@@ -20,6 +25,8 @@ class Intro(State):
 
     Methods
     -------
+    assets():
+        Returns the assets used by the menu.
     enter():
         Initializes the state when entered.
     exit():
@@ -30,26 +37,43 @@ class Intro(State):
         Processes various game events.
     update(delta_time):
         Updates the state with the given delta time.
-    render(surface_dst):
+    render(surface_dst, alpha=1.0):
         Renders the state on the given surface.
     release():
         Releases resources for the state.
     """
 
+    FONT = (("shmup.assets.fonts", "Sansation.ttf"), 32)
+
     def __init__(self):
         """
         Initializes the Intro state.
         """
         super().__init__()
 
-        file_path = resources.files("shmup.assets.fonts").joinpath('Sansation.ttf')
-        with resources.as_file(file_path) as font_image_path:
-            self.font = pygame.font.Font(font_image_path, 32)
+        self.font = AssetManager.get_instance().font(*Intro.FONT)
+
+        self.__text_cache = TextCache.get_instance()
 
         self.options = ["Start Game"]
         self.selected_option = 0
         self.next_state = None
 
+        game = cfg().game
+        self.__positions = [(game.screen_width // 2 - self.font.size(option)[0] // 2,
+                             game.screen_height // 2 + i * 40)
+                            for i, option in enumerate(self.options)]
+
+    @staticmethod
+    def assets():
+        """
+        Returns the assets used by the menu, as keyword arguments of AssetManager.preload.
+
+        Returns:
+            dict: The fonts of the menu.
+        """
+        return {"fonts": [Intro.FONT]}
+
     def enter(self):
         """
         Initializes the state when entered.
@@ -101,20 +125,21 @@ class Intro(State):
         """
         pass
 
-    def render(self, surface_dst):
+    def render(self, surface_dst, alpha=1.0):
         """
         Renders the state on the given surface.
 
         Args:
             surface_dst (pygame.Surface): The surface to render on.
+            alpha (float): Fraction of the simulation step elapsed, ignored as the menu does not move.
+
+        Returns:
+            None: The whole surface is repainted.
         """
         surface_dst.fill((0, 0, 0))  # Clear screen
         for i, option in enumerate(self.options):
             color = (255, 255, 255) if i == self.selected_option else (100, 100, 100)
-            text_surface = self.font.render(option, True, color)
-            position = (cfg_item("game", "screen_size")[0] // 2 - text_surface.get_width() // 2,
-                        cfg_item("game", "screen_size")[1] // 2 + i * 40)
-            surface_dst.blit(text_surface, position)
+            surface_dst.blit(self.__text_cache.render(self.font, option, color), self.__positions[i])
 
     def release(self):
         """
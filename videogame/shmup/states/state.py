@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from shmup.profiler import NullProfiler
+
 class State(ABC):
     """
     An abstract base class for defining game states.
@@ -12,6 +14,8 @@ class State(ABC):
         The identifier of the next state to transition to.
     previous_state : str
         The identifier of the previous state.
+    profiler : Profiler
+        Profiler that times the phases of the state, a NullProfiler by default.
 
     Methods
     -------
@@ -25,10 +29,17 @@ class State(ABC):
         Abstract method to process various game events.
     update(delta_time):
         Abstract method to update the state with the given delta time.
-    render(surface_dst):
-        Abstract method to render the state on the given surface.
+    render(surface_dst, alpha=1.0):
+        Abstract method to render the state on the given surface, alpha being the fraction of
+        the simulation step elapsed since the last update. Returns the list of rects drawn, or
+        None if the state repainted the whole surface.
+    changed_rects():
+        Returns the areas that changed between the last two renders, None by default to take
+        every area drawn in both as changed.
     release():
         Abstract method to release resources for the state.
+    entity_counts():
+        Returns the number of entities in each group of the state, none by default.
     """
 
 
@@ -36,6 +47,7 @@ class State(ABC):
         self.done = False
         self.next_state = ""
         self.previous_state = ""
+        self.profiler = NullProfiler()
 
     @abstractmethod
     def enter(self):
@@ -58,9 +70,15 @@ class State(ABC):
         pass
 
     @abstractmethod
-    def render(self, surface_dst):
+    def render(self, surface_dst, alpha=1.0):
         pass
 
     @abstractmethod
     def release(self):
-        pass
\ No newline at end of file
+        pass
+
+    def changed_rects(self):
+        return None
+
+    def entity_counts(self):
+        return {}
@@ -1,22 +1,44 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pygame
 
+from shmup.assets.asset_manager import AssetManager
 from shmup.states.intro import Intro
 from shmup.states.gameplay import GamePlay
 
 class StateManager:
 
+    # States are built the first time they are entered, so launching builds only the Intro
+    STATES = {
+        "Intro": Intro,
+        "GamePlay": GamePlay
+    }
+
     def __init__(self):
         """
-        Initializes the StateManager with the available states and sets the initial state.
+        Initializes the StateManager and enters the initial state. The assets of the other states
+        are loaded once prefetch() is called.
         """
-        self.__states = {
-            "Intro": Intro(),
-            "GamePlay": GamePlay()
-        }
+        self.__states = {}
+        self.__prefetches = {}  # Pending loads of the assets of the states not built yet
+        self.__profiler = None
 
         self.__current_state_name = "Intro"
-        self.__current_state = self.__states[self.__current_state_name]
+        self.__current_state = self.__get_state(self.__current_state_name)
         self.__current_state.enter()
+        self.__prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+
+    def prefetch(self):
+        """
+        Starts loading the assets of the states not built yet in the background.
+
+        While the menu waits for the player, a worker decodes and converts the images and sounds
+        of the other states, so building them on the switch loads nothing from disk. It is called
+        once the first frame is shown, so the worker does not compete with the launch.
+        """
+        for name, state_class in StateManager.STATES.items():
+            if name not in self.__states and name not in self.__prefetches:
+                self.__prefetches[name] = self.__prefetcher.submit(AssetManager.get_instance().preload, **state_class.assets())
 
     def process_events(self, event):
         """
@@ -42,19 +64,33 @@ class StateManager:
 
         self.__current_state.update(delta_time)
 
-    def render(self, surface_dst):
+    def render(self, surface_dst, alpha=1.0):
         """
         Renders the current state on the given surface.
 
         Args:
             surface_dst (pygame.Surface): The surface to render on.
+            alpha (float): Fraction of the simulation step elapsed since the last update.
+
+        Returns:
+            list of pygame.Rect: The areas drawn by the state, None if it repainted the whole surface.
+        """
+        return self.__current_state.render(surface_dst, alpha)
+
+    def changed_rects(self):
+        """
+        Returns the areas the current state changed between its last two renders.
+
+        Returns:
+            list of pygame.Rect: The areas that changed, None if every area drawn in both renders may have.
         """
-        self.__current_state.render(surface_dst)
+        return self.__current_state.changed_rects()
 
     def release(self):
         """
-        Releases resources for the current state.
+        Releases resources for the current state and stops the prefetching.
         """
+        self.__prefetcher.shutdown(cancel_futures=True)
         self.__current_state.release()
         self.__current_state.exit()
 
@@ -66,11 +102,45 @@ class StateManager:
 
         previous_state = self.__current_state_name
         self.__current_state_name = self.__current_state.next_state
-        self.__current_state = self.__states[self.__current_state_name]
+        self.__current_state = self.__get_state(self.__current_state_name)
         self.__current_state.previous_state = previous_state
 
         self.__current_state.enter()
         
+    def set_profiler(self, profiler):
+        """
+        Sets the profiler that times the phases of every state.
+
+        Args:
+            profiler (Profiler): The profiler, also given to the states built later.
+        """
+        self.__profiler = profiler
+        for state in self.__states.values():
+            state.profiler = profiler
+
+    def __get_state(self, name):
+        """
+        Returns the state with the given name, building it the first time once its assets are
+        prefetched.
+
+        Args:
+            name (str): The name of the state.
+
+        Returns:
+            State: The state instance.
+        """
+        state = self.__states.get(name)
+        if state is None:
+            prefetch = self.__prefetches.pop(name, None)
+            if prefetch is not None:
+                # Only waits if the player was faster than the prefetch
+                prefetch.result()
+            state = StateManager.STATES[name]()
+            if self.__profiler is not None:
+                state.profiler = self.__profiler
+            self.__states[name] = state
+        return state
+
     def get_state(self):
         """
         Returns the current state instance.
@@ -0,0 +1,60 @@
+import pygame
+
+class StaticBackground:
+    """
+    Still background of the screen, cached in the display pixel format.
+
+    Besides repainting the whole screen, it can restore just some areas of it, which is what
+    dirty-rectangle rendering needs to erase the sprites drawn in the previous frame.
+
+    Methods
+    -------
+    render(surface_dst):
+        Blits the whole background on the given surface.
+    restore(surface_dst, rects):
+        Blits the given areas of the background on the given surface.
+    release():
+        Drops the cached background.
+    """
+
+    def __init__(self, screen_size, image_path=None, color=(0, 0, 0)):
+        """
+        Builds the cached background.
+
+        Args:
+            screen_size (tuple): The size of the screen.
+            image_path (str): The path to the background image, scaled to the screen size.
+                None to use a solid color.
+            color (tuple): The color of the background when there is no image.
+        """
+        self.__surface = pygame.Surface(screen_size).convert()
+        if image_path:
+            image = pygame.image.load(image_path).convert()
+            pygame.transform.scale(image, screen_size, self.__surface)
+        else:
+            self.__surface.fill(color)
+
+    def render(self, surface_dst):
+        """
+        Blits the whole background on the given surface.
+
+        Args:
+            surface_dst (pygame.Surface): The surface to render the background on.
+        """
+        surface_dst.blit(self.__surface, (0, 0))
+
+    def restore(self, surface_dst, rects):
+        """
+        Blits the given areas of the background on the given surface, erasing what was drawn there.
+
+        Args:
+            surface_dst (pygame.Surface): The surface to restore.
+            rects (list of pygame.Rect): The areas to restore.
+        """
+        surface_dst.blits(((self.__surface, rect, rect) for rect in rects), doreturn=False)
+
+    def release(self):
+        """
+        Drops the cached background.
+        """
+        self.__surface = None
@@ -0,0 +1,103 @@
+import pygame
+
+from shmup.assets.asset_manager import AssetManager
+from shmup.config import cfg
+
+class TimingOverlay:
+    """
+    Panel drawn over the game with the rolling p50/p95/max of every phase of the frame and the
+    number of entities in every group of the current state.
+
+    The panel is rebuilt every game.timing_overlay.refresh_interval milliseconds and blitted as is
+    in between, so showing the overlay barely changes the timings it shows. Its lines change on
+    every refresh, so they are rendered straight with the font instead of going through the
+    TextCache, where they would only evict the menu and HUD text.
+
+    Attributes
+    ----------
+    visible : bool
+        Whether the overlay is drawn.
+
+    Methods
+    -------
+    toggle():
+        Shows or hides the overlay.
+    update(delta_time, entity_counts):
+        Rebuilds the text when the refresh interval has elapsed.
+    render(surface_dst):
+        Draws the overlay on the given surface.
+    """
+
+    FONT = (("shmup.assets.fonts", "Sansation.ttf"), 14)
+    COLOR = (255, 255, 0)
+    BACKGROUND_COLOR = (0, 0, 0, 170)
+    PADDING = 6
+
+    def __init__(self, profiler):
+        """
+        Initializes a hidden overlay.
+
+        Args:
+            profiler (Profiler): The rolling profiler whose phases are shown.
+        """
+        self.__profiler = profiler
+        self.__font = AssetManager.get_instance().font(*TimingOverlay.FONT)
+        self.__panel = None
+        self.__elapsed = 0
+        self.visible = False
+
+    def toggle(self):
+        """
+        Shows or hides the overlay.
+        """
+        self.visible = not self.visible
+        self.__elapsed = cfg().game.timing_overlay.refresh_interval
+
+    def update(self, delta_time, entity_counts):
+        """
+        Rebuilds the text of the overlay when the refresh interval has elapsed.
+
+        Args:
+            delta_time (float): The time elapsed since the last update.
+            entity_counts (dict): Mapping of group name to the number of entities it holds.
+        """
+        if not self.visible:
+            return
+
+        self.__elapsed += delta_time
+        if self.__elapsed < cfg().game.timing_overlay.refresh_interval:
+            return
+        self.__elapsed = 0
+
+        budget = 1000 / cfg().game.fps
+        lines = [f"phase (ms, budget {budget:.1f})   p50   p95   max"]
+        for name, summary in self.__profiler.summary().items():
+            lines.append(f"{name:<16} {summary['p50']:6.2f} {summary['p95']:6.2f} {summary['max']:6.2f}")
+        for name, count in entity_counts.items():
+            lines.append(f"{name:<16} {count:6d}")
+
+        surfaces = [self.__font.render(line, True, TimingOverlay.COLOR) for line in lines]
+        line_height = self.__font.get_linesize()
+        padding = TimingOverlay.PADDING
+        width = max(surface.get_width() for surface in surfaces) + 2 * padding
+        height = line_height * len(surfaces) + 2 * padding
+
+        if self.__panel is None or self.__panel.get_size() != (width, height):
+            self.__panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.__panel.fill(TimingOverlay.BACKGROUND_COLOR)
+        self.__panel.blits([(surface, (padding, padding + i * line_height)) for i, surface in enumerate(surfaces)],
+                           doreturn=False)
+
+    def render(self, surface_dst):
+        """
+        Draws the overlay in the top right corner of the given surface.
+
+        Args:
+            surface_dst (pygame.Surface): The surface to render the overlay on.
+
+        Returns:
+            pygame.Rect: The area of the surface drawn, None if the overlay is hidden.
+        """
+        if not self.visible or self.__panel is None:
+            return None
+        return surface_dst.blit(self.__panel, (surface_dst.get_width() - self.__panel.get_width(), 0))
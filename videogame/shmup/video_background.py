@@ -0,0 +1,229 @@
+from collections import deque
+import math
+import queue
+import threading
+import time
+
+import pygame
+
+from shmup.config import cfg_item
+from shmup.video_cache import VideoCache
+
+class PlaybackClock:
+    """
+    Wall clock that tells which video frame is due, independently of the game loop rate.
+
+    Frame numbers are absolute and keep growing while the video loops; the frame of the video
+    to show is the frame number modulo the number of frames.
+
+    Methods
+    -------
+    frame_number():
+        Returns the absolute number of the frame due now.
+    """
+
+    def __init__(self, fps):
+        """
+        Starts the clock.
+
+        Args:
+            fps (float): Frames per second of the video.
+        """
+        self.__fps = fps
+        self.__start = time.perf_counter()
+
+    def frame_number(self):
+        """
+        Returns the absolute number of the frame due now.
+
+        Returns:
+            int: Number of frames elapsed since the clock started.
+        """
+        return int((time.perf_counter() - self.__start) * self.__fps)
+
+
+class VideoBackground:
+    """
+    Plays a looping video as the background of the screen.
+
+    Frames are decoded and converted to the display pixel format by a producer thread that
+    fills a fixed ring of preallocated surfaces, so rendering a frame is a single blit.
+    Frames are picked by a PlaybackClock: each one is held for as many game frames as its
+    duration covers, and the decoder never decodes frames that are already late or that fall
+    between two refreshes of the display.
+
+    Methods
+    -------
+    render(surface_dst):
+        Blits the next video frame on the given surface.
+    release():
+        Stops the decoder thread and closes the video.
+    """
+
+    FILL_COLOR = (0, 0, 0)
+
+    def __init__(self, video_path, buffer_size=4, fps=30, display_fps=60):
+        """
+        Opens the video, preallocates the frame ring and starts the decoder thread.
+
+        Args:
+            video_path (str): The path to the video file.
+            buffer_size (int): Number of surfaces in the frame ring.
+            fps (float): Frames per second sampled from the video.
+            display_fps (float): Frames per second of the game loop that shows the video.
+        """
+        # moviepy takes longer to import than the rest of the game, only streaming needs it
+        from moviepy.editor import VideoFileClip
+
+        self.__video = VideoFileClip(video_path)
+        self.__fps = fps
+        self.__frame_count = max(1, int(self.__video.duration * fps))
+        # Above the display rate only every n-th video frame can ever be seen
+        self.__frame_step = max(1, math.ceil(fps / display_fps))
+        self.__clock = PlaybackClock(fps)
+
+        # convert() gives every slot the display pixel format, so blits need no conversion
+        self.__slots = [pygame.Surface(self.__video.size).convert() for _ in range(buffer_size)]
+        self.__free_slots = queue.Queue()
+        self.__ready_slots = deque()  # (slot, frame number) pairs in decoding order
+        for slot in range(buffer_size):
+            self.__free_slots.put(slot)
+        self.__current_slot = None
+
+        self.__running = True
+        self.__decoder = threading.Thread(target=self.__decode, daemon=True)
+        self.__decoder.start()
+
+    def render(self, surface_dst):
+        """
+        Blits the video frame due now on the given surface. Decoded frames that are already
+        late are dropped, and if the next frame is not due yet or the decoder is behind, the
+        current frame is held instead of stalling the game loop. Until the first frame is
+        decoded the surface is cleared, so nothing drawn on it last frame is left behind.
+
+        Args:
+            surface_dst (pygame.Surface): The surface to render the frame on.
+        """
+        frame_number = self.__clock.frame_number()
+        while self.__ready_slots and self.__ready_slots[0][1] <= frame_number:
+            slot, _ = self.__ready_slots.popleft()
+            if self.__current_slot is not None:
+                self.__free_slots.put(self.__current_slot)
+            self.__current_slot = slot
+
+        if self.__current_slot is not None:
+            surface_dst.blit(self.__slots[self.__current_slot], (0, 0))
+        else:
+            surface_dst.fill(VideoBackground.FILL_COLOR)
+
+    def release(self):
+        """
+        Stops the decoder thread and closes the video.
+        """
+        self.__running = False
+        self.__free_slots.put(None)  # Wakes the decoder if it waits for a free slot
+        self.__decoder.join()
+        self.__video.close()
+
+    def __decode(self):
+        """
+        Decodes the frames that will be shown into free slots of the ring until the background
+        is released, skipping ahead to the clock whenever the decoder falls behind.
+        """
+        frame_number = self.__clock.frame_number()
+        while self.__running:
+            slot = self.__free_slots.get()
+            if slot is None or not self.__running:
+                return
+            frame_number = max(frame_number, self.__clock.frame_number())
+            frame = self.__video.get_frame((frame_number % self.__frame_count) / self.__fps)
+            pygame.surfarray.blit_array(self.__slots[slot], frame.swapaxes(0, 1))
+            self.__ready_slots.append((slot, frame_number))
+            frame_number += self.__frame_step
+
+
+class CachedVideoBackground:
+    """
+    Plays a looping background video from a baked VideoCache.
+
+    The frame due now is picked by a PlaybackClock and copied from the memory-mapped cache into
+    one reused surface only when it changes, so playback needs no decoding, allocates nothing
+    per frame and copies each frame once however long it is held.
+
+    Methods
+    -------
+    render(surface_dst):
+        Blits the next cached frame on the given surface.
+    release():
+        Drops the memory map.
+    """
+
+    def __init__(self, video_cache):
+        """
+        Maps the cached frames and allocates the surface they are copied into.
+
+        Args:
+            video_cache (VideoCache): A baked, valid video cache.
+        """
+        self.__frames = video_cache.open()
+        frame_count, height, width = self.__frames.shape
+        self.__surface = pygame.Surface((width, height)).convert()
+        self.__frame_count = frame_count
+        self.__frame = None
+        self.__clock = PlaybackClock(video_cache.fps)
+
+    def render(self, surface_dst):
+        """
+        Blits the cached frame due now on the given surface, looping at the end of the video.
+
+        Args:
+            surface_dst (pygame.Surface): The surface to render the frame on.
+        """
+        frame = self.__clock.frame_number() % self.__frame_count
+        if frame != self.__frame:
+            # The cache is row-major, the transposed view matches the (width, height) surfarray layout
+            pygame.surfarray.blit_array(self.__surface, self.__frames[frame].T)
+            self.__frame = frame
+        surface_dst.blit(self.__surface, (0, 0))
+
+    def release(self):
+        """
+        Drops the memory map.
+        """
+        self.__frames = None
+
+
+class VideoBackgroundFactory:
+    """Factory class for creating the video background selected in the configuration."""
+
+    @staticmethod
+    def create_video_background(video_path):
+        """
+        Creates the video background for the given video.
+
+        With game.background_video_mode set to "cache" the video is baked once into a memory-mapped
+        frame cache, re-baked whenever the source file changes, and played back from it. With
+        "stream" it is decoded on the fly by a producer thread.
+
+        Args:
+            video_path (str): The path to the video file.
+
+        Returns:
+            VideoBackground or CachedVideoBackground: The video background.
+
+        Raises:
+            ValueError: If an invalid video background mode is configured.
+        """
+        mode = cfg_item("game", "background_video_mode")
+        fps = cfg_item("game", "background_video_fps")
+
+        if mode == "cache":
+            video_cache = VideoCache(video_path, cfg_item("game", "background_video_cache"), cfg_item("game", "screen_size"), fps)
+            if not video_cache.is_valid():
+                print(f"Baking {video_path}")
+                video_cache.bake()
+            return CachedVideoBackground(video_cache)
+        elif mode == "stream":
+            return VideoBackground(video_path, cfg_item("game", "background_video_buffer"), fps, cfg_item("game", "fps"))
+        else:
+            raise ValueError(f"Invalid background video mode: {mode}")
@@ -0,0 +1,176 @@
+import json
+import os
+import sys
+
+import numpy as np
+import pygame
+
+from shmup.config import cfg_item
+
+class VideoCache:
+    """
+    Raw frame cache of a video, pre-scaled to the screen size and in the display pixel format.
+
+    The frames are stored row-major as mapped pixel values, one frame after the other, so that
+    playback is a memory-mapped read followed by surfarray.blit_array with no decoding, scaling
+    or pixel conversion. A JSON sidecar records the source file, the screen size and the pixel
+    format the cache was baked for, and the cache is considered stale when any of them change.
+
+    Methods
+    -------
+    is_valid():
+        Returns whether the cache exists and matches the source video and display.
+    bake():
+        Decodes the source video once and writes the frame cache.
+    open():
+        Returns the cached frames as a read-only memory map.
+    """
+
+    VERSION = 1
+    __DTYPES = {1: np.uint8, 2: np.uint16, 4: np.uint32}
+
+    def __init__(self, video_path, cache_dir, screen_size, fps):
+        """
+        Initializes the cache for a video. Requires the display mode to be set.
+
+        Args:
+            video_path (str): The path to the source video.
+            cache_dir (str): Directory where the frame file and its sidecar are stored.
+            screen_size (tuple): The size frames are scaled to.
+            fps (float): Frames per second sampled from the source video.
+        """
+        self.__video_path = video_path
+        self.__screen_size = tuple(screen_size)
+        self.__fps = fps
+
+        name = os.path.splitext(os.path.basename(video_path))[0]
+        self.__frames_path = os.path.join(cache_dir, f"{name}.frames")
+        self.__metadata_path = os.path.join(cache_dir, f"{name}.json")
+        self.__metadata = None
+
+        display = pygame.display.get_surface()
+        if display.get_bytesize() not in VideoCache.__DTYPES:
+            raise ValueError(f"Unsupported display pixel size: {display.get_bytesize()} bytes")
+
+    @property
+    def fps(self):
+        """
+        Returns the frames per second of the cached frames.
+
+        Returns:
+            float: The frames per second.
+        """
+        return self.__fps
+
+    @property
+    def frame_count(self):
+        """
+        Returns the number of cached frames.
+
+        Returns:
+            int: The number of frames, 0 if the cache has not been baked.
+        """
+        return self.__metadata["frame_count"] if self.__metadata else 0
+
+    def is_valid(self):
+        """
+        Returns whether the cache exists and was baked from the current source video for the
+        current screen size and display pixel format.
+
+        Returns:
+            bool: True if the cache can be played back, False if it must be baked.
+        """
+        if not (os.path.exists(self.__metadata_path) and os.path.exists(self.__frames_path)):
+            return False
+
+        with open(self.__metadata_path) as file:
+            metadata = json.load(file)
+
+        if {key: metadata.get(key) for key in self.__key()} != self.__key():
+            return False
+
+        self.__metadata = metadata
+        return True
+
+    def bake(self):
+        """
+        Decodes the source video once, scales every frame to the screen size, converts it to the
+        display pixel format and writes the frames and their sidecar.
+        """
+        # moviepy is only needed to bake, playback reads the cache
+        from moviepy.editor import VideoFileClip
+
+        os.makedirs(os.path.dirname(self.__frames_path) or ".", exist_ok=True)
+
+        video = VideoFileClip(self.__video_path)
+        frame_surface = pygame.Surface(video.size).convert()
+        screen_surface = pygame.Surface(self.__screen_size).convert()
+        frame_count = 0
+
+        temporary_path = self.__frames_path + ".tmp"
+        with open(temporary_path, "wb") as file:
+            for frame in video.iter_frames(fps=self.__fps, with_times=False):
+                pygame.surfarray.blit_array(frame_surface, frame.swapaxes(0, 1))
+                pygame.transform.scale(frame_surface, self.__screen_size, screen_surface)
+                # pixels2d is (width, height), transposing gives the row-major layout of the surface
+                file.write(np.ascontiguousarray(pygame.surfarray.pixels2d(screen_surface).T).tobytes())
+                frame_count += 1
+        video.close()
+
+        os.replace(temporary_path, self.__frames_path)
+
+        self.__metadata = dict(self.__key(), frame_count=frame_count)
+        with open(self.__metadata_path, "w") as file:
+            json.dump(self.__metadata, file, indent=4)
+
+    def open(self):
+        """
+        Returns the cached frames as a read-only memory map.
+
+        Returns:
+            numpy.memmap: Array of shape (frame_count, height, width) with mapped pixel values.
+        """
+        width, height = self.__screen_size
+        dtype = VideoCache.__DTYPES[self.__metadata["bytesize"]]
+        return np.memmap(self.__frames_path, dtype=dtype, mode="r", shape=(self.frame_count, height, width))
+
+    def __key(self):
+        """
+        Returns the values the cache depends on.
+
+        Returns:
+            dict: The source file identity, screen size, fps and display pixel format.
+        """
+        source = os.stat(self.__video_path)
+        display = pygame.display.get_surface()
+        return {
+            "version": VideoCache.VERSION,
+            "source": os.path.abspath(self.__video_path),
+            "source_size": source.st_size,
+            "source_mtime_ns": source.st_mtime_ns,
+            "screen_size": list(self.__screen_size),
+            "fps": self.__fps,
+            "bytesize": display.get_bytesize(),
+            "masks": list(display.get_masks())
+        }
+
+
+def main(args=None):
+    if args is None:
+        args = sys.argv[1:]
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode(cfg_item("game", "screen_size"), 0, 32)
+
+    video_path = args[0] if args else cfg_item("game", "background_video")
+    cache = VideoCache(video_path, cfg_item("game", "background_video_cache"), cfg_item("game", "screen_size"), cfg_item("game", "background_video_fps"))
+    if cache.is_valid():
+        print(f"{video_path} is already baked ({cache.frame_count} frames)")
+    else:
+        cache.bake()
+        print(f"Baked {cache.frame_count} frames of {video_path}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    sys.exit(main())
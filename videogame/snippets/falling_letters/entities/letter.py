@@ -6,11 +6,8 @@ from falling_letters.config import cfg_item
 
 class Letter:
 
-    def __init__(self, text, font):
-        color = (random.randint(cfg_item("letter", "color")[0], cfg_item("letter", "color")[1]), random.randint(cfg_item("letter", "color")[0], cfg_item("letter", "color")[1]), random.randint(cfg_item("letter", "color")[0], cfg_item("letter", "color")[1]))
-        self.__image = font.render(f"{text}", True, color, None)
-        scale_by = random.uniform(cfg_item("letter", "scale")[0], cfg_item("letter", "scale")[1])
-        self.__image = pygame.transform.scale_by(self.__image, scale_by)
+    def __init__(self, image):
+        self.__image = image
         self.__position = pygame.math.Vector2(random.randint(0, cfg_item("app", "screen_size")[0]), -cfg_item("letter", "margin"))
         self.__end_position = pygame.math.Vector2(self.__position.x, cfg_item("app", "screen_size")[1] + cfg_item("letter", "margin"))
         self.__speed = random.uniform(cfg_item("letter", "speed")[0], cfg_item("letter", "speed")[1])
@@ -0,0 +1,66 @@
+from itertools import compress
+import random
+
+import numpy as np
+
+from falling_letters.config import cfg_item
+
+class LetterBatch:
+    # Letters stored as rows of position and speed arrays instead of Letter objects.
+    # Dead rows are removed in one bulk compaction per frame and the arrays grow by doubling.
+
+    def __init__(self, capacity):
+        capacity = max(1, capacity)
+        self.__positions = np.empty((capacity, 2), dtype=np.float64)
+        self.__speeds = np.empty(capacity, dtype=np.float64)
+        self.__images = []
+        self.__count = 0
+
+        self.__screen_width = cfg_item("app", "screen_size")[0]
+        self.__margin = cfg_item("letter", "margin")
+        self.__end_y = cfg_item("app", "screen_size")[1] + self.__margin
+        self.__speed_range = cfg_item("letter", "speed")
+
+    def __len__(self):
+        return self.__count
+
+    def spawn(self, image):
+        if self.__count == len(self.__speeds):
+            self.__grow()
+        self.__positions[self.__count] = (random.randint(0, self.__screen_width), -self.__margin)
+        self.__speeds[self.__count] = random.uniform(self.__speed_range[0], self.__speed_range[1])
+        self.__images.append(image)
+        self.__count += 1
+
+    def update(self, delta_time):
+        count = self.__count
+        if count == 0:
+            return
+
+        y = self.__positions[:count, 1]
+        y += self.__speeds[:count] * delta_time
+
+        alive = y < self.__end_y
+        if not alive.all():
+            self.__compact(alive)
+
+    def render(self, surface_dst):
+        if self.__count:
+            surface_dst.blits(zip(self.__images, self.__positions[:self.__count].tolist()), doreturn=False)
+
+    def __compact(self, alive):
+        count = self.__count
+        kept = int(np.count_nonzero(alive))
+        self.__positions[:kept] = self.__positions[:count][alive]
+        self.__speeds[:kept] = self.__speeds[:count][alive]
+        self.__images = list(compress(self.__images, alive.tolist()))
+        self.__count = kept
+
+    def __grow(self):
+        capacity = 2 * len(self.__speeds)
+        positions = np.empty((capacity, 2), dtype=np.float64)
+        speeds = np.empty(capacity, dtype=np.float64)
+        positions[:self.__count] = self.__positions[:self.__count]
+        speeds[:self.__count] = self.__speeds[:self.__count]
+        self.__positions = positions
+        self.__speeds = speeds
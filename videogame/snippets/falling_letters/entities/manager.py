@@ -3,6 +3,8 @@ from importlib import resources
 import pygame
 
 from falling_letters.entities.letter import Letter
+from falling_letters.entities.letter_batch import LetterBatch
+from falling_letters.glyph_atlas import GlyphAtlas
 from falling_letters.config import cfg_item
 
 class Manager:
@@ -10,23 +12,44 @@ class Manager:
     def __init__(self):
         file_path = resources.files(cfg_item("font", "filename")[0]).joinpath(cfg_item("font", "filename")[1])
         with resources.as_file(file_path) as font_image_path:
-            self.__font = pygame.font.Font(font_image_path, cfg_item("font", "size"))
-
-        self.__letters = []
+            font = pygame.font.Font(font_image_path, cfg_item("font", "size"))
+        self.__glyph_atlas = GlyphAtlas(font)
+
+        # "objects" keeps a list of Letter, "arrays" keeps every letter in a LetterBatch
+        storage = cfg_item("manager", "storage")
+        if storage == "objects":
+            self.__letters = []
+            self.__batch = None
+        elif storage == "arrays":
+            self.__letters = None
+            self.__batch = LetterBatch(cfg_item("manager", "capacity"))
+        else:
+            raise ValueError(f"Invalid letter storage: {storage}")
+
+    def __len__(self):
+        return len(self.__batch) if self.__batch is not None else len(self.__letters)
 
     def handle_input(self, event):
-        self.__spawn_letter(event.unicode)
+        self.spawn_letter(event.unicode)
 
     def update(self, delta_time):
-        for letter in self.__letters.copy():
-            letter.update(delta_time)
-            if not letter.is_alive:
-                self.__letters.remove(letter)
+        if self.__batch is not None:
+            self.__batch.update(delta_time)
+        else:
+            for letter in self.__letters:
+                letter.update(delta_time)
+            self.__letters = [letter for letter in self.__letters if letter.is_alive]
 
     def render(self, surface_dst):
-        for letter in self.__letters:
-            letter.render(surface_dst)
-
-    def __spawn_letter(self, text):
-        self.__letters.append(Letter(text, self.__font))
-        print(f"{len(self.__letters)}")
\ No newline at end of file
+        if self.__batch is not None:
+            self.__batch.render(surface_dst)
+        else:
+            for letter in self.__letters:
+                letter.render(surface_dst)
+
+    def spawn_letter(self, text):
+        image = self.__glyph_atlas.random_image(text)
+        if self.__batch is not None:
+            self.__batch.spawn(image)
+        else:
+            self.__letters.append(Letter(image))
@@ -0,0 +1,81 @@
+from collections import OrderedDict
+import random
+import string
+
+import pygame
+
+from falling_letters.config import cfg_item
+
+class GlyphAtlas:
+    # Every printable glyph is rasterised once, in white, into a single atlas surface.
+    # Coloured and scaled letters are made from the atlas and kept in a bounded LRU cache keyed by
+    # (glyph, colour, scale), with colour and scale quantised to a few levels so they repeat.
+    # Glyphs outside the atlas are rasterised when first typed and kept in a smaller LRU cache.
+
+    def __init__(self, font):
+        self.__font = font
+        self.__glyphs = {}
+        self.__extra_glyphs = OrderedDict()
+        self.__extra_glyphs_size = cfg_item("font", "glyph_cache_size")
+        self.__cache = OrderedDict()
+        self.__cache_size = cfg_item("font", "cache_size")
+
+        glyphs = [glyph for glyph in string.printable if not glyph.isspace() or glyph == " "]
+        images = [font.render(glyph, True, (255, 255, 255), None) for glyph in glyphs]
+        # Some fonts render glyphs taller than font.get_height(), the atlas fits the tallest one
+        width = sum(image.get_width() for image in images)
+        height = max(image.get_height() for image in images)
+        self.__atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+        x = 0
+        for glyph, image in zip(glyphs, images):
+            # Alpha blending onto the transparent atlas would darken the antialiased edges, the max copies them as is
+            self.__atlas.blit(image, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.__glyphs[glyph] = self.__atlas.subsurface((x, 0, image.get_width(), image.get_height()))
+            x += image.get_width()
+
+        color = cfg_item("letter", "color")
+        self.__colors = GlyphAtlas.__levels(color[0], color[1], cfg_item("letter", "color_levels"))
+        scale = cfg_item("letter", "scale")
+        self.__scales = GlyphAtlas.__levels(scale[0], scale[1], cfg_item("letter", "scale_levels"))
+
+    def random_image(self, text):
+        color = tuple(round(level) for level in random.choices(self.__colors, k=3))
+        return self.image(text, color, random.choice(self.__scales))
+
+    def image(self, text, color, scale):
+        key = (text, color, scale)
+        image = self.__cache.get(key)
+        if image is not None:
+            self.__cache.move_to_end(key)
+            return image
+
+        image = self.__glyph(text).copy()
+        image.fill((*color, 255), special_flags=pygame.BLEND_RGBA_MULT)
+        image = pygame.transform.scale_by(image, scale)
+        self.__cache[key] = image
+        if len(self.__cache) > self.__cache_size:
+            self.__cache.popitem(last=False)
+        return image
+
+    def __glyph(self, text):
+        # Glyphs outside the atlas, like accented letters, are rasterised the first time they are typed
+        glyph = self.__glyphs.get(text)
+        if glyph is not None:
+            return glyph
+
+        glyph = self.__extra_glyphs.get(text)
+        if glyph is not None:
+            self.__extra_glyphs.move_to_end(text)
+            return glyph
+
+        glyph = self.__font.render(text, True, (255, 255, 255), None)
+        self.__extra_glyphs[text] = glyph
+        if len(self.__extra_glyphs) > self.__extra_glyphs_size:
+            self.__extra_glyphs.popitem(last=False)
+        return glyph
+
+    @staticmethod
+    def __levels(low, high, count):
+        if count < 2:
+            return [(low + high) / 2]
+        return [low + (high - low) * i / (count - 1) for i in range(count)]
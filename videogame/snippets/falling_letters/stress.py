@@ -0,0 +1,67 @@
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+import pygame
+
+from falling_letters.config import cfg_item
+from falling_letters.entities.manager import Manager
+
+# Keeps a number of letters falling without a window and reports the time of every frame.
+# Letters that reach the bottom are replaced on the next frame, so the count stays constant.
+
+def run(letters, frames, seed):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode(cfg_item("app", "screen_size"))
+    random.seed(seed)
+
+    manager = Manager()
+    alphabet = cfg_item("stress", "alphabet")
+    delta_time = 1000 / cfg_item("app", "fps")
+
+    update_times = []
+    render_times = []
+    for _ in range(frames):
+        for _ in range(letters - len(manager)):
+            manager.spawn_letter(random.choice(alphabet))
+
+        start = time.perf_counter()
+        manager.update(delta_time)
+        update_times.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        screen.fill(cfg_item("app", "bg_color"))
+        manager.render(screen)
+        render_times.append((time.perf_counter() - start) * 1000)
+
+    pygame.quit()
+    return update_times, render_times
+
+def report(name, times):
+    quantiles = statistics.quantiles(times, n=100)
+    print(f"    {name:<8} p50 {quantiles[49]:8.3f} ms   p95 {quantiles[94]:8.3f} ms   max {max(times):8.3f} ms")
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog="falling_letters.stress", description="Keeps many letters falling headless and reports frame times.")
+    parser.add_argument("--letters", type=int, default=cfg_item("stress", "letters"), help="number of live letters")
+    parser.add_argument("--frames", type=int, default=cfg_item("stress", "frames"), help="number of frames to run")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random generator")
+    options = parser.parse_args(args)
+
+    update_times, render_times = run(options.letters, options.frames, options.seed)
+
+    budget = 1000 / cfg_item("app", "fps")
+    frame_times = [update + render for update, render in zip(update_times, render_times)]
+    print(f"{options.letters} letters, {options.frames} frames, {cfg_item('manager', 'storage')} storage")
+    report("update", update_times)
+    report("render", render_times)
+    report("frame", frame_times)
+    print(f"    {sum(time <= budget for time in frame_times)} of {options.frames} frames within the {budget:.1f} ms budget")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+import pygame
+import pytest
+
+from shmup.config import Config
+from shmup.random_streams import RandomStreams
+from shmup.replay import ReplayPlayer, ReplayRecorder
+from shmup.states.statemanager import StateManager
+
+@pytest.fixture(autouse=True)
+def static_background():
+    # The video background is not bundled with the sources
+    Config.override({"game.background_mode": "static"})
+    yield
+    Config.reload()
+
+def play(tmp_path, frames):
+    """
+    Records the given (delta time, events) frames in a replay and plays it headless.
+    """
+    from shmup.app import App
+
+    path = str(tmp_path / "session.rep")
+    recorder = ReplayRecorder(path, 0)
+    for delta_time, events in frames:
+        recorder.record(delta_time, events)
+    recorder.close()
+
+    player = ReplayPlayer(path)
+    RandomStreams.get_instance().reseed(player.seed)
+    App(None, player, True).run()
+
+def key(event_type, key):
+    return pygame.event.Event(event_type, key=key, mod=0, unicode="")
+
+def test_state_advances_in_fixed_steps(tmp_path, monkeypatch):
+    steps = []
+    alphas = []
+    update = StateManager.update
+    render = StateManager.render
+    def counting_update(self, delta_time):
+        steps[-1].append(delta_time)
+        update(self, delta_time)
+    def counting_render(self, surface_dst, alpha=1.0):
+        alphas.append(alpha)
+        steps.append([])
+        return render(self, surface_dst, alpha)
+    monkeypatch.setattr(StateManager, "update", counting_update)
+    monkeypatch.setattr(StateManager, "render", counting_render)
+    steps.append([])
+
+    # A 500 ms stall is caught up with game.max_catch_up_steps steps, the rest is dropped
+    play(tmp_path, [(12, [])] * 6 + [(500, []), (0, []), (12, [])])
+
+    step_time = 1000 / 60
+    assert [len(frame) for frame in steps[:-1]] == [0, 1, 1, 0, 1, 1, 5, 0, 1]
+    assert all(delta_time == step_time for frame in steps for delta_time in frame)
+    assert all(0 <= alpha < 1 for alpha in alphas)
+    assert alphas[0] == pytest.approx(12 / step_time)
+
+def test_entities_are_counted_only_for_the_overlay(tmp_path, monkeypatch):
+    from shmup.states.state import State
+    from shmup.states.gameplay import GamePlay
+
+    counted = []
+    def entity_counts(self):
+        counted.append(self)
+        return {}
+    monkeypatch.setattr(State, "entity_counts", entity_counts)
+    monkeypatch.setattr(GamePlay, "entity_counts", entity_counts)
+
+    play(tmp_path, [(16, [key(pygame.KEYDOWN, pygame.K_RETURN)])] + [(16, [])] * 30)
+    assert counted == []
+    play(tmp_path, [(16, [key(pygame.KEYDOWN, pygame.K_F3)])] + [(16, [])] * 30)
+    assert len(counted) == 31
+
+def test_assets_are_prefetched_after_the_first_frame(tmp_path, monkeypatch):
+    # Frames rendered when the prefetch starts
+    rendered = []
+    prefetched = []
+    render = StateManager.render
+    def counting_render(self, surface_dst, alpha=1.0):
+        rendered.append(alpha)
+        return render(self, surface_dst, alpha)
+    monkeypatch.setattr(StateManager, "render", counting_render)
+    monkeypatch.setattr(StateManager, "prefetch", lambda self: prefetched.append(len(rendered)))
+
+    play(tmp_path, [(16, [])] * 5)
+    assert prefetched == [1]
+
+def dirty_session():
+    frames = [(16, [key(pygame.KEYDOWN, pygame.K_RETURN)])]
+    for frame in range(300):
+        events = []
+        if frame % 60 == 10:
+            events = [key(pygame.KEYDOWN, pygame.K_LEFT), key(pygame.KEYDOWN, pygame.K_SPACE)]
+        elif frame % 60 == 40:
+            events = [key(pygame.KEYUP, pygame.K_LEFT), key(pygame.KEYDOWN, pygame.K_RIGHT)]
+        elif frame % 60 == 0:
+            events = [key(pygame.KEYUP, pygame.K_RIGHT), key(pygame.KEYUP, pygame.K_SPACE)]
+        frames.append((16, events))
+    return frames
+
+def test_dirty_rects_cover_every_change(tmp_path, monkeypatch):
+    updates = []
+    previous = []
+    update = pygame.display.update
+    def checking_update(rects=None):
+        current = pygame.display.get_surface().copy()
+        if rects is None:
+            updates.append(None)
+        else:
+            # Every pixel that changed since the last frame is inside the areas pushed to the display
+            outside = current.copy()
+            last = previous[0].copy()
+            for rect in rects:
+                outside.fill((0, 0, 0), rect)
+                last.fill((0, 0, 0), rect)
+            updates.append(outside.get_buffer().raw == last.get_buffer().raw)
+        previous[:] = [current]
+        return update(rects) if rects is not None else update()
+    monkeypatch.setattr(pygame.display, "update", checking_update)
+
+    play(tmp_path, dirty_session())
+
+    partial = [update for update in updates if update is not None]
+    assert len(partial) > len(updates) // 2
+    assert all(partial)
+
+def test_dirty_frames_match_full_repaints(tmp_path, monkeypatch):
+    from shmup.static_background import StaticBackground
+
+    def screens():
+        frames = []
+        update = pygame.display.update
+        def recording_update(*args):
+            frames.append(pygame.display.get_surface().get_buffer().raw)
+            return update(*args)
+        with monkeypatch.context() as patch:
+            patch.setattr(pygame.display, "update", recording_update)
+            play(tmp_path, dirty_session())
+        return frames
+
+    dirty = screens()
+    # Restoring the whole background erases everything drawn before, whatever the areas
+    monkeypatch.setattr(StaticBackground, "restore", lambda self, surface_dst, rects: self.render(surface_dst))
+    full = screens()
+    assert len(dirty) == len(full)
+    assert dirty == full
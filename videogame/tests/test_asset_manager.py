@@ -0,0 +1,87 @@
+import threading
+import time
+
+import pygame
+import pytest
+
+from shmup.assets.asset_manager import AssetManager
+
+RESOURCE = ("shmup.assets.images", "raptor.png")
+
+def test_concurrent_requests_load_an_asset_once(monkeypatch):
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    assets = AssetManager.get_instance()
+    assets.clear()
+
+    loads = []
+    load = pygame.image.load
+    def slow_load(path):
+        # Widens the window between the cache miss and the store
+        loads.append(path)
+        time.sleep(0.05)
+        return load(path)
+    monkeypatch.setattr(pygame.image, "load", slow_load)
+
+    barrier = threading.Barrier(8)
+    results = []
+    def request():
+        barrier.wait()
+        results.append(assets.mask(RESOURCE))
+        results.append(assets.image(RESOURCE))
+
+    try:
+        threads = [threading.Thread(target=request) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(loads) == 1
+        assert len({id(result) for result in results}) == 2
+    finally:
+        assets.clear()
+        pygame.quit()
+
+@pytest.fixture
+def assets():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    pygame.font.init()
+    assets = AssetManager.get_instance()
+    assets.clear()
+    yield assets
+    assets.clear()
+    pygame.quit()
+
+def test_assets_are_loaded_once_and_shared(assets):
+    image = assets.image(RESOURCE)
+    assert assets.image(list(RESOURCE)) is image
+    assert assets.mask(RESOURCE) is assets.mask(RESOURCE)
+    font = assets.font(("shmup.assets.fonts", "Sansation.ttf"), 14)
+    assert assets.font(("shmup.assets.fonts", "Sansation.ttf"), 14) is font
+    assert assets.font(("shmup.assets.fonts", "Sansation.ttf"), 20) is not font
+
+def test_transforms_are_applied_in_order(assets):
+    width, height = assets.image(RESOURCE).get_size()
+    scaled = assets.image(RESOURCE, (("scale", (10, 20)),))
+    assert scaled.get_size() == (10, 20)
+    rotated = assets.image(RESOURCE, (("scale", (10, 20)), ("rotate", 90)))
+    assert rotated.get_size() == (20, 10)
+    assert assets.mask(RESOURCE, (("scale", (10, 20)),)).get_size() == (10, 20)
+    with pytest.raises(ValueError):
+        assets.image(RESOURCE, (("shear", 1),))
+
+def test_sounds_need_the_mixer(assets):
+    assert assets.sound(("shmup.assets.sounds", "explosion.mp3")) is None
+
+def test_memory_report_lists_every_asset_largest_first(assets):
+    assets.image(RESOURCE)
+    assets.mask(RESOURCE)
+    assets.font(("shmup.assets.fonts", "Sansation.ttf"), 14)
+    report = assets.memory_report()
+    assert sorted(kind for kind, _, _ in report) == ["font", "image", "mask"]
+    sizes = [size for _, _, size in report]
+    assert sizes == sorted(sizes, reverse=True)
+    assets.clear()
+    assert assets.memory_report() == []
@@ -0,0 +1,38 @@
+from shmup.batch.runner import aggregate, run_game
+from shmup.config import Config
+
+def job(seed, max_ticks, overrides=None):
+    return {"seed": seed, "overrides": overrides or {}, "max_ticks": max_ticks, "delta_time": 1000 / 60}
+
+def teardown_function():
+    Config.reload()
+
+def test_run_game_is_deterministic():
+    first = run_game(job(3, 600))
+    second = run_game(job(3, 600))
+    assert first["ticks"] == second["ticks"]
+    assert first["kills"] == second["kills"]
+    assert first["survival_time"] == second["survival_time"]
+
+def test_run_game_without_ticks_reports_no_tick_cost():
+    result = run_game(job(0, 0))
+    assert result["ticks"] == 0
+    assert result["tick_ms_mean"] is None
+    assert result["tick_ms_p95"] is None
+
+    report = aggregate([result])
+    assert report[0]["runs"] == 1
+    assert report[0]["tick_ms_mean"] is None
+
+def test_overrides_apply_to_their_job_only():
+    result = run_game(job(0, 1, {"entities.boss.health": 5}))
+    assert result["job"]["overrides"] == {"entities.boss.health": 5}
+    run_game(job(0, 1))
+    assert Config.get_instance().data["entities"]["boss"]["health"] != 5
+
+def test_aggregate_groups_by_overrides():
+    results = [run_game(job(seed, 120, overrides)) for overrides in ({}, {"entities.boss.health": 5}) for seed in (0, 1)]
+    report = aggregate(results)
+    assert len(report) == 2
+    assert all(line["runs"] == 2 for line in report)
+    assert all(0.0 <= line["survival_rate"] <= 1.0 for line in report)
@@ -0,0 +1,49 @@
+import json
+
+from shmup.bench.__main__ import main
+from shmup.bench.benchmark import PERCENTILES, compare, load_results, run_scenario
+from shmup.bench.scenario import Scenario
+
+def results(**phases):
+    return {"scenarios": {"wave": {"phases": {
+        phase: {key: milliseconds for key in PERCENTILES} for phase, milliseconds in phases.items()}}}}
+
+def test_compare_flags_slowdowns_beyond_tolerance_and_min_delta():
+    regressions = compare(results(update=2.0), results(update=1.0), tolerance=0.1, min_delta=0.05)
+    assert regressions == [f"wave.update.{key}: 1.000 ms -> 2.000 ms" for key in PERCENTILES]
+
+def test_compare_ignores_noise():
+    # 50% slower but only 0.01 ms, and 0.2 ms slower but within 10%
+    assert compare(results(collisions=0.03), results(collisions=0.02), tolerance=0.1, min_delta=0.05) == []
+    assert compare(results(update=10.2), results(update=10.0), tolerance=0.1, min_delta=0.05) == []
+    assert compare(results(update=0.5), results(update=1.0), tolerance=0.1, min_delta=0.05) == []
+
+def test_compare_skips_what_the_baseline_lacks():
+    assert compare(results(update=2.0, render=2.0), results(render=2.0), tolerance=0.1, min_delta=0.05) == []
+    assert compare(results(update=2.0), {"scenarios": {}}, tolerance=0.1, min_delta=0.05) == []
+
+def test_run_scenario_times_every_phase():
+    scenario = Scenario("small", {"warmup": 5, "frames": 30, "enemies": 3, "projectiles_allied": 20,
+                                  "projectiles_enemy": 10})
+    result = run_scenario(scenario)
+    assert result["frames"] == 30
+    assert {"update", "collisions", "render"} <= set(result["phases"])
+    for summary in result["phases"].values():
+        assert summary["p50"] <= summary["p95"] <= summary["p99"]
+    assert result["projectile_pools"]["allied"]["live"] > 0
+
+def test_main_fails_on_regression(tmp_path):
+    scenario_path = tmp_path / "small.json"
+    scenario_path.write_text(json.dumps({"warmup": 5, "frames": 30, "enemies": 3, "projectiles_allied": 20}))
+    output = str(tmp_path / "results.json")
+    baseline = str(tmp_path / "baseline.json")
+
+    assert main([str(scenario_path), "--output", output, "--baseline", baseline, "--update-baseline"]) == 0
+
+    # A baseline far faster than any machine makes every percentile a regression
+    stored = load_results(baseline)
+    for summary in stored["scenarios"]["small"]["phases"].values():
+        summary.update({key: 0.0 for key in PERCENTILES})
+    with open(baseline, "w") as file:
+        json.dump(stored, file)
+    assert main([str(scenario_path), "--output", output, "--baseline", baseline, "--min-delta", "0"]) == 1
@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+from shmup.assets.asset_manager import AssetManager
+from shmup.config import cfg
+from shmup.entities.collision import collide_mask
+from shmup.entities.projectiles.projectile_factory import ProjectileFactory
+from shmup.entities.projectiles.projectile_type import ProjectileType
+
+@pytest.fixture(autouse=True)
+def display():
+    pygame.display.init()
+    pygame.display.set_mode(cfg().game.screen_size)
+    yield
+    AssetManager.get_instance().clear()
+    pygame.quit()
+
+def ring(position, size=40, thickness=4):
+    """
+    Returns a sprite whose opaque pixels are a square outline, hollow in the middle.
+    """
+    image = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.rect(image, (255, 255, 255, 255), image.get_rect(), thickness)
+    return SimpleNamespace(rect=image.get_rect(topleft=position), mask=pygame.mask.from_surface(image))
+
+def test_collide_mask_needs_opaque_pixels_to_overlap():
+    outer = ring((0, 0))
+    inner = ring((10, 10), size=20)
+    assert outer.rect.colliderect(inner.rect)
+    assert not collide_mask(outer, inner)
+    assert collide_mask(outer, ring((30, 30)))
+    assert not collide_mask(outer, ring((100, 100)))
+
+def test_projectiles_hit_only_opaque_pixels():
+    batch = ProjectileFactory.create_batch(ProjectileType.Allied)
+    target = ring((100, 100), size=80)
+    width, height = batch.image.get_size()
+    batch.spawn((140 - width // 2, 140 - height // 2))  # In the hollow middle
+    batch.spawn((100, 100))  # On the outline
+    assert batch.collide(target, True) == 1
+    assert len(batch) == 1
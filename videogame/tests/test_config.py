@@ -0,0 +1,54 @@
+import pytest
+
+from shmup.config import Config, cfg, cfg_item
+
+def test_snapshot_matches_the_file():
+    assert cfg().entities.boss.health == cfg_item("entities", "boss", "health")
+    assert cfg().game.screen_size == tuple(cfg_item("game", "screen_size"))
+    assert (cfg().game.screen_width, cfg().game.screen_height) == cfg().game.screen_size
+
+def test_snapshot_is_read_only():
+    with pytest.raises(AttributeError):
+        cfg().entities.boss.health = 1
+    with pytest.raises(AttributeError):
+        del cfg().game.fps
+    with pytest.raises(AttributeError):
+        cfg().game.not_a_key
+
+def test_reload_replaces_the_snapshot():
+    snapshot = cfg()
+    Config.reload()
+    assert cfg() is not snapshot
+    assert cfg().entities.boss.health == snapshot.entities.boss.health
+
+def test_override_replaces_values_until_reload():
+    health = cfg().entities.boss.health
+    try:
+        Config.override({"entities.boss.health": health + 1, "game.fps": 30})
+        assert cfg().entities.boss.health == health + 1
+        assert cfg_item("game", "fps") == 30
+    finally:
+        Config.reload()
+    assert cfg().entities.boss.health == health
+
+def test_override_rejects_unknown_keys():
+    with pytest.raises(KeyError):
+        Config.override({"entities.boss.armor": 1})
+    with pytest.raises(KeyError):
+        Config.override({"entities.dragon.health": 1})
+
+def test_override_reaches_the_hero():
+    import pygame
+    from shmup.simulation import Simulation
+
+    simulation = Simulation(0)
+    try:
+        hero = simulation.gameplay.hero
+        Config.override({"entities.hero.speed": 0.1})
+        start = hero.pos.x
+        simulation.handle_input(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT))
+        simulation.step(100)
+        assert hero.pos.x == pytest.approx(start - 10)
+    finally:
+        Config.reload()
+        simulation.release()
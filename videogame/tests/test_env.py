@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from shmup.env.shmup_env import ShmupEnv
+from shmup.env.vector_env import VectorEnv
+from shmup.simulation import Simulation
+
+def test_reset_during_boss_fight_spawns_enemies_again():
+    simulation = Simulation(0)
+    try:
+        gameplay = simulation.gameplay
+        # The state the last kill before the boss leaves behind
+        gameplay.enemy_spawn = False
+        gameplay.spawn_boss()
+
+        simulation.reset()
+        assert gameplay.boss is None
+        assert gameplay.enemy_spawn
+
+        simulation.run(600)
+        assert len(gameplay.enemies) > 0
+    finally:
+        simulation.release()
+
+def test_env_reset_and_step():
+    env = ShmupEnv("state", seed=0)
+    try:
+        observation = env.reset(0)
+        assert observation.shape == ShmupEnv.observation_shape("state")
+        assert observation.dtype == ShmupEnv.observation_dtype("state")
+
+        for action in range(len(ShmupEnv.ACTIONS)):
+            observation, reward, done, info = env.step(action)
+            assert observation.shape == ShmupEnv.observation_shape("state")
+            assert isinstance(reward, float)
+            assert not done
+            assert info["ticks"] == action + 1
+    finally:
+        env.close()
+
+def test_env_reset_with_seed_repeats_the_episode():
+    env = ShmupEnv("state", seed=0)
+    try:
+        episodes = []
+        for _ in range(2):
+            observations = [env.reset(7)]
+            observations += [env.step(3)[0] for _ in range(120)]
+            episodes.append(np.array(observations))
+        np.testing.assert_array_equal(episodes[0], episodes[1])
+    finally:
+        env.close()
+
+def test_vector_env_steps_every_env():
+    envs = VectorEnv(2, "state", seed=0)
+    try:
+        observations = envs.reset(0)
+        assert observations.shape == (2,) + ShmupEnv.observation_shape("state")
+
+        observations, rewards, dones, infos = envs.step([0, 3])
+        assert observations.shape == (2,) + ShmupEnv.observation_shape("state")
+        assert rewards.shape == (2,)
+        assert not dones.any()
+        assert [info["ticks"] for info in infos] == [1, 1]
+    finally:
+        envs.close()
+
+def test_state_has_slots_for_the_shots_of_the_boss():
+    from shmup.config import cfg
+    from shmup.entities.projectiles.boss_shot import BossShot
+    from shmup.entities.projectiles.laser_beam import LaserBeam
+
+    env = ShmupEnv("state", seed=0)
+    try:
+        env.reset(0)
+        boss = env._ShmupEnv__simulation.gameplay.spawn_boss()
+        boss.laser_beams.add(BossShot((80, 60)), LaserBeam((360, 0)), LaserBeam((0, 0)))
+        observation = env.step(0)[0]
+
+        config = cfg()
+        width, height = config.game.screen_size
+        shots = observation[-3 * (config.env.max_boss_shots + config.env.max_laser_beams):].reshape(-1, 3)
+        beams = shots[config.env.max_boss_shots:]
+        shots = shots[:config.env.max_boss_shots]
+        assert shots[:, 0].sum() == 1 and beams[:, 0].sum() == 2
+        assert shots[0, 1] == pytest.approx(80 / width)
+        # The beams are ordered by distance to the hero
+        hero = env._ShmupEnv__simulation.gameplay.hero.pos
+        assert abs(beams[0, 1] * width - hero.x) <= abs(beams[1, 1] * width - hero.x)
+    finally:
+        env.close()
+
+def test_pixels_are_copied_unless_asked():
+    env = ShmupEnv("pixels", seed=0)
+    try:
+        observation = env.reset(0)
+        assert observation.shape == ShmupEnv.observation_shape("pixels")
+        # A copy leaves the surface unlocked and keeps the pixels of its step
+        before = observation.copy()
+        env.step(3)
+        assert not env._ShmupEnv__simulation.surface.get_locked()
+        assert (observation == before).all()
+    finally:
+        env.close()
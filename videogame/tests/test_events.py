@@ -0,0 +1,63 @@
+import pytest
+
+from shmup.entities.projectiles.projectile_type import ProjectileType
+from shmup.events import EventBus, Events
+from shmup.simulation import Simulation
+
+@pytest.fixture
+def bus():
+    bus = EventBus.get_instance()
+    bus.clear()
+    bus.clear_stats()
+    yield bus
+    bus.clear()
+
+def test_dispatch_delivers_to_the_subscribers_of_the_topic(bus):
+    received = []
+    def on_fire(pos):
+        received.append(("fire", pos))
+        if pos == (1, 1):
+            # Published while dispatching, delivered in the same dispatch
+            bus.publish(Events.HERO_FIRES, pos=(2, 2))
+    def on_boss_killed(boss):
+        received.append(("boss", boss))
+
+    bus.subscribe(Events.HERO_FIRES, on_fire)
+    bus.subscribe(Events.BOSS_KILLED, on_boss_killed)
+    try:
+        bus.publish(Events.HERO_FIRES, pos=(1, 1))
+        bus.publish(Events.ENEMY_FIRES, pos=(0, 0))
+        assert bus.depth == 2
+        bus.dispatch()
+    finally:
+        bus.unsubscribe(Events.HERO_FIRES, on_fire)
+        bus.unsubscribe(Events.BOSS_KILLED, on_boss_killed)
+
+    assert received == [("fire", (1, 1)), ("fire", (2, 2))]
+    assert bus.stats() == {"depth": 0, "max_depth": 2, "published": 3}
+
+def test_publish_rejects_other_topics(bus):
+    with pytest.raises(TypeError):
+        bus.publish("HERO_FIRES", pos=(0, 0))
+
+def test_clear_drops_queued_events(bus):
+    received = []
+    handler = lambda pos: received.append(pos)
+    bus.subscribe(Events.HERO_FIRES, handler)
+    try:
+        bus.publish(Events.HERO_FIRES, pos=(0, 0))
+        bus.clear()
+        bus.dispatch()
+    finally:
+        bus.unsubscribe(Events.HERO_FIRES, handler)
+    assert received == []
+
+def test_events_published_before_a_reset_do_not_reach_the_new_session(bus):
+    simulation = Simulation(0)
+    try:
+        bus.publish(Events.HERO_FIRES, pos=(100, 300))
+        simulation.reset()
+        simulation.step()
+        assert len(simulation.gameplay.projectile_positions(ProjectileType.Allied)) == 0
+    finally:
+        simulation.release()
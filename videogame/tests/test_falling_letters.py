@@ -0,0 +1,88 @@
+import os
+import random
+
+import pygame
+import pytest
+
+SNIPPETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "snippets")
+
+@pytest.fixture
+def config(monkeypatch):
+    # The snippet runs from the snippets directory, as python -m falling_letters
+    monkeypatch.syspath_prepend(SNIPPETS)
+    from falling_letters.config import Config
+
+    pygame.font.init()
+    data = Config.get_instance().data
+    manager = dict(data["manager"])
+    yield data
+    data["manager"] = manager
+    pygame.quit()
+
+def session():
+    from falling_letters.entities.manager import Manager
+
+    random.seed(3)
+    surface = pygame.Surface((500, 500))
+    manager = Manager()
+    frames = []
+    for frame in range(240):
+        if frame % 4 == 0:
+            manager.spawn_letter("ABCDEFGHIJ"[frame % 10])
+        manager.update(16)
+        surface.fill((0, 0, 0))
+        manager.render(surface)
+        frames.append((len(manager), surface.get_buffer().raw))
+    return frames
+
+def test_array_storage_draws_like_letter_objects(config):
+    config["manager"] = {"storage": "objects", "capacity": 4}
+    objects = session()
+    config["manager"] = {"storage": "arrays", "capacity": 4}
+    arrays = session()
+    assert [count for count, _ in arrays] == [count for count, _ in objects]
+    assert max(count for count, _ in arrays) > 4  # The arrays grew
+    assert arrays[-1][0] < max(count for count, _ in arrays)  # Letters that fell out were removed
+    assert arrays == objects
+
+def test_unknown_storage_is_rejected(config):
+    from falling_letters.entities.manager import Manager
+
+    config["manager"] = {"storage": "linked_list", "capacity": 4}
+    with pytest.raises(ValueError):
+        Manager()
+
+def test_glyph_images_are_cached_by_glyph_color_and_scale(config):
+    from falling_letters.glyph_atlas import GlyphAtlas
+
+    font = pygame.font.Font(None, 40)
+    atlas = GlyphAtlas(font)
+    image = atlas.image("A", (255, 40, 40), 2.0)
+    assert atlas.image("A", (255, 40, 40), 2.0) is image
+    assert atlas.image("A", (255, 40, 40), 1.0) is not image
+    assert image.get_height() == 2 * font.render("A", True, (255, 255, 255)).get_height()
+    # Glyphs missing from the atlas are rasterized on demand
+    assert atlas.image("é", (255, 255, 255), 1.0).get_width() > 0
+
+def test_atlas_keeps_the_antialiased_edges(config):
+    from falling_letters.glyph_atlas import GlyphAtlas
+
+    font = pygame.font.Font(None, 40)
+    image = GlyphAtlas(font).image("A", (255, 255, 255), 1.0)
+    rendered = font.render("A", True, (255, 255, 255), None)
+    for x in range(rendered.get_width()):
+        for y in range(rendered.get_height()):
+            if rendered.get_at((x, y)).a:
+                assert image.get_at((x, y)) == rendered.get_at((x, y))
+
+def test_glyphs_missing_from_the_atlas_are_bounded(config, monkeypatch):
+    from falling_letters.glyph_atlas import GlyphAtlas
+
+    monkeypatch.setitem(config["font"], "glyph_cache_size", 2)
+    atlas = GlyphAtlas(pygame.font.Font(None, 40))
+    first = atlas.image("é", (255, 255, 255), 1.0)
+    for glyph in "àç":
+        atlas.image(glyph, (255, 255, 255), 1.0)
+    assert len(atlas._GlyphAtlas__extra_glyphs) == 2
+    assert "é" not in atlas._GlyphAtlas__extra_glyphs
+    assert atlas.image("é", (255, 255, 255), 1.0) is first  # Still in the image cache
@@ -0,0 +1,49 @@
+import pygame
+import pytest
+
+from shmup.assets.asset_manager import AssetManager
+from shmup.assets.flipbook import FlipBook
+from shmup.config import cfg
+from shmup.entities.explosion import Explosion
+from shmup.entities.explosion_group import ExplosionGroup
+
+@pytest.fixture(autouse=True)
+def display():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    FlipBook.clear()
+    AssetManager.get_instance().clear()
+    pygame.quit()
+
+def test_sheet_is_sliced_once_and_shared():
+    resource, _ = Explosion.image_asset()
+    rows, cols = cfg().entities.explosion.size
+    flipbook = FlipBook.get(resource, rows, cols)
+    assert FlipBook.get(resource, rows, cols) is flipbook
+    assert Explosion((0, 0)).flipbook is flipbook
+
+    sheet = AssetManager.get_instance().image(resource)
+    assert len(flipbook) == rows * cols
+    for frame in flipbook.frames:
+        assert frame.get_size() == (sheet.get_width() // cols, sheet.get_height() // rows)
+        assert frame.get_parent() is sheet
+
+    FlipBook.clear()
+    assert FlipBook.get(resource, rows, cols) is not flipbook
+
+def test_group_animates_explosions_with_one_clock():
+    time_per_sequence = cfg().entities.explosion.time_per_sequence
+    group = ExplosionGroup()
+    first = group.spawn((0, 0))
+    group.update(2 * time_per_sequence)
+    second = group.spawn((50, 50))
+    group.update(time_per_sequence)
+    assert (first.sequence, second.sequence) == (3, 1)
+
+    surface = pygame.Surface((200, 200))
+    assert len(group.render(surface)) == 2
+
+    # The first explosion reaches its last frame first and is removed
+    group.update((len(first.flipbook) - 4) * time_per_sequence)
+    assert group.sprites() == [second]
@@ -0,0 +1,81 @@
+import csv
+import time
+
+import pygame
+
+from shmup.assets.asset_manager import AssetManager
+from shmup.assets.text_cache import TextCache
+from shmup.config import cfg
+from shmup.profiler import Profiler, percentile
+from shmup.timing_overlay import TimingOverlay
+
+def test_percentile_uses_the_nearest_rank():
+    samples = list(range(100, 0, -1))
+    assert percentile(samples, 50) == 50
+    assert percentile(samples, 95) == 95
+    assert percentile(samples, 100) == 100
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([], 50) == 0.0
+
+def test_summary_times_every_phase():
+    profiler = Profiler()
+    for _ in range(3):
+        with profiler.phase("update"):
+            time.sleep(0.001)
+        with profiler.phase("render"):
+            pass
+    summary = profiler.summary()
+    assert profiler.phases() == ["update", "render"]
+    assert summary["update"]["count"] == 3
+    assert summary["update"]["p50"] >= 1.0
+    assert summary["render"]["p50"] <= summary["update"]["p50"]
+
+def test_window_keeps_the_latest_samples():
+    profiler = Profiler(window=4)
+    for _ in range(10):
+        with profiler.phase("frame"):
+            pass
+    assert len(profiler.samples("frame")) == 4
+    profiler.clear()
+    assert profiler.summary() == {}
+
+def test_export_csv_writes_every_sample(tmp_path):
+    profiler = Profiler()
+    for _ in range(2):
+        with profiler.phase("update"):
+            pass
+    path = tmp_path / "timings.csv"
+    profiler.export_csv(str(path))
+    with open(path, newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ["phase", "sample", "ms"]
+    assert [row[:2] for row in rows[1:]] == [["update", "0"], ["update", "1"]]
+
+def test_overlay_is_drawn_once_shown_and_refreshed():
+    pygame.display.init()
+    pygame.font.init()
+    try:
+        surface = pygame.Surface(cfg().game.screen_size)
+        profiler = Profiler(window=10)
+        with profiler.phase("update"):
+            pass
+        overlay = TimingOverlay(profiler)
+
+        overlay.update(1000, {"enemies": 3})
+        assert overlay.render(surface) is None
+
+        overlay.toggle()
+        text_cache = TextCache.get_instance().stats()
+        overlay.update(0, {"enemies": 3})
+        # The lines change on every refresh and stay out of the cache of the menu and HUD text
+        assert TextCache.get_instance().stats() == text_cache
+        rect = overlay.render(surface)
+        assert rect is not None
+        assert rect.right == surface.get_width() and rect.top == 0
+
+        overlay.toggle()
+        assert overlay.render(surface) is None
+    finally:
+        AssetManager.get_instance().clear()
+        TextCache.get_instance().clear()
+        pygame.quit()
@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pygame
+import pytest
+
+from shmup.assets.asset_manager import AssetManager
+from shmup.config import Config, cfg
+from shmup.entities.projectiles.projectile_factory import ProjectileFactory
+from shmup.entities.projectiles.projectile_type import ProjectileType
+
+@pytest.fixture(autouse=True)
+def display():
+    pygame.display.init()
+    pygame.display.set_mode(cfg().game.screen_size)
+    yield
+    AssetManager.get_instance().clear()
+    pygame.quit()
+    Config.reload()
+
+def rect_hits(positions, size, rect):
+    return [tuple(position) for position in positions
+            if pygame.Rect(int(position[0]), int(position[1]), *size).colliderect(rect)]
+
+@pytest.mark.parametrize("grid_threshold", [1, 1 << 30], ids=["grid", "brute_force"])
+def test_collide_matches_rect_tests(grid_threshold):
+    Config.override({"game.collision_grid_threshold": grid_threshold})
+    generator = np.random.default_rng(1)
+    batch = ProjectileFactory.create_batch(ProjectileType.Allied)
+    size = batch.image.get_size()
+
+    for position in generator.uniform(-40, 700, size=(800, 2)):
+        batch.spawn(tuple(position))
+    batch.update(1.0)
+    expected = [tuple(position) for position in batch.positions]
+
+    for _ in range(50):
+        # A sprite without a mask is tested by rect only
+        sprite = SimpleNamespace(rect=pygame.Rect(*generator.integers(-100, 600, size=2), *generator.integers(1, 200, size=2)))
+        hits = rect_hits(expected, size, sprite.rect)
+        expected = [position for position in expected if position not in hits]
+        assert batch.collide(sprite, True) == len(hits)
+        assert len(batch) == len(expected)
+    assert sorted(map(tuple, batch.positions)) == sorted(expected)
+
+def test_collide_without_kill_keeps_projectiles():
+    batch = ProjectileFactory.create_batch(ProjectileType.Enemy)
+    batch.spawn((100, 100))
+    sprite = SimpleNamespace(rect=pygame.Rect(90, 90, 40, 40))
+    assert batch.collide(sprite, False) == 1
+    assert batch.collide(sprite, False) == 1
+    assert len(batch) == 1
+
+def test_update_moves_and_drops_projectiles_off_screen():
+    batch = ProjectileFactory.create_batch(ProjectileType.Allied)
+    batch.spawn((100, 100))
+    batch.spawn((100, 1))
+    velocity = np.array(batch.velocity)
+    batch.update(10)
+    assert len(batch) == 1
+    np.testing.assert_allclose(batch.positions[0], np.array((100, 100)) + velocity * 10)
+
+def test_pool_recycles_freed_rows():
+    batch = ProjectileFactory.create_batch(ProjectileType.Allied)
+    capacity = batch.capacity
+    for _ in range(3):
+        for index in range(capacity):
+            batch.spawn((index % 400, 300))
+        batch.clear()
+    stats = batch.pool_stats()
+    assert batch.capacity == capacity
+    assert stats["spawned"] == 3 * capacity
+    assert stats["live"] == 0
+    assert stats["hit_rate"] == 1.0
@@ -0,0 +1,100 @@
+import pygame
+
+from shmup.config import cfg
+from shmup.entities.gameobject import GameObject
+from shmup.entities.rendergroup import RenderGroup
+
+class Block(GameObject):
+    """
+    Square sprite drawing its own image, filled with one color.
+    """
+
+    def __init__(self, position, color, size=10):
+        super().__init__()
+        self._position = pygame.math.Vector2(position)
+        self.image = pygame.Surface((size, size))
+        self.image.fill(color)
+
+    def handle_input(self, key, is_pressed):
+        pass
+
+    def update(self, delta_time):
+        self._store_previous_position()
+        self._position += pygame.math.Vector2(delta_time, 0)
+
+    def render(self, surface_dst, alpha=1.0):
+        return surface_dst.blit(self.image, self.render_position(alpha))
+
+    def release(self):
+        pass
+
+
+class SharedBlock(Block):
+    """
+    Block whose instances all draw the image of the first one.
+    """
+
+    SHARED_IMAGE = True
+
+
+def test_group_draws_every_sprite_like_its_render():
+    group = RenderGroup()
+    group.add(Block((0, 0), (255, 0, 0)), Block((20, 5), (0, 255, 0), 4), SharedBlock((40, 40), (0, 0, 255)))
+
+    batched = pygame.Surface((100, 100))
+    rects = group.render(batched)
+    one_by_one = pygame.Surface((100, 100))
+    expected = [sprite.render(one_by_one) for sprite in group.sprites()]
+
+    assert rects == expected
+    assert batched.get_buffer().raw == one_by_one.get_buffer().raw
+
+def test_shared_image_is_drawn_for_every_sprite():
+    group = RenderGroup()
+    group.add(SharedBlock((0, 0), (255, 0, 0)), SharedBlock((20, 0), (0, 255, 0)))
+    surface = pygame.Surface((40, 10))
+    assert group.render(surface) == [pygame.Rect(0, 0, 10, 10), pygame.Rect(20, 0, 10, 10)]
+    assert surface.get_at((25, 5)) == pygame.Color(255, 0, 0)
+
+def test_empty_group_draws_nothing():
+    assert RenderGroup().render(pygame.Surface((10, 10))) == []
+
+def test_only_the_sprites_that_changed_are_reported():
+    group = RenderGroup()
+    still, moving, animated, removed = (Block((x, 0), (255, 0, 0)) for x in (0, 20, 40, 60))
+    group.add(still, moving, animated, removed)
+    surface = pygame.Surface((100, 40))
+    first = group.render(surface)
+    assert group.changed_rects() == first
+
+    moving.update(5)
+    animated.image = animated.image.copy()
+    removed.kill()
+    added = Block((0, 20), (0, 255, 0))
+    group.add(added)
+    group.render(surface)
+    assert group.changed_rects() == [pygame.Rect(20, 0, 10, 10), pygame.Rect(25, 0, 10, 10),
+                                     pygame.Rect(40, 0, 10, 10), pygame.Rect(40, 0, 10, 10),
+                                     pygame.Rect(0, 20, 10, 10), pygame.Rect(60, 0, 10, 10)]
+
+    group.render(surface)
+    assert group.changed_rects() == []
+
+def test_boss_shots_are_drawn_once():
+    from shmup.entities.projectiles.boss_shot import BossShot
+    from shmup.simulation import Simulation
+
+    simulation = Simulation(0)
+    try:
+        gameplay = simulation.gameplay
+        boss = gameplay.spawn_boss()
+        boss.laser_beams.add(BossShot((100, 100)))
+        surface = pygame.Surface(cfg().game.screen_size)
+
+        # The hero, the boss, its shot and the HUD
+        assert len(gameplay.render(surface)) == 4
+        assert len(gameplay.changed_rects()) == 4
+        gameplay.render(surface)
+        assert gameplay.changed_rects() == []
+    finally:
+        simulation.release()
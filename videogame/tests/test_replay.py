@@ -0,0 +1,72 @@
+import hashlib
+import random
+
+import pygame
+import pytest
+
+from shmup.config import Config
+from shmup.random_streams import RandomStreams
+from shmup.replay import ReplayPlayer, ReplayRecorder
+
+@pytest.fixture
+def replay_path(tmp_path):
+    # Enter starts the game, then random moves and shots over uneven frame times
+    path = str(tmp_path / "session.rep")
+    script = random.Random(7)
+    recorder = ReplayRecorder(path, 1234)
+    recorder.record(16, [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, mod=0, unicode="\r")])
+    for frame in range(600):
+        events = []
+        if frame % 20 == 0:
+            key = script.choice([pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE])
+            events.append(pygame.event.Event(script.choice([pygame.KEYDOWN, pygame.KEYUP]), key=key, mod=0, unicode=""))
+        recorder.record(script.choice([15, 16, 17, 33]), events)
+    recorder.close()
+    return path
+
+@pytest.fixture
+def static_background():
+    # The video background is not bundled with the sources
+    Config.override({"game.background_mode": "static"})
+    yield
+    Config.reload()
+
+def play(path, monkeypatch):
+    """
+    Plays a replay headless and returns a hash of the display after every frame.
+    """
+    from shmup.app import App
+
+    hashes = []
+    update = pygame.display.update
+    def hashing_update(*args):
+        update(*args)
+        hashes.append(hashlib.md5(pygame.display.get_surface().get_buffer().raw).hexdigest())
+    monkeypatch.setattr(pygame.display, "update", hashing_update)
+
+    player = ReplayPlayer(path)
+    RandomStreams.get_instance().reseed(player.seed)
+    App(None, player, True).run()
+    monkeypatch.undo()
+    return hashes
+
+def test_frames_round_trip(replay_path):
+    frames = list(ReplayPlayer(replay_path).frames())
+    assert ReplayPlayer(replay_path).seed == 1234
+    assert len(frames) == 601
+    delta_time, events = frames[0]
+    assert delta_time == 16
+    assert [(event.type, event.key, event.unicode) for event in events] == [(pygame.KEYDOWN, pygame.K_RETURN, "\r")]
+
+def test_replay_rejects_other_files(tmp_path):
+    path = tmp_path / "not_a_replay.rep"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        ReplayPlayer(str(path))
+
+def test_replays_render_the_same_frames(replay_path, static_background, monkeypatch):
+    first = play(replay_path, monkeypatch)
+    second = play(replay_path, monkeypatch)
+    assert len(first) == 601
+    assert len(set(first)) > 100  # The game is running, not showing a still menu
+    assert first == second
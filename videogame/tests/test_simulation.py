@@ -0,0 +1,61 @@
+import hashlib
+import os
+import subprocess
+import sys
+
+from shmup.bench.scenario import Scenario
+from shmup.simulation import Simulation, main
+
+def session_hash(seed, ticks):
+    simulation = Simulation(seed, render=True)
+    try:
+        simulation.run(ticks)
+        return hashlib.md5(simulation.surface.get_buffer().raw).hexdigest()
+    finally:
+        simulation.release()
+
+def test_same_seed_replays_the_same_session():
+    assert session_hash(3, 900) == session_hash(3, 900)
+    assert session_hash(3, 900) != session_hash(4, 900)
+
+def test_run_counts_ticks_and_restarts_after_game_over():
+    simulation = Simulation(0)
+    try:
+        gameplay = simulation.gameplay
+        elapsed = simulation.run(10)
+        assert simulation.ticks == 10
+        assert elapsed > 0
+
+        gameplay.done = True
+        simulation.run(5)
+        assert simulation.ticks == 15
+        assert not simulation.done
+        assert gameplay.hero is not None
+    finally:
+        simulation.release()
+
+def test_main_reports_ticks_per_second(capsys):
+    main(["--ticks", "200", "--seed", "1"])
+    assert "200 ticks in" in capsys.readouterr().out
+
+def test_two_simulations_in_one_process():
+    for seed in (0, 1):
+        simulation = Simulation(seed, render=True)
+        simulation.gameplay.spawn_boss()
+        simulation.run(120)
+        simulation.release()
+
+def test_bench_runs_scenarios_back_to_back(tmp_path):
+    # A crash in native code would take the test runner down, so the bench runs in its own process
+    scenarios = {scenario.name: scenario for scenario in Scenario.bundled()}
+    assert {"enemy_wave", "boss_laser_storm"} <= set(scenarios)
+
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    scenario_dir = os.path.join(package_dir, "shmup", "bench", "scenarios")
+    completed = subprocess.run(
+        [sys.executable, "-m", "shmup.bench",
+         os.path.join(scenario_dir, "enemy_wave.json"), os.path.join(scenario_dir, "boss_laser_storm.json"),
+         "--output", str(tmp_path / "results.json"), "--baseline", str(tmp_path / "baseline.json")],
+        cwd=package_dir, capture_output=True, text=True, timeout=300)
+    assert completed.returncode == 0, completed.stderr
+    assert (tmp_path / "results.json").exists()
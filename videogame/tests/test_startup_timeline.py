@@ -0,0 +1,30 @@
+import threading
+
+from shmup.startup_timeline import NullStartupTimeline, StartupTimeline
+
+def test_report_lists_steps_in_start_order_with_their_thread(capsys):
+    timeline = StartupTimeline()
+    with timeline.span("display"):
+        pass
+    with timeline.span("background"):
+        def load():
+            with timeline.span("fonts"):
+                pass
+        worker = threading.Thread(target=load, name="startup_0")
+        worker.start()
+        worker.join()
+    timeline.finish("first frame")
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split() == ["start", "(ms)", "took", "(ms)", "thread", "step"]
+    steps = [(line.split()[2], line.split()[3]) for line in lines[1:]]
+    assert steps == [("MainThread", "display"), ("MainThread", "background"),
+                     ("startup_0", "fonts"), ("MainThread", "first")]
+    assert timeline.report() == "\n".join(lines)
+
+def test_null_timeline_records_nothing(capsys):
+    timeline = NullStartupTimeline()
+    with timeline.span("display"):
+        pass
+    timeline.finish("first frame")
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,77 @@
+import time
+
+import pygame
+import pytest
+
+from shmup.assets.asset_manager import AssetManager
+from shmup.assets.flipbook import FlipBook
+from shmup.assets.text_cache import TextCache
+from shmup.config import cfg
+from shmup.states.gameplay import GamePlay
+from shmup.states.statemanager import StateManager
+
+@pytest.fixture
+def built(monkeypatch):
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode(cfg().game.screen_size)
+    AssetManager.get_instance().clear()
+
+    # Counts the GamePlay states built
+    built = []
+    class CountedGamePlay(GamePlay):
+        def __init__(self):
+            built.append(self)
+            super().__init__()
+    monkeypatch.setitem(StateManager.STATES, "GamePlay", CountedGamePlay)
+    yield built
+
+    AssetManager.get_instance().clear()
+    TextCache.get_instance().clear()
+    FlipBook.clear()
+    pygame.quit()
+
+def start_game(state_manager):
+    state_manager.process_events(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, mod=0, unicode="\r"))
+    state_manager.update(1000 / 60)
+
+def test_states_are_built_when_first_entered(built):
+    state_manager = StateManager()
+    try:
+        assert type(state_manager.get_state()).__name__ == "Intro"
+        assert built == []
+
+        start_game(state_manager)
+        assert built == [state_manager.get_state()]
+    finally:
+        state_manager.release()
+
+def test_gameplay_assets_are_prefetched_while_the_menu_is_shown(built, monkeypatch):
+    assets = GamePlay.assets()
+    expected = {("image", (tuple(resource), transform)) for resource, transform in assets["images"]}
+    expected |= {("mask", (tuple(resource), transform)) for resource, transform in assets["masks"]}
+
+    state_manager = StateManager()
+    try:
+        state_manager.prefetch()
+        deadline = time.monotonic() + 10
+        while not expected <= {(kind, key) for kind, key, _ in AssetManager.get_instance().memory_report()}:
+            assert time.monotonic() < deadline, "the prefetch did not finish"
+            time.sleep(0.01)
+
+        # Entering the game loads nothing from disk
+        def load(path):
+            raise AssertionError(f"{path} loaded on the switch")
+        monkeypatch.setattr(pygame.image, "load", load)
+        start_game(state_manager)
+        assert built == [state_manager.get_state()]
+    finally:
+        state_manager.release()
+
+def test_nothing_is_prefetched_until_asked(built, monkeypatch):
+    preloaded = []
+    monkeypatch.setattr(AssetManager, "preload", lambda self, **assets: preloaded.append(assets))
+
+    # Releasing waits for the worker, so a load started on construction would be seen
+    StateManager().release()
+    assert preloaded == []
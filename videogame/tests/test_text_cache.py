@@ -0,0 +1,48 @@
+import pygame
+import pytest
+
+from shmup.assets.text_cache import TextCache
+from shmup.config import Config
+
+WHITE = (255, 255, 255)
+
+@pytest.fixture
+def cache():
+    Config.override({"game.text_cache_size": 3})
+    pygame.font.init()
+    cache = TextCache.get_instance()
+    cache.clear()
+    yield cache
+    cache.clear()
+    pygame.quit()
+    Config.reload()
+
+@pytest.fixture
+def font(cache):
+    return pygame.font.Font(None, 20)
+
+def test_repeated_text_is_rendered_once(cache, font):
+    surface = cache.render(font, "SCORE 10", WHITE)
+    assert cache.render(font, "SCORE 10", [255, 255, 255]) is surface
+    assert cache.render(font, "SCORE 10", WHITE, antialias=False) is not surface
+    assert cache.stats() == {"hits": 1, "misses": 2, "size": 2}
+
+def test_least_recently_used_text_is_evicted(cache, font):
+    first = cache.render(font, "A", WHITE)
+    cache.render(font, "B", WHITE)
+    cache.render(font, "C", WHITE)
+    assert cache.render(font, "A", WHITE) is first
+
+    # "B" is now the least recently used of the three
+    cache.render(font, "D", WHITE)
+    assert cache.stats()["size"] == 3
+    assert cache.render(font, "A", WHITE) is first
+    misses = cache.stats()["misses"]
+    cache.render(font, "B", WHITE)
+    assert cache.stats()["misses"] == misses + 1
+
+def test_clear_drops_surfaces_and_counters(cache, font):
+    cache.render(font, "A", WHITE)
+    cache.render(font, "A", WHITE)
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "size": 0}
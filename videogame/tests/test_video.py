@@ -0,0 +1,136 @@
+import os
+import time
+
+import numpy as np
+import pygame
+import pytest
+
+from shmup.video_background import CachedVideoBackground, PlaybackClock, VideoBackground
+from shmup.video_cache import VideoCache
+
+SIZE = (32, 24)
+FPS = 10
+
+def color(frame):
+    return (25 * frame, 100, 255 - 25 * frame)
+
+def shown(surface):
+    return tuple(surface.get_at((1, 1)))[:3]
+
+@pytest.fixture(scope="module")
+def video_path(tmp_path_factory):
+    # Ten solid frames of distinct colors, stored losslessly so the colors tell the frames apart
+    editor = pytest.importorskip("moviepy.editor")
+
+    path = str(tmp_path_factory.mktemp("video") / "colors.avi")
+    frames = [np.full((SIZE[1], SIZE[0], 3), color(frame), dtype=np.uint8) for frame in range(10)]
+    editor.ImageSequenceClip(frames, fps=FPS).write_videofile(path, codec="png", logger=None)
+    return path
+
+@pytest.fixture
+def screen():
+    pygame.display.init()
+    screen = pygame.display.set_mode(SIZE, 0, 32)
+    yield screen
+    pygame.quit()
+
+@pytest.fixture
+def clock(monkeypatch):
+    # The frame due, set by the test instead of the wall clock
+    due = [0]
+    monkeypatch.setattr(PlaybackClock, "frame_number", lambda self: due[0])
+    return due
+
+def wait_for(render, surface, expected, timeout=10):
+    deadline = time.monotonic() + timeout
+    while True:
+        render(surface)
+        if shown(surface) == expected:
+            return
+        assert time.monotonic() < deadline, f"showing {shown(surface)} instead of {expected}"
+        time.sleep(0.01)
+
+def test_stream_decodes_ahead_and_skips_to_the_clock(video_path, screen, clock):
+    background = VideoBackground(video_path, buffer_size=4, fps=FPS, display_fps=60)
+    try:
+        wait_for(background.render, screen, color(0))
+        clock[0] = 7
+        wait_for(background.render, screen, color(7))
+        # Past the end the video loops
+        clock[0] = 12
+        wait_for(background.render, screen, color(2))
+    finally:
+        background.release()
+
+def test_stream_clears_the_screen_until_the_first_frame(video_path, screen, clock, monkeypatch):
+    # A decoder that never delivers, as one still opening the video
+    monkeypatch.setattr(VideoBackground, "_VideoBackground__decode", lambda self: None)
+    background = VideoBackground(video_path, buffer_size=4, fps=FPS, display_fps=60)
+    try:
+        screen.fill((200, 10, 10))
+        background.render(screen)
+        assert shown(screen) == VideoBackground.FILL_COLOR
+    finally:
+        background.release()
+
+def test_cache_is_baked_once_for_its_source_and_screen(video_path, screen, tmp_path):
+    cache = VideoCache(video_path, str(tmp_path), SIZE, FPS)
+    assert not cache.is_valid()
+    cache.bake()
+    assert cache.frame_count == 10
+
+    frames = VideoCache(video_path, str(tmp_path), SIZE, FPS)
+    assert frames.is_valid()
+    mapped = frames.open()
+    assert mapped.shape == (10, SIZE[1], SIZE[0])
+    assert [tuple(screen.unmap_rgb(int(frame[1, 1])))[:3] for frame in mapped] == [color(frame) for frame in range(10)]
+
+    assert not VideoCache(video_path, str(tmp_path), (64, 48), FPS).is_valid()
+    assert not VideoCache(video_path, str(tmp_path), SIZE, FPS / 2).is_valid()
+    stat = os.stat(video_path)
+    os.utime(video_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert not VideoCache(video_path, str(tmp_path), SIZE, FPS).is_valid()
+
+def test_cached_background_shows_the_frame_due(video_path, screen, clock, tmp_path):
+    cache = VideoCache(video_path, str(tmp_path), SIZE, FPS)
+    cache.bake()
+    background = CachedVideoBackground(cache)
+    try:
+        for due, frame in ((0, 0), (3, 3), (9, 9), (13, 3)):
+            clock[0] = due
+            background.render(screen)
+            assert shown(screen) == color(frame)
+    finally:
+        background.release()
+
+def test_clock_counts_frames_by_wall_time(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(time, "perf_counter", lambda: now[0])
+    clock = PlaybackClock(FPS)
+    assert clock.frame_number() == 0
+    now[0] += 0.35
+    assert clock.frame_number() == 3
+    now[0] += 10
+    assert clock.frame_number() == 103
+
+def test_held_frame_is_copied_once(video_path, screen, clock, tmp_path, monkeypatch):
+    cache = VideoCache(video_path, str(tmp_path), SIZE, FPS)
+    cache.bake()
+    background = CachedVideoBackground(cache)
+
+    copies = []
+    blit_array = pygame.surfarray.blit_array
+    def counting_blit_array(surface, array):
+        copies.append(surface)
+        blit_array(surface, array)
+    monkeypatch.setattr(pygame.surfarray, "blit_array", counting_blit_array)
+
+    try:
+        # Six game frames over two video frames, as at 60 Hz over a 20 fps video
+        for due in (0, 0, 0, 1, 1, 1):
+            clock[0] = due
+            background.render(screen)
+        assert len(copies) == 2
+        assert shown(screen) == color(1)
+    finally:
+        background.release()